@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch NL -> expectation generation for many tables against the local Ollama stub
+Compares one get_expectations call per table (sequential) with generate_expectations_batch
+(bounded worker pool, shared rate limiter) and prints the wall time of both.
+
+Usage:
+    python benchmark_batch_generation.py [--tables 24] [--workers 8] [--requests-per-second 0]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+from ollama_stub_server import OllamaStubServer
+
+# Add the great_expectations directory to the path
+sys.path.insert(0, str(Path(__file__).parent / 'great_expectations'))
+
+COLUMNS = ["id", "name", "amount", "status", "created_at"]
+
+
+def batch_requests(tables):
+    """One (table, description, columns) request per synthetic table"""
+    return [(f"table_{i:03d}", f"Validate the key fields of table {i} for onboarding", COLUMNS) for i in range(tables)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batch NL -> expectation generation offline')
+    parser.add_argument('--tables', type=int, default=24, help='Tables in the batch')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent generations')
+    parser.add_argument('--requests-per-second', type=float, default=0.0, help='API rate limit (0 = unlimited)')
+    parser.add_argument('--latency', type=float, default=0.3, help='Stub seconds before the first token')
+    parser.add_argument('--tokens-per-second', type=float, default=200.0, help='Stub generation speed')
+    args = parser.parse_args()
+
+    stub = OllamaStubServer(port=0, latency=args.latency, tokens_per_second=args.tokens_per_second).start()
+    os.environ['OLLAMA_CLOUD_BASE_URL'] = stub.url
+    os.environ.setdefault('OLLAMA_API_KEY', 'stub')
+
+    from models.batch_generation import generate_expectations_batch
+    from models.ollama_model import get_expectations
+
+    requests = batch_requests(args.tables)
+    print("=" * 80)
+    print("BATCH NL -> EXPECTATION BENCHMARK (local Ollama stub)")
+    print("=" * 80)
+    print(f"{args.tables} tables, stub latency {args.latency}s, {args.tokens_per_second} tokens/s\n")
+
+    try:
+        start = time.perf_counter()
+        for _, description, columns in requests:
+            get_expectations(description, available_columns=columns, use_cache=False)
+        sequential = time.perf_counter() - start
+        print(f"  Sequential: {sequential:.2f} s")
+
+        start = time.perf_counter()
+        first, failed = None, 0
+        for result in generate_expectations_batch(requests, max_workers=args.workers,
+                                                  requests_per_second=args.requests_per_second,
+                                                  use_cache=False, use_fast_path=False):
+            first = first or time.perf_counter() - start
+            failed += result['error'] is not None
+        batched = time.perf_counter() - start
+        print(f"  Batch ({args.workers} workers): {batched:.2f} s, first table after {first:.2f} s, {failed} failed")
+        print(f"\n  Speedup: {sequential / batched:.2f}x")
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
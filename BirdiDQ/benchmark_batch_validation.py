@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark batched expectation validation
+Validates a multi-line expectation block on a synthetic DataFrame once as a single
+validation graph and once expectation by expectation, and prints both timings.
+
+Usage:
+    python benchmark_batch_validation.py [--rows 1000000]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import great_expectations as gx
+
+# Add the great_expectations directory to the path
+sys.path.insert(0, str(Path(__file__).parent / 'great_expectations'))
+
+from helpers.batch_executor import BatchExpectationExecutor, print_batch_report
+
+# Typical LLM output: several expectations sharing row count and column metrics
+EXPECTATION_BLOCK = """
+validator.expect_table_row_count_to_be_between(min_value=1)
+validator.expect_column_values_to_not_be_null(column="customer_id")
+validator.expect_column_values_to_be_between(column="amount", min_value=0, max_value=1000)
+validator.expect_column_min_to_be_between(column="amount", min_value=0)
+validator.expect_column_max_to_be_between(column="amount", max_value=1000)
+validator.expect_column_mean_to_be_between(column="amount", min_value=0, max_value=1000)
+validator.expect_column_values_to_be_in_set(column="status", value_set=["NEW", "PAID", "REFUNDED"])
+validator.expect_column_values_to_not_be_null(column="status")
+"""
+
+
+def build_dataframe(rows):
+    """Build the synthetic benchmark DataFrame"""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'id': np.arange(rows),
+        'customer_id': rng.integers(0, 5000, rows),
+        'amount': rng.uniform(0, 1000, rows).round(2),
+        'status': rng.choice(['NEW', 'PAID', 'REFUNDED'], rows),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batched expectation validation')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows in the synthetic DataFrame')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("BATCHED VALIDATION BENCHMARK")
+    print("=" * 80)
+
+    print(f"\n[1/2] Building synthetic DataFrame with {args.rows:,} rows...")
+    context = gx.get_context()
+    validator = context.sources.add_pandas("benchmark").read_dataframe(build_dataframe(args.rows))
+    print("✓ Validator ready")
+
+    print("\n[2/2] Validating expectations...")
+    lines = [line.strip() for line in EXPECTATION_BLOCK.split('\n') if line.strip()]
+    report = BatchExpectationExecutor(validator, execution_engine="Pandas").run(lines, compare_sequential=True)
+    print_batch_report(report)
+
+    sequential = sum(t.get('standalone_seconds', 0.0) for t in report['timings']['per_expectation'])
+    if report['timings']['validate_seconds']:
+        print(f"  Speedup: {sequential / report['timings']['validate_seconds']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
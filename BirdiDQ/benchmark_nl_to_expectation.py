@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark the NL -> expectation path against the local Ollama stub (no network needed)
+Runs get_expectations end to end (client, prompt, generation, cleanup) in blocking and
+streaming mode and prints latency percentiles and the time to the first expectation.
+
+Usage:
+    python benchmark_nl_to_expectation.py [--requests 20] [--latency 0.3] [--tokens-per-second 60]
+    python benchmark_nl_to_expectation.py --replay recordings.json   # recorded real responses
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from ollama_stub_server import OllamaStubServer
+
+# Add the great_expectations directory to the path
+sys.path.insert(0, str(Path(__file__).parent / 'great_expectations'))
+
+PROMPT = "transaction_id should be unique and amount should be greater than 0"
+COLUMNS = ["transaction_id", "customer_id", "amount", "status", "created_at"]
+# Typical model answer: code block followed by an explanation the streaming mode does not wait for
+RESPONSE = (
+    "```python\n"
+    "validator.expect_column_values_to_be_unique(column=\"transaction_id\")\n"
+    "validator.expect_column_values_to_be_between(column=\"amount\", min_value=0, strict_min=True)\n"
+    "```\n"
+    "The first expectation makes sure every transaction_id appears only once, which is what a primary "
+    "key requires. The second one checks that every amount is strictly positive, so refunds stored as "
+    "negative amounts will be reported as unexpected values and should be reviewed separately."
+)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(label, requests, **kwargs):
+    """Time `requests` calls of get_expectations and print a summary line"""
+    from models.ollama_model import get_expectations
+
+    totals, first = [], []
+    for _ in range(requests):
+        start = time.perf_counter()
+        first_partial = []
+        get_expectations(PROMPT, available_columns=COLUMNS, use_cache=False,
+                         on_partial=lambda code: first_partial or first_partial.append(time.perf_counter() - start),
+                         **kwargs)
+        totals.append(time.perf_counter() - start)
+        if first_partial:
+            first.append(first_partial[0])
+
+    line = (f"  {label:<12} p50 {statistics.median(totals) * 1000:>8.1f} ms  "
+            f"p95 {percentile(totals, 95) * 1000:>8.1f} ms")
+    if first:
+        line += f"  first expectation p50 {statistics.median(first) * 1000:>8.1f} ms"
+    print(line)
+    return statistics.median(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the NL -> expectation path offline')
+    parser.add_argument('--requests', type=int, default=20, help='Requests per mode')
+    parser.add_argument('--latency', type=float, default=0.3, help='Stub seconds before the first token')
+    parser.add_argument('--tokens-per-second', type=float, default=60.0, help='Stub generation speed')
+    parser.add_argument('--replay', help='Recorded responses to serve instead of the built-in answer')
+    args = parser.parse_args()
+
+    responses = None if args.replay else [{'match': '', 'response': RESPONSE}]
+    stub = OllamaStubServer(port=0, latency=args.latency, tokens_per_second=args.tokens_per_second,
+                            responses=responses, replay=args.replay).start()
+    os.environ['OLLAMA_CLOUD_BASE_URL'] = stub.url
+    os.environ.setdefault('OLLAMA_API_KEY', 'stub')
+
+    print("=" * 80)
+    print("NL -> EXPECTATION BENCHMARK (local Ollama stub)")
+    print("=" * 80)
+    print(f"Stub: {stub.url}, latency {args.latency}s, {args.tokens_per_second} tokens/s, {args.requests} requests per mode\n")
+
+    try:
+        blocking = run("blocking", args.requests)
+        streaming = run("streaming", args.requests, stream=True)
+        print(f"\n  Streaming speedup (p50): {blocking / streaming:.2f}x")
+        print(f"  Stub stats: {json.dumps(stub.stats)}")
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
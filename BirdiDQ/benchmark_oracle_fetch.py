@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Oracle read paths used by BirdiDQ
+Compares rows/sec of pandas.read_sql_query (legacy) and the oracledb array fetch path
+on a synthetic table created in the configured Oracle database.
+
+Usage:
+    python benchmark_oracle_fetch.py [--rows 1000000] [--arraysize 10000] [--keep-table]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the great_expectations directory to the path
+sys.path.insert(0, str(Path(__file__).parent / 'great_expectations'))
+
+from connecting_data.database.oracle import oracle_connection, read_oracle_tables
+
+BENCHMARK_TABLE = "BIRDIDQ_FETCH_BENCHMARK"
+
+
+def create_synthetic_table(rows):
+    """Create (or recreate) the synthetic benchmark table with `rows` rows"""
+    with oracle_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"DROP TABLE {BENCHMARK_TABLE} PURGE")
+        except Exception:
+            pass
+
+        cursor.execute(f"""
+            CREATE TABLE {BENCHMARK_TABLE} (
+                id NUMBER PRIMARY KEY,
+                customer_id NUMBER,
+                amount NUMBER(12, 2),
+                status VARCHAR2(20),
+                created_at DATE
+            )
+        """)
+
+        # Cross join two row generators so large row counts do not blow up CONNECT BY memory
+        cursor.execute(f"""
+            INSERT /*+ APPEND */ INTO {BENCHMARK_TABLE}
+            SELECT n, MOD(n, 5000), ROUND(DBMS_RANDOM.VALUE(0, 1000), 2),
+                   CASE MOD(n, 3) WHEN 0 THEN 'NEW' WHEN 1 THEN 'PAID' ELSE 'REFUNDED' END,
+                   DATE '2024-01-01' + MOD(n, 365)
+            FROM (
+                SELECT (a.lvl - 1) * 1000 + b.lvl AS n
+                FROM (SELECT LEVEL AS lvl FROM dual CONNECT BY LEVEL <= CEIL(:rows / 1000)) a
+                CROSS JOIN (SELECT LEVEL AS lvl FROM dual CONNECT BY LEVEL <= 1000) b
+            )
+            WHERE n <= :rows
+        """, rows=rows)
+        conn.commit()
+        cursor.close()
+
+
+def drop_synthetic_table():
+    """Drop the synthetic benchmark table"""
+    with oracle_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"DROP TABLE {BENCHMARK_TABLE} PURGE")
+        cursor.close()
+
+
+def time_read(label, **kwargs):
+    """Time one full table read and print rows/sec"""
+    start = time.perf_counter()
+    df = read_oracle_tables(BENCHMARK_TABLE, **kwargs)
+    elapsed = time.perf_counter() - start
+    rows_per_sec = len(df) / elapsed if elapsed else 0
+    print(f"  {label:<28} {len(df):>10,} rows  {elapsed:>8.2f} s  {rows_per_sec:>12,.0f} rows/sec")
+    return rows_per_sec
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Oracle fetch paths')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows in the synthetic table')
+    parser.add_argument('--arraysize', type=int, default=None, help='Array fetch size for the bulk path')
+    parser.add_argument('--keep-table', action='store_true', help='Do not drop the synthetic table afterwards')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("ORACLE FETCH BENCHMARK")
+    print("=" * 80)
+
+    print(f"\n[1/3] Creating synthetic table {BENCHMARK_TABLE} with {args.rows:,} rows...")
+    create_synthetic_table(args.rows)
+    print("✓ Table created")
+
+    try:
+        print("\n[2/3] Reading table...")
+        legacy = time_read("pandas.read_sql_query", bulk=False)
+        bulk = time_read("array fetch (bulk)", bulk=True, arraysize=args.arraysize)
+
+        print("\n[3/3] Summary")
+        if legacy:
+            print(f"  Speedup: {bulk / legacy:.2f}x")
+    finally:
+        if not args.keep_table:
+            drop_synthetic_table()
+            print(f"\n✓ Dropped {BENCHMARK_TABLE}")
+
+
+if __name__ == "__main__":
+    main()
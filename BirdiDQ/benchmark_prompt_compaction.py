@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark prompt compaction on a synthetic wide schema against the local Ollama stub
+Compares the generation prompt with every column listed against the compacted prompt
+(PROMPT_MAX_COLUMNS most relevant columns): prompt tokens, column recall and latency.
+
+Usage:
+    python benchmark_prompt_compaction.py [--columns 600] [--max-columns 40] [--prompt-tokens-per-second 2000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from ollama_stub_server import OllamaStubServer, tokenize
+
+# Add the great_expectations directory to the path
+sys.path.insert(0, str(Path(__file__).parent / 'great_expectations'))
+
+ENTITIES = ["customer", "order", "invoice", "product", "supplier", "shipment", "payment", "account",
+            "employee", "store", "warehouse", "campaign"]
+ATTRIBUTES = ["id", "name", "amount", "status", "created_at", "updated_at", "email", "phone", "address_line_1",
+              "country_code", "discount_pct", "tax_amount", "currency", "quantity", "unit_price", "region",
+              "category", "is_active", "score", "notes"]
+# Request -> columns it refers to
+PROMPTS = {
+    "customer_id should be unique and customer_email should not be null": ["customer_id", "customer_email"],
+    "order amount should be greater than 0": ["order_amount"],
+    "invoice status should be one of 'paid', 'open' or 'void'": ["invoice_status"],
+    "at least 95% of shipment country codes should not be null": ["shipment_country_code"],
+    "the payment discount pct must be between 0 and 100": ["payment_discount_pct"],
+    "TransactionDate should not be null and customerSegment should be unique": ["TransactionDate", "customerSegment"],
+}
+
+
+def wide_schema(size):
+    """Entity x attribute columns, padded with generic measures up to `size` columns (at least 242)"""
+    columns = [f"{entity}_{attribute}" for entity in ENTITIES for attribute in ATTRIBUTES]
+    columns += ["TransactionDate", "customerSegment"]
+    columns += [f"measure_{i:03d}" for i in range(max(0, size - len(columns)))]
+    return columns
+
+
+def prompt_tokens(prompt, columns, max_columns):
+    from models.ollama_model import EXPECTATION_SYSTEM_PROMPT
+    from models.prompt_compaction import build_columns_section
+
+    full_prompt = f"{EXPECTATION_SYSTEM_PROMPT}{build_columns_section(prompt, columns, max_columns)}\n{prompt}"
+    return len(tokenize(full_prompt))
+
+
+def run(label, columns, max_columns, requests):
+    """Time get_expectations over every benchmark prompt with the given column cap"""
+    import models.prompt_compaction as prompt_compaction
+    from models.ollama_model import get_expectations
+    from models.prompt_compaction import select_prompt_columns
+
+    prompt_compaction.PROMPT_MAX_COLUMNS = max_columns
+    latencies, selection, tokens, recall = [], [], [], []
+    for prompt, referenced in PROMPTS.items():
+        start = time.perf_counter()
+        selected = select_prompt_columns(prompt, columns, max_columns)
+        selection.append(time.perf_counter() - start)
+        recall.append(sum(column in selected for column in referenced) / len(referenced))
+        tokens.append(prompt_tokens(prompt, columns, max_columns))
+        for _ in range(requests):
+            start = time.perf_counter()
+            get_expectations(prompt, available_columns=columns, use_cache=False)
+            latencies.append(time.perf_counter() - start)
+
+    print(f"  {label:<10} prompt tokens {statistics.mean(tokens):>8.0f}  column recall {statistics.mean(recall):>6.0%}  "
+          f"selection {statistics.mean(selection) * 1000:>6.2f} ms  latency p50 {statistics.median(latencies) * 1000:>8.1f} ms")
+    return statistics.mean(tokens), statistics.median(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark prompt compaction on a wide schema')
+    parser.add_argument('--columns', type=int, default=600, help='Columns of the synthetic table')
+    parser.add_argument('--max-columns', type=int, default=40, help='Column cap of the compacted prompt')
+    parser.add_argument('--requests', type=int, default=3, help='Requests per prompt and mode')
+    parser.add_argument('--latency', type=float, default=0.1, help='Stub seconds before the first token')
+    parser.add_argument('--prompt-tokens-per-second', type=float, default=2000.0, help='Stub prompt processing speed')
+    parser.add_argument('--tokens-per-second', type=float, default=0.0, help='Stub generation speed')
+    args = parser.parse_args()
+
+    stub = OllamaStubServer(port=0, latency=args.latency, tokens_per_second=args.tokens_per_second,
+                            prompt_tokens_per_second=args.prompt_tokens_per_second).start()
+    os.environ['OLLAMA_CLOUD_BASE_URL'] = stub.url
+    os.environ.setdefault('OLLAMA_API_KEY', 'stub')
+    columns = wide_schema(args.columns)
+
+    print("=" * 80)
+    print("PROMPT COMPACTION BENCHMARK (local Ollama stub)")
+    print("=" * 80)
+    print(f"Schema: {len(columns)} columns, {len(PROMPTS)} prompts, stub {args.prompt_tokens_per_second} prompt tokens/s\n")
+
+    try:
+        full_tokens, full_latency = run("all", columns, 0, args.requests)
+        compact_tokens, compact_latency = run(f"top {args.max_columns}", columns, args.max_columns, args.requests)
+        print(f"\n  Prompt token reduction: {1 - compact_tokens / full_tokens:.0%}")
+        print(f"  Latency speedup (p50):  {full_latency / compact_latency:.2f}x")
+    finally:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
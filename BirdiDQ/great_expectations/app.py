@@ -6,8 +6,11 @@ import random
 import webbrowser
 from pathlib import Path
 from models.gpt_model import naturallanguagetoexpectation
-from models.ollama_model import get_expectations, load_ollama_client, test_ollama_connection
+from models.ollama_model import get_expectations, get_ollama_client, check_ollama_health
+from models.expectation_cache import expectation_cache_stats
+from models.rule_based_model import compile_expectations, fast_path_stats
 from helpers.utils import * 
+from helpers.data_docs_builder import wait_for_data_docs
 from connecting_data.database.postgresql import *
 from connecting_data.database.oracle import *
 from connecting_data.filesystem.pandas_filesystem import *
@@ -34,12 +37,13 @@ with open("great_expectations/ui/side.md", "r", encoding="utf-8") as sidebar_fil
 # Display the DDL for the selected table
 st.sidebar.markdown(sidebar_content, unsafe_allow_html=True)
 
-def display_data_preview(data, key_suffix=""):
+def display_data_preview(data, key_suffix="", preview_limit=None):
     """
     Display data for quick data exploration
     Params:
         data (DataFrame) : Selected table on which to run DQ checks
         key_suffix (str) : Suffix to make keys unique
+        preview_limit (int) : Row limit used when the data was loaded in bounded preview mode
     """
     try:
         # Add a unique key to avoid conflicts
@@ -48,7 +52,10 @@ def display_data_preview(data, key_suffix=""):
         # Show basic data info
         col1, col2, col3 = st.columns(3)
         with col1:
-            st.metric("Total Rows", len(data))
+            if preview_limit is not None and len(data) >= preview_limit:
+                st.metric("Preview Rows", len(data))
+            else:
+                st.metric("Total Rows", len(data))
         with col2:
             st.metric("Total Columns", len(data.columns));
         with col3:
@@ -56,6 +63,8 @@ def display_data_preview(data, key_suffix=""):
         
         # Show the data
         st.dataframe(data, width="stretch", use_container_width=True)
+        if preview_limit is not None and len(data) >= preview_limit:
+            st.caption(f"Showing the first {preview_limit} rows of the table.")
         
     except Exception as e:
         st.error(f"Unable to preview data: {str(e)}")
@@ -79,42 +88,56 @@ def perform_data_quality_checks(DQ_APP, key):
         submit_button = st.button("Submit", key=key.format(name='submit'))
         if submit_button:
             try:
-                with st.spinner('🤖 Connecting to Ollama...'):
-                    # Test Ollama connection first
-                    connection_test = test_ollama_connection()
-                    if connection_test['status'] == 'error':
-                        st.error(f"Ollama connection failed: {connection_test['error']}")
-                        st.info("Please check your .env file and ensure OLLAMA_API_KEY is set correctly.")
-                        return
-                    
-                    st.success(f"✓ Connected to Ollama (Model: {connection_test['model']})")
-                    
-                    # Load Ollama client
-                    client = load_ollama_client()
-                    
-                with st.spinner('🧠 Generating expectations from your description...'):
-                    # Get available columns from the datasource
-                    available_columns = None
-                    try:
-                        # Try to get columns from the datasource
-                        if hasattr(DQ_APP, 'get_columns'):
-                            available_columns = DQ_APP.get_columns()
-                        elif hasattr(DQ_APP, 'df') and DQ_APP.df is not None:
-                            available_columns = list(DQ_APP.df.columns)
-                    except:
-                        pass
-                    
-                    # Generate expectations using Ollama with column information
-                    nltoge = get_expectations(checks_input, client, available_columns=available_columns)
-                    
-                    if not nltoge or len(nltoge.strip()) == 0:
-                        st.error("❌ Ollama returned an empty response")
-                        st.info("Try rephrasing your query or check your Ollama configuration")
-                        return
-                    
-                    st.write("**Generated expectation code:**")
-                    st.code(nltoge, language='python')
-                    
+                # Get available columns from the datasource
+                available_columns = None
+                try:
+                    # Try to get columns from the datasource
+                    if hasattr(DQ_APP, 'get_columns'):
+                        available_columns = DQ_APP.get_columns()
+                    elif hasattr(DQ_APP, 'df') and DQ_APP.df is not None:
+                        available_columns = list(DQ_APP.df.columns)
+                except:
+                    pass
+                
+                # Common phrasings are compiled by rules, without an LLM round trip
+                nltoge = compile_expectations(checks_input, available_columns)
+                if nltoge:
+                    fast_path = fast_path_stats()
+                    st.success(f"⚡ Expectations compiled by the rule-based fast path "
+                               f"(hit ratio {fast_path['hit_ratio']:.0%})")
+                else:
+                    with st.spinner('🤖 Connecting to Ollama...'):
+                        # Cheap health probe (model list), memoized for OLLAMA_HEALTH_CHECK_TTL seconds
+                        connection_test = check_ollama_health()
+                        if connection_test['status'] == 'error':
+                            st.error(f"Ollama connection failed: {connection_test['error']}")
+                            st.info("Please check your .env file and ensure OLLAMA_API_KEY is set correctly.")
+                            return
+                        
+                        st.success(f"✓ Connected to Ollama (Model: {connection_test['model']})")
+                        
+                        # Shared Ollama client, reused across submits
+                        client = get_ollama_client()
+                        
+                    with st.spinner('🧠 Generating expectations from your description...'):
+                        # Generate expectations using Ollama with column information
+                        # Streamed: partial code is shown as soon as each expectation line is complete
+                        partial_code = st.empty()
+                        nltoge = get_expectations(checks_input, client, available_columns=available_columns, stream=True,
+                                                  on_partial=lambda code: partial_code.code(code, language='python'))
+                        partial_code.empty()
+                
+                if not nltoge or len(nltoge.strip()) == 0:
+                    st.error("❌ Ollama returned an empty response")
+                    st.info("Try rephrasing your query or check your Ollama configuration")
+                    return
+                
+                st.write("**Generated expectation code:**")
+                st.code(nltoge, language='python')
+                cache_stats = expectation_cache_stats()
+                st.caption(f"Expectation cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                           f"{cache_stats['entries']} entries")
+                
                 with st.spinner('⚡ Running expectations on your data...'):
                     # Run the expectation
                     expectation_result = DQ_APP.run_expectation(nltoge)
@@ -161,6 +184,8 @@ def open_data_docs(DQ_APP, key):
 
     open_docs_button = st.button("Open Data Docs", key=key.format(name='data_docs'))
     if open_docs_button:
+        # Finish any background Data Docs build so the site shows the latest run
+        wait_for_data_docs()
         try:
             # Try to get the dynamic URL first (if validations have been run)
             data_docs_url = DQ_APP.context.get_docs_sites_urls()[0]['site_url']
@@ -422,8 +447,8 @@ def main():
                 key = "postgresql_{name}"
                 # Display a preview of the data
                 st.subheader("Preview of the data:")
-                data = read_pg_tables(data_source)
-                display_data_preview(data, f"pg_{data_source}")
+                data = read_pg_tables(data_source, limit=PREVIEW_ROW_LIMIT)
+                display_data_preview(data, f"pg_{data_source}", preview_limit=PREVIEW_ROW_LIMIT)
         
                 DQ_APP = PostgreSQLDatasource('gx_example_db', data_source)
                 perform_data_quality_checks(DQ_APP, key)
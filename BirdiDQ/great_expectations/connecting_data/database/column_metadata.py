@@ -0,0 +1,73 @@
+"""
+Column metadata cache for database tables
+==========================================
+
+Holds the column names and types of database tables, read from the catalog
+views (information_schema.columns, ALL_TAB_COLUMNS) instead of the table data,
+and keeps them for a limited time so prompt building does not hit the database
+on every Streamlit rerun.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Seconds a table's column metadata stays valid before it is read again
+COLUMN_METADATA_TTL = float(os.environ.get('COLUMN_METADATA_TTL', 300))
+
+
+class ColumnMetadataCache():
+    """
+    Thread-safe per-table cache of column metadata with TTL invalidation
+    """
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Init class attributes
+        """
+        self.ttl = COLUMN_METADATA_TTL if ttl is None else ttl
+        self._entries: Dict[Tuple[str, str], Tuple[float, List[Dict[str, str]]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, source: str, table_name: str,
+            loader: Callable[[], List[Dict[str, str]]], refresh: bool = False) -> List[Dict[str, str]]:
+        """
+        Return the cached columns of `table_name`, calling `loader` when missing or expired
+
+        Args:
+            source: Database identifier (e.g. 'postgresql', 'oracle')
+            table_name: Table the columns belong to
+            loader: Callable returning a list of {"name": ..., "type": ...} dicts
+            refresh: Ignore any cached entry and reload
+
+        Returns:
+            List of column dicts in table order
+        """
+        key = (source, table_name)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and not refresh and now - entry[0] < self.ttl:
+                return entry[1]
+
+        # Query outside the lock so a slow database does not block other tables
+        columns = loader()
+        with self._lock:
+            self._entries[key] = (time.monotonic(), columns)
+        return columns
+
+    def invalidate(self, source: Optional[str] = None, table_name: Optional[str] = None):
+        """
+        Drop cached entries, all of them or only those matching source/table
+        """
+        with self._lock:
+            if source is None and table_name is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if (source is None or key[0] == source) and (table_name is None or key[1] == table_name):
+                    del self._entries[key]
+
+
+# Shared cache used by the PostgreSQL and Oracle helpers
+column_metadata_cache = ColumnMetadataCache()
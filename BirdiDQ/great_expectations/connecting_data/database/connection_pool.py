@@ -0,0 +1,306 @@
+"""
+Shared connection pools for the database helpers
+=================================================
+
+One pool per connection string and database type, reused by every helper in
+the process (and therefore across Streamlit reruns) instead of opening a new
+connection for each call.
+
+- PostgreSQL: idle psycopg2 connections kept in a LIFO stack, bounded by a
+  semaphore so callers wait for a free connection instead of failing
+- Oracle: oracledb session pool (ping and idle timeout handled by the driver)
+
+Callers wait at most POOL_ACQUIRE_TIMEOUT seconds for a free connection, then
+a PoolTimeoutError is raised instead of blocking forever (for example when
+abandoned streaming iterators still hold every connection).
+
+Connections idle longer than POOL_HEALTH_CHECK_INTERVAL are pinged before they
+are handed out. A background thread wakes every POOL_REAP_INTERVAL seconds and
+closes the individual connections that have been idle for POOL_IDLE_TIMEOUT,
+so an idle app does not keep connections open.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Maximum connections per pool
+POOL_MAX_SIZE = int(os.environ.get('POOL_MAX_SIZE', 5))
+# Connections opened when a pool is created
+POOL_MIN_SIZE = int(os.environ.get('POOL_MIN_SIZE', 1))
+# Seconds a pooled connection (or an Oracle session) may stay idle before it is closed
+POOL_IDLE_TIMEOUT = int(os.environ.get('POOL_IDLE_TIMEOUT', 600))
+# Seconds a connection may sit in the pool before it is pinged on checkout
+POOL_HEALTH_CHECK_INTERVAL = int(os.environ.get('POOL_HEALTH_CHECK_INTERVAL', 30))
+# Seconds a caller waits for a free connection before PoolTimeoutError is raised
+POOL_ACQUIRE_TIMEOUT = float(os.environ.get('POOL_ACQUIRE_TIMEOUT', 60))
+# Seconds between two passes of the background thread closing idle connections
+POOL_REAP_INTERVAL = float(os.environ.get('POOL_REAP_INTERVAL', 60))
+
+
+class PoolTimeoutError(TimeoutError):
+    """
+    Raised when no pooled connection became free within the acquire timeout
+    """
+    pass
+
+
+@lru_cache(maxsize=None)
+def _postgres_dsn(connection_string: str) -> str:
+    """Convert a SQLAlchemy connection string to psycopg2 format"""
+    return connection_string.replace('postgresql+psycopg2://', 'postgresql://')
+
+
+class _IdleConnection():
+    """
+    A connection waiting in the pool and the time it was returned
+    """
+    __slots__ = ('conn', 'returned_at')
+
+    def __init__(self, conn, returned_at: Optional[float]):
+        self.conn = conn
+        # None for freshly opened connections, which are trusted without a round trip
+        self.returned_at = returned_at
+
+
+class _PostgresPool():
+    """
+    psycopg2 connection pool with bounded, timed checkout, health checks and idle reaping
+    """
+    def __init__(self, connection_string, min_size, max_size, health_check_interval, acquire_timeout):
+        import psycopg2
+
+        self._connect = lambda: psycopg2.connect(_postgres_dsn(connection_string))
+        self.slots = threading.BoundedSemaphore(max_size)
+        self.max_size = max_size
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+        self._lock = threading.Lock()
+        self._idle: List[_IdleConnection] = [_IdleConnection(self._connect(), None) for _ in range(min_size)]
+
+    def _is_healthy(self, idle: _IdleConnection) -> bool:
+        conn = idle.conn
+        if conn.closed:
+            return False
+        # Freshly opened connections and recently returned ones are trusted without a round trip
+        if idle.returned_at is None or time.monotonic() - idle.returned_at < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        if not self.slots.acquire(timeout=self.acquire_timeout):
+            raise PoolTimeoutError(
+                f"No PostgreSQL connection became free within {self.acquire_timeout:g}s "
+                f"(all {self.max_size} are in use, close unfinished read_pg_tables(chunksize=...) iterators)"
+            )
+        try:
+            while True:
+                with self._lock:
+                    # Most recently returned first, so the oldest idle connections age out
+                    idle = self._idle.pop() if self._idle else None
+                if idle is None:
+                    return self._connect()
+                if self._is_healthy(idle):
+                    return idle.conn
+                self._close(idle.conn)
+        except Exception:
+            self.slots.release()
+            raise
+
+    def release(self, conn):
+        try:
+            # End any open transaction (named cursors run inside one) before reuse
+            if not conn.closed:
+                conn.rollback()
+            if conn.closed:
+                return
+            with self._lock:
+                self._idle.append(_IdleConnection(conn, time.monotonic()))
+        except Exception:
+            self._close(conn)
+        finally:
+            self.slots.release()
+
+    def reap_idle(self, idle_timeout):
+        """
+        Close the connections that have been idle for idle_timeout seconds
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [idle for idle in self._idle
+                       if idle.returned_at is not None and now - idle.returned_at > idle_timeout]
+            self._idle = [idle for idle in self._idle if idle not in expired]
+        for idle in expired:
+            self._close(idle.conn)
+        return len(expired)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for item in idle:
+            self._close(item.conn)
+
+
+class _OraclePool():
+    """
+    oracledb session pool, the driver pings idle sessions and closes expired ones
+    """
+    def __init__(self, connection_string, min_size, max_size, health_check_interval, idle_timeout, acquire_timeout):
+        import oracledb
+        from connecting_data.database.oracle import _oracle_connect_params
+
+        self.pool = oracledb.create_pool(
+            **_oracle_connect_params(connection_string),
+            min=min_size,
+            max=max_size,
+            increment=1,
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT,
+            wait_timeout=int(acquire_timeout * 1000),
+            ping_interval=health_check_interval,
+            timeout=idle_timeout,
+        )
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+
+    def acquire(self):
+        import oracledb
+
+        try:
+            return self.pool.acquire()
+        except oracledb.Error as e:
+            # Pool exhausted within wait_timeout (DPY-4005 / ORA-24459)
+            if 'DPY-4005' in str(e) or 'ORA-24459' in str(e):
+                raise PoolTimeoutError(
+                    f"No Oracle connection became free within {self.acquire_timeout:g}s "
+                    f"(all {self.max_size} are in use)"
+                ) from e
+            raise
+
+    def release(self, conn):
+        self.pool.release(conn)
+
+    def reap_idle(self, idle_timeout):
+        # Idle sessions are closed by the driver (timeout=idle_timeout)
+        return 0
+
+    def close(self):
+        self.pool.close(force=True)
+
+
+class ConnectionPoolManager():
+    """
+    Process-wide registry of connection pools keyed by database type and connection string
+    """
+    def __init__(self, max_size=None, min_size=None, idle_timeout=None, health_check_interval=None,
+                 acquire_timeout=None, reap_interval=None):
+        """
+        Init class attributes
+        """
+        self.max_size = max_size or POOL_MAX_SIZE
+        self.min_size = min(min_size if min_size is not None else POOL_MIN_SIZE, self.max_size)
+        self.idle_timeout = idle_timeout if idle_timeout is not None else POOL_IDLE_TIMEOUT
+        self.health_check_interval = health_check_interval if health_check_interval is not None else POOL_HEALTH_CHECK_INTERVAL
+        self.acquire_timeout = acquire_timeout if acquire_timeout is not None else POOL_ACQUIRE_TIMEOUT
+        self.reap_interval = reap_interval if reap_interval is not None else POOL_REAP_INTERVAL
+        self._pools: Dict[Tuple[str, str], object] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._stop_reaper = threading.Event()
+
+    def _create_pool(self, kind, connection_string):
+        if kind == 'postgresql':
+            return _PostgresPool(connection_string, self.min_size, self.max_size,
+                                 self.health_check_interval, self.acquire_timeout)
+        if kind == 'oracle':
+            return _OraclePool(connection_string, self.min_size, self.max_size,
+                               self.health_check_interval, self.idle_timeout, self.acquire_timeout)
+        raise ValueError(f"Unknown database type: {kind}")
+
+    def _get_pool(self, kind, connection_string):
+        if not connection_string:
+            raise ValueError(f"No connection string configured for {kind}")
+        key = (kind, connection_string)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._create_pool(kind, connection_string)
+                self._pools[key] = pool
+                self._start_reaper()
+        return pool
+
+    def _start_reaper(self):
+        """Start the background idle reaper with the first pool (called with _lock held)"""
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._stop_reaper.clear()
+        self._reaper = threading.Thread(target=self._reap_loop, name='connection-pool-reaper', daemon=True)
+        self._reaper.start()
+
+    def _reap_loop(self):
+        while not self._stop_reaper.wait(self.reap_interval):
+            self.reap_idle()
+
+    @contextmanager
+    def connection(self, kind, connection_string):
+        """
+        Borrow a pooled connection, returned to the pool when the block exits
+        Raises PoolTimeoutError when no connection is free within acquire_timeout seconds
+
+        Args:
+            kind: 'postgresql' or 'oracle'
+            connection_string: SQLAlchemy style connection string the pool is keyed by
+        """
+        pool = self._get_pool(kind, connection_string)
+        conn = pool.acquire()
+        try:
+            yield conn
+        finally:
+            pool.release(conn)
+
+    def reap_idle(self):
+        """
+        Close pooled connections that have been idle for idle_timeout seconds
+
+        Returns:
+            Number of connections closed
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+        closed = 0
+        for pool in pools:
+            try:
+                closed += pool.reap_idle(self.idle_timeout)
+            except Exception as e:
+                print(f"Error closing idle pooled connections: {e}")
+        return closed
+
+    def close_all(self):
+        """
+        Close every pool and stop the idle reaper
+        """
+        self._stop_reaper.set()
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+
+# Shared pool manager used by the PostgreSQL and Oracle helpers
+pool_manager = ConnectionPoolManager()
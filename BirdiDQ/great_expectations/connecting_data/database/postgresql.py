@@ -14,6 +14,12 @@ from pathlib import Path
 # Import code display enhancer
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from helpers.code_display_enhancer import enhance_expectation_with_code 
+from helpers.context_registry import get_context, refresh_context, context_lock, with_context_lock
+from helpers.validation_results import single_pass_enabled, map_checkpoint_results
+from helpers.batch_executor import BatchExpectationExecutor, print_batch_report
+from helpers.data_docs_builder import build_data_docs_for_run
+from connecting_data.database.column_metadata import column_metadata_cache
+from connecting_data.database.connection_pool import pool_manager
 
 from pathlib import Path
 
@@ -25,20 +31,108 @@ load_dotenv(env_path)
 # Get your postgresql connection string from the environment variable
 POSTGRES_CONNECTION_STRING = os.environ.get('POSTGRES_CONNECTION_STRING')
 
-def read_pg_tables(table_name):
+# Rows fetched per round trip by the server-side cursor used for streaming reads
+PG_FETCH_SIZE = int(os.environ.get('PG_FETCH_SIZE', 10000))
+
+# Number of rows loaded for the table preview shown in the app
+PREVIEW_ROW_LIMIT = int(os.environ.get('PREVIEW_ROW_LIMIT', 1000))
+
+def pg_connection():
+    """
+    Borrow a connection from the shared PostgreSQL pool for POSTGRES_CONNECTION_STRING
+    Use as a context manager, the connection goes back to the pool when the block exits
+    """
+    return pool_manager.connection('postgresql', POSTGRES_CONNECTION_STRING)
+
+class PgTableChunks():
+    """
+    Iterator of dataframe chunks that returns its pooled connection when exhausted or closed
+    Use as a context manager so a partly consumed iterator does not keep the connection checked out:
+        with read_pg_tables(table_name, chunksize=10000) as chunks:
+            for chunk in chunks: ...
+    """
+    def __init__(self, chunks):
+        """
+        Init class attributes
+        """
+        self._chunks = chunks
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._chunks)
+
+    def close(self):
+        """
+        Stop streaming, close the server-side cursor and return the connection to the pool
+        """
+        self._chunks.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+def _pg_table_chunks(table_name, chunksize=None, limit=None):
+    """Generator behind iter_pg_table_chunks, the connection is borrowed on the first chunk"""
+    chunksize = chunksize or PG_FETCH_SIZE
+    with pg_connection() as conn:
+        query = f'SELECT * FROM {table_name}'
+        params = None
+        if limit is not None:
+            query += ' LIMIT %s'
+            params = (limit,)
+
+        # Named cursors are only valid inside a transaction, which psycopg2 opens implicitly
+        with conn.cursor(name=f"birdidq_stream_{table_name}") as cursor:
+            cursor.itersize = chunksize
+            cursor.execute(query, params)
+
+            # Column names are only known once the first rows have been fetched
+            rows = cursor.fetchmany(chunksize)
+            columns = [desc[0] for desc in cursor.description]
+            if not rows:
+                yield pd.DataFrame(columns=columns)
+                return
+            while rows:
+                yield pd.DataFrame.from_records(rows, columns=columns)
+                rows = cursor.fetchmany(chunksize)
+
+def iter_pg_table_chunks(table_name, chunksize=None, limit=None):
+    """
+    Stream a postgresql table as pandas dataframe chunks
+    Uses a named (server-side) cursor so only `chunksize` rows are held in memory at a time
+    Params:
+        table_name (str) : Table to read
+        chunksize (int) : Rows per yielded dataframe (defaults to PG_FETCH_SIZE)
+        limit (int) : Optional maximum number of rows to read
+    Returns a PgTableChunks, which holds a pooled connection from the first chunk until it is
+    exhausted or closed (use it as a context manager)
+    """
+    return PgTableChunks(_pg_table_chunks(table_name, chunksize=chunksize, limit=limit))
+
+def read_pg_tables(table_name, limit=None, chunksize=None):
     """
     Read postgresql table in pandas dataframe
+    Params:
+        table_name (str) : Table to read
+        limit (int) : Bounded preview mode, only fetch the first `limit` rows
+        chunksize (int) : Return a PgTableChunks iterator of dataframe chunks instead of a single dataframe
+                          (use it as a context manager, see PgTableChunks)
     """
-    # Use psycopg2 connection directly (same approach as get_pg_tables)
-    # to avoid 'Engine' object has no attribute 'cursor' error
-    conn_str = POSTGRES_CONNECTION_STRING.replace('postgresql+psycopg2://', 'postgresql://')
-    conn = psycopg2.connect(conn_str)
-    
-    query = f'SELECT * FROM {table_name}'
-    df = pd.read_sql(query, conn)
-    
-    conn.close()
-    return df
+    if chunksize is not None:
+        return iter_pg_table_chunks(table_name, chunksize=chunksize, limit=limit)
+
+    with iter_pg_table_chunks(table_name, limit=limit) as chunk_iter:
+        chunks = list(chunk_iter)
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
 
 def get_pg_tables():
     """
@@ -48,20 +142,16 @@ def get_pg_tables():
         if not POSTGRES_CONNECTION_STRING:
             raise ValueError("POSTGRES_CONNECTION_STRING is not set in environment variables")
         
-        # Convert SQLAlchemy connection string to psycopg2 format
-        conn_str = POSTGRES_CONNECTION_STRING.replace('postgresql+psycopg2://', 'postgresql://')
-        
-        # Use psycopg2 directly to avoid Engine object issues
-        conn = psycopg2.connect(conn_str)
-        cursor = conn.cursor()
+        # Use pooled psycopg2 connections directly to avoid Engine object issues
+        with pg_connection() as conn:
+            cursor = conn.cursor()
 
-        query = "SELECT table_name FROM information_schema.tables WHERE table_schema='public' AND table_type='BASE TABLE';"
-        cursor.execute(query)
+            query = "SELECT table_name FROM information_schema.tables WHERE table_schema='public' AND table_type='BASE TABLE';"
+            cursor.execute(query)
 
-        tables = cursor.fetchall()
-        tables = [t[0] for t in tables]
-        cursor.close()
-        conn.close()
+            tables = cursor.fetchall()
+            tables = [t[0] for t in tables]
+            cursor.close()
         return tables
     except Exception as e:
         print(f"Error in get_pg_tables: {type(e).__name__}: {e}")
@@ -69,6 +159,32 @@ def get_pg_tables():
         traceback.print_exc()
         raise
 
+def get_pg_columns(table_name, refresh=False):
+    """
+    List the columns of a PostgreSQL table from information_schema (no table data is read)
+    Results are cached per table, see column_metadata.COLUMN_METADATA_TTL
+    Returns:
+        list: [{"name": column_name, "type": data_type}, ...] in table order
+    """
+    def load_columns():
+        if '.' in table_name:
+            schema, table = table_name.split('.', 1)
+        else:
+            schema, table = 'public', table_name
+
+        with pg_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT column_name, data_type FROM information_schema.columns "
+                "WHERE table_schema = %s AND table_name = %s ORDER BY ordinal_position;",
+                (schema, table)
+            )
+            columns = [{'name': name, 'type': data_type} for name, data_type in cursor.fetchall()]
+            cursor.close()
+        return columns
+
+    return column_metadata_cache.get('postgresql', table_name, load_columns, refresh=refresh)
+
 def postgresql_data_owners():
     """
     Map each postgresql with its data owner
@@ -84,18 +200,23 @@ class PostgreSQLDatasource():
     """
     Run Data Quality checks on PostgreSQL data database using Fluent API
     """
-    def __init__(self, database, asset_name):
+    def __init__(self, database, asset_name, single_pass=None):
         """ 
         Init class attributes
+        Params:
+            single_pass (bool) : Add expectations without interactive evaluation and validate them
+                                 once through the checkpoint (defaults to SINGLE_PASS_VALIDATION)
         """
         self.database = database
         self.asset_name = asset_name
         self.table_name = asset_name  # Use asset_name as table_name
         self.expectation_suite_name = f"{asset_name}_expectation_suite"
         self.checkpoint_name = f"{asset_name}_checkpoint"
-        self.context = ge.get_context()
+        self.context = get_context()
         self.datasource_name = f"postgres_sql_{asset_name}"
+        self.single_pass = single_pass_enabled(single_pass)
 
+    @with_context_lock
     def add_or_update_datasource(self):
         """
         Create PostgreSQL datasource using Fluent API with SQL execution engine
@@ -127,6 +248,8 @@ class PostgreSQLDatasource():
                     name=self.asset_name,
                     table_name=self.table_name
                 )
+                # The new datasource/asset was written to great_expectations.yml by this context
+                refresh_context(self.context)
                 
         except Exception as e:
             print(f"Error in add_or_update_datasource: {e}")
@@ -138,6 +261,7 @@ class PostgreSQLDatasource():
         """
         return self.data_asset.build_batch_request()
 
+    @with_context_lock
     def get_validator(self):
         """
         Retrieve a validator object using Fluent API with SQL execution engine
@@ -182,67 +306,26 @@ class PostgreSQLDatasource():
             expectation_lines = [line.strip() for line in expectation.split('\n') if line.strip()]
             print(f"Parsed into {len(expectation_lines)} lines")
             
-            # Set up clean execution environment (like in test script)
-            execution_env = {"validator": validator}
-            
-            results = []
-            for idx, line in enumerate(expectation_lines, 1):
-                if not line or line.startswith('#'):
-                    print(f"Line {idx}: Skipping (empty or comment)")
-                    continue
-                
-                print(f"\nLine {idx}: Attempting to execute:")
-                print(f"  '{line}'")
-                
-                try:
-                    # Enhance expectation with code display metadata for Data Docs
-                    # This returns the expectation line with meta parameter added
-                    enhanced_line, meta_dict = enhance_expectation_with_code(line, execution_engine="PostgreSQL (SQL)", return_meta=True)
-                    
-                    # Add meta dict to execution environment so it's available when exec runs
-                    if meta_dict:
-                        execution_env['_expectation_meta'] = meta_dict
-                        # Replace the meta placeholder with the actual dict from environment
-                        enhanced_line = enhanced_line.replace('meta={...}', 'meta=_expectation_meta')
-                    
-                    # Execute enhanced expectation
-                    # Let GX handle validation naturally (like in working test script)
-                    exec(f"result = {enhanced_line}", execution_env)
-                    result = execution_env.get("result")
-                    
-                    if result:
-                        results.append(result)
-                        print(f"  ✓ SUCCESS: Expectation executed and added to suite")
-                        if hasattr(result, 'success'):
-                            print(f"    Validation result: {result.success}")
-                    else:
-                        print(f"  ✗ FAILED: No result returned")
-                    
-                except Exception as e:
-                    print(f"  ✗ FAILED during execution: {line}")
-                    print(f"    Error type: {type(e).__name__}")
-                    print(f"    Error message: {str(e)[:200]}")
-                    
-                    # For metric errors, just skip - the expectation wasn't added
-                    print(f"    Skipping this expectation - it cannot be validated with current engine")
-                    continue
-            
-            print(f"\n{'='*60}")
-            print(f"EXECUTION SUMMARY:")
-            print(f"  Lines processed: {len(expectation_lines)}")
-            print(f"  Successful: {len(results)}")
-            print(f"  Failed: {len(expectation_lines) - len(results)}")
-            print(f"{'='*60}\n")
+            # Parse every line first, then resolve all metrics in one validation graph
+            # In single-pass mode expectations are only recorded, the checkpoint computes the metrics
+            # Column arguments are checked against the table's columns before anything runs
+            executor = BatchExpectationExecutor(validator, execution_engine="PostgreSQL (SQL)", columns=self.get_columns())
+            report = executor.run(expectation_lines, evaluate=not self.single_pass)
+            print_batch_report(report)
+            results = report['results']
             
             # Save the expectation suite with all expectations
-            validator.save_expectation_suite(discard_failed_expectations=False)
+            with context_lock(self.context):
+                validator.save_expectation_suite(discard_failed_expectations=False)
             
             # Verify expectations were saved
             saved_suite = self.context.get_expectation_suite(self.expectation_suite_name)
             print(f"Suite '{self.expectation_suite_name}' now has {len(saved_suite.expectations)} expectations")
             
             # Run checkpoint to validate and generate docs
-            self.run_ge_checkpoint(batch_request)
+            checkpoint_result = self.run_ge_checkpoint(batch_request)
+            if self.single_pass:
+                results = map_checkpoint_results(checkpoint_result, results)
             
             # Return the last result or raise informative error
             if results:
@@ -275,6 +358,7 @@ class PostgreSQLDatasource():
         self.context.test_yaml_config(yaml.dump(checkpoint_config))
         self.context.add_or_update_checkpoint(**checkpoint_config)
 
+    @with_context_lock
     def run_ge_checkpoint(self, batch_request):
         """
         Run GE checkpoint to validate expectations and generate Data Docs with results
@@ -298,15 +382,15 @@ class PostgreSQLDatasource():
             print(f"✓ Checkpoint executed: {checkpoint_result.success}")
             print(f"✓ Validation results saved to Data Docs")
             
-            # Build data docs to show results
-            self.context.build_data_docs()
+            # Render only the pages of this run (and the index)
+            build_data_docs_for_run(self.context, checkpoint_result, [self.expectation_suite_name])
             
             return checkpoint_result
             
         except Exception as e:
             print(f"Warning: Checkpoint execution failed: {e}")
             # If checkpoint fails, still build docs with just expectations (no validation results)
-            self.context.build_data_docs()
+            build_data_docs_for_run(self.context, expectation_suite_names=[self.expectation_suite_name])
             
             # Return a mock checkpoint result
             return type('obj', (object,), {
@@ -319,12 +403,12 @@ class PostgreSQLDatasource():
         Get column names from the PostgreSQL table
         """
         try:
-            df = read_pg_tables(self.table_name)
-            return list(df.columns)
+            return [column['name'] for column in get_pg_columns(self.table_name)]
         except Exception as e:
             print(f"Error getting columns: {e}")
             return []
     
+    @with_context_lock
     def run_data_assistant(self, assistant_type='onboarding'):
         """
         Run Great Expectations Data Assistant for automatic profiling
@@ -398,6 +482,7 @@ class PostgreSQLDatasource():
                 "run_name_template": "%Y%m%d-%H%M%S",
             }
             
+            checkpoint_result = None
             try:
                 self.context.add_or_update_checkpoint(**checkpoint_config)
                 
@@ -420,8 +505,8 @@ class PostgreSQLDatasource():
                 print(f"Warning: Could not run checkpoint: {e}")
                 # If checkpoint fails, still build docs
             
-            # Build data docs to show results
-            self.context.build_data_docs()
+            # Build data docs to show results (only the pages of this run and the index)
+            build_data_docs_for_run(self.context, checkpoint_result, [f"{assistant_suite_name}_final"])
             
             return result
             
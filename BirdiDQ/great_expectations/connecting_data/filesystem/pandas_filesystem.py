@@ -6,12 +6,20 @@ from ruamel import yaml
 import ruamel
 import pandas as pd
 from pathlib import Path
+import sys
+
+# Import shared DataContext registry
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from helpers.context_registry import get_context, refresh_context, context_lock, with_context_lock
+from helpers.validation_results import single_pass_enabled, map_checkpoint_results
+from helpers.batch_executor import BatchExpectationExecutor, print_batch_report
+from helpers.data_docs_builder import build_data_docs_for_run
 
 class PandasFilesystemDatasource():
     """
     Run Data Quality checks on Local Filesystem data
     """
-    def __init__(self, datasource_name, dataframe, filename=None):
+    def __init__(self, datasource_name, dataframe, filename=None, single_pass=None):
         """ 
         Init class attributes
         
@@ -19,6 +27,8 @@ class PandasFilesystemDatasource():
             datasource_name (str): The name identifier for the datasource (e.g., "Customers")
             dataframe (pd.DataFrame): The pandas DataFrame containing the data
             filename (str, optional): The actual CSV filename (e.g., "customers.csv")
+            single_pass (bool, optional): Add expectations without interactive evaluation and validate
+                                          them once through the checkpoint (defaults to SINGLE_PASS_VALIDATION)
         """
         self.datasource_name = datasource_name
         self.filename = filename or f"{datasource_name}.csv"
@@ -26,9 +36,10 @@ class PandasFilesystemDatasource():
         self.checkpoint_name = f"{datasource_name}_checkpoint"
         self.dataframe = dataframe
         self.partition_date = datetime.datetime.now()
+        self.single_pass = single_pass_enabled(single_pass)
         # Use explicit context directory to match where app.py expects data docs
         context_root_dir = Path("gx")
-        self.context = ge.get_context(context_root_dir=str(context_root_dir))
+        self.context = get_context(context_root_dir=str(context_root_dir))
     
     @property
     def table_name(self):
@@ -47,6 +58,7 @@ class PandasFilesystemDatasource():
         """Get list of column names from the DataFrame (same as Oracle connector)"""
         return list(self.dataframe.columns)
 
+    @with_context_lock
     def add_or_update_datasource(self):
         """
         Create data source using Fluent API (consistent with Oracle/PostgreSQL)
@@ -72,6 +84,8 @@ class PandasFilesystemDatasource():
                 # Create dataframe asset (same as Oracle)
                 self.data_asset = self.data_source.add_dataframe_asset(name=self.datasource_name)
                 print(f"Created new asset: {self.datasource_name}")
+                # The new datasource/asset was written to great_expectations.yml by this context
+                refresh_context(self.context)
                 
             return self.data_source, self.data_asset
             
@@ -86,6 +100,7 @@ class PandasFilesystemDatasource():
         # Build batch request with the DataFrame
         return self.data_asset.build_batch_request(dataframe=self.dataframe)
     
+    @with_context_lock
     def get_validator(self):
         """
         Retrieve a validator object using Fluent API (consistent with Oracle/PostgreSQL)
@@ -130,57 +145,26 @@ class PandasFilesystemDatasource():
             expectation_lines = [line.strip() for line in expectation.split('\n') if line.strip()]
             print(f"Parsed into {len(expectation_lines)} lines")
             
-            # Set up clean execution environment (same as Oracle)
-            execution_env = {"validator": validator}
-            
-            results = []
-            for idx, line in enumerate(expectation_lines, 1):
-                if not line or line.startswith('#'):
-                    print(f"Line {idx}: Skipping (empty or comment)")
-                    continue
-                
-                print(f"\nLine {idx}: Attempting to execute:")
-                print(f"  '{line}'")
-                
-                try:
-                    # Execute expectation directly (same as Oracle)
-                    # The line already contains "validator.expect_..." so we execute it as-is
-                    exec(f"result = {line}", execution_env)
-                    result = execution_env.get("result")
-                    
-                    if result:
-                        results.append(result)
-                        print(f"  ✓ SUCCESS: Expectation executed and added to suite")
-                        if hasattr(result, 'success'):
-                            print(f"    Validation result: {result.success}")
-                    else:
-                        print(f"  ✗ FAILED: No result returned")
-                    
-                except Exception as e:
-                    print(f"  ✗ FAILED during execution: {line}")
-                    print(f"    Error type: {type(e).__name__}")
-                    print(f"    Error message: {str(e)[:200]}")
-                    
-                    # For metric errors, just skip - the expectation wasn't added
-                    print(f"    Skipping this expectation - it cannot be validated with current engine")
-                    continue
-            
-            print(f"\n{'='*60}")
-            print(f"EXECUTION SUMMARY:")
-            print(f"  Lines processed: {len(expectation_lines)}")
-            print(f"  Successful: {len(results)}")
-            print(f"  Failed: {len(expectation_lines) - len(results)}")
-            print(f"{'='*60}\n")
+            # Parse every line first, then resolve all metrics in one validation graph (same as Oracle)
+            # In single-pass mode expectations are only recorded, the checkpoint computes the metrics
+            # Column arguments are checked against the table's columns before anything runs
+            executor = BatchExpectationExecutor(validator, execution_engine="Pandas (Filesystem)", columns=self.get_columns())
+            report = executor.run(expectation_lines, evaluate=not self.single_pass)
+            print_batch_report(report)
+            results = report['results']
             
             # Save the expectation suite with all expectations
-            validator.save_expectation_suite(discard_failed_expectations=False)
+            with context_lock(self.context):
+                validator.save_expectation_suite(discard_failed_expectations=False)
             
             # Verify expectations were saved
             saved_suite = self.context.get_expectation_suite(self.expectation_suite_name)
             print(f"Suite '{self.expectation_suite_name}' now has {len(saved_suite.expectations)} expectations")
             
             # Run checkpoint
-            self.run_ge_checkpoint(batch_request)
+            checkpoint_result = self.run_ge_checkpoint(batch_request)
+            if self.single_pass:
+                results = map_checkpoint_results(checkpoint_result, results)
             
             return results[0] if results else None
             
@@ -200,6 +184,7 @@ class PandasFilesystemDatasource():
         self.context.test_yaml_config(yaml.dump(checkpoint_config))
         self.context.add_or_update_checkpoint(**checkpoint_config)
 
+    @with_context_lock
     def run_ge_checkpoint(self, batch_request):
         """
         Run GE checkpoint to validate expectations and generate Data Docs with results
@@ -223,15 +208,15 @@ class PandasFilesystemDatasource():
             print(f"✓ Checkpoint executed: {checkpoint_result.success}")
             print(f"✓ Validation results saved to Data Docs")
             
-            # Build data docs to show results
-            self.context.build_data_docs()
+            # Render only the pages of this run (and the index)
+            build_data_docs_for_run(self.context, checkpoint_result, [self.expectation_suite_name])
             
             return checkpoint_result
             
         except Exception as e:
             print(f"Warning: Checkpoint execution failed: {e}")
             # If checkpoint fails, still build docs with just expectations (no validation results)
-            self.context.build_data_docs()
+            build_data_docs_for_run(self.context, expectation_suite_names=[self.expectation_suite_name])
             
             # Return a mock checkpoint result
             return type('obj', (object,), {
@@ -239,6 +224,7 @@ class PandasFilesystemDatasource():
                 'run_results': {}
             })()
 
+    @with_context_lock
     def run_data_assistant(self, assistant_type="onboarding"):
         """
         Run Great Expectations Data Assistant for automatic profiling (Fluent API)
@@ -329,6 +315,7 @@ class PandasFilesystemDatasource():
                 "run_name_template": "%Y%m%d-%H%M%S",
             }
             
+            checkpoint_result = None
             try:
                 self.context.add_or_update_checkpoint(**checkpoint_config)
                 
@@ -351,8 +338,8 @@ class PandasFilesystemDatasource():
                 print(f"Warning: Could not run checkpoint: {e}")
                 # If checkpoint fails, still build docs
             
-            # Build data docs to show results
-            self.context.build_data_docs()
+            # Build data docs to show results (only the pages of this run and the index)
+            build_data_docs_for_run(self.context, checkpoint_result, [f"{assistant_suite_name}_final"])
             
             print(f"✓ Data Assistant '{assistant_type}' completed successfully")
             print(f"✓ Data Docs updated with new expectations")
@@ -0,0 +1,203 @@
+"""
+Batched Expectation Executor
+============================
+
+Runs all expectation lines generated for one table as a single batch: every
+line is parsed (see expectation_parser) into an ExpectationConfiguration
+first, then all of them are validated with one call to
+validator.graph_validate, so metrics shared by
+several expectations (row count, column nulls, column min/max, ...) are only
+computed once per batch instead of once per line.
+
+When the table's columns are known, column arguments are checked against
+them first (see column_resolver): near-miss names are corrected and lines
+naming unknown columns are rejected without running any metric.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_validation_result import ExpectationValidationResult
+
+from helpers.code_display_enhancer import build_code_display_meta
+from helpers.column_resolver import get_column_resolver
+from helpers.expectation_parser import parse_expectation
+from helpers.validation_results import expectation_key
+
+
+def _exception_details(exception_info) -> Optional[Dict[str, Any]]:
+    """
+    Read the error of a validation result, None when the expectation was evaluated
+
+    graph_validate reports errors raised while building the validation graph at the top level
+    ({"raised_exception": True, "exception_message": ...}) but metric failures per metric
+    ({metric_id: {"raised_exception": True, ...}}), both shapes are handled here.
+    """
+    if not exception_info:
+        return None
+    if 'raised_exception' in exception_info:
+        candidates = [exception_info]
+    else:
+        candidates = list(exception_info.values())
+    for info in candidates:
+        # Per-metric entries may be ExceptionInfo objects instead of dicts
+        if not isinstance(info, dict):
+            info = info.to_json_dict() if hasattr(info, 'to_json_dict') else vars(info)
+        if info.get('raised_exception'):
+            return {
+                'error': info.get('exception_message') or 'Exception raised while validating',
+                'traceback': info.get('exception_traceback'),
+            }
+    return None
+
+
+class BatchExpectationExecutor():
+    """
+    Parse expectation lines up front and resolve their metrics in one validation graph
+    """
+    def __init__(self, validator, execution_engine: str = "SQL", columns: Optional[Sequence[str]] = None):
+        """
+        Init class attributes
+
+        Args:
+            validator: GX validator the expectations run against
+            execution_engine: Engine label shown in the Data Docs code display
+            columns: Column names of the data asset, column arguments are resolved against them (optional)
+        """
+        self.validator = validator
+        self.execution_engine = execution_engine
+        self.column_resolver = get_column_resolver(columns)
+        self.column_rewrites: List[Dict[str, str]] = []
+
+    def parse_line(self, line: str) -> ExpectationConfiguration:
+        """
+        Turn one `validator.expect_*(...)` line into an ExpectationConfiguration with code display meta
+        """
+        parsed = parse_expectation(line)
+        if self.column_resolver is not None:
+            parsed, rewrites = self.column_resolver.resolve_expectation(parsed)
+            self.column_rewrites.extend({'line': line, **rewrite} for rewrite in rewrites)
+        meta = build_code_display_meta(parsed.line, self.execution_engine, info=parsed.display_info())
+        return parsed.to_configuration(meta)
+
+    def run(self, expectation_lines: List[str], evaluate: bool = True,
+            compare_sequential: bool = False) -> Dict[str, Any]:
+        """
+        Parse, validate and add a batch of expectation lines to the validator's suite
+
+        Args:
+            expectation_lines: Lines of `validator.expect_*(...)` code
+            evaluate: Validate the batch now; False only records the expectations (single-pass mode)
+            compare_sequential: Also validate each expectation on its own to measure the batching saving
+
+        Returns:
+            Dict with:
+                results: one entry per accepted line, a validation result (or a placeholder
+                         result carrying only the configuration when evaluate is False)
+                lines: the accepted lines, in the same order as results
+                failed: list of {"line", "error", "traceback"} dicts for lines that could not be parsed or validated
+                column_rewrites: list of {"line", "from", "to", "method"} dicts for corrected column names
+                timings: parse/validate/total seconds and the average validation time per expectation,
+                         plus measured per expectation parse (and standalone validation) seconds
+        """
+        start = time.perf_counter()
+        configurations, lines, failed, timings = [], [], [], []
+        self.column_rewrites = []
+
+        for line in expectation_lines:
+            if not line or line.startswith('#'):
+                continue
+            parse_start = time.perf_counter()
+            try:
+                configuration = self.parse_line(line)
+            except Exception as e:
+                failed.append({'line': line, 'error': f"{type(e).__name__}: {e}", 'traceback': None})
+                continue
+            configurations.append(configuration)
+            lines.append(line)
+            timings.append({
+                'expectation_type': configuration.expectation_type,
+                'parse_seconds': time.perf_counter() - parse_start,
+            })
+        parse_seconds = time.perf_counter() - start
+
+        validate_start = time.perf_counter()
+        if evaluate and configurations:
+            validated = self.validator.graph_validate(
+                configurations=configurations,
+                runtime_configuration={"catch_exceptions": True},
+            )
+            # graph_validate does not guarantee input order, match results back by configuration
+            # (expectation_key ignores the batch_id the validator adds to each result's kwargs)
+            by_key = {expectation_key(result.expectation_config): result for result in validated}
+            results = [by_key.get(expectation_key(configuration)) for configuration in configurations]
+        else:
+            results = [ExpectationValidationResult(expectation_config=configuration) for configuration in configurations]
+        validate_seconds = time.perf_counter() - validate_start
+
+        if compare_sequential and evaluate:
+            for timing, configuration in zip(timings, configurations):
+                single_start = time.perf_counter()
+                self.validator.graph_validate(configurations=[configuration],
+                                              runtime_configuration={"catch_exceptions": True})
+                timing['standalone_seconds'] = time.perf_counter() - single_start
+
+        # Keep only expectations that could be evaluated, like the interactive validator does
+        accepted_results, accepted_lines = [], []
+        for line, configuration, result in zip(lines, configurations, results):
+            if result is None:
+                failed.append({'line': line, 'error': 'No result returned', 'traceback': None})
+                continue
+            error = _exception_details(result.exception_info)
+            if error is not None:
+                failed.append({'line': line, **error})
+                continue
+            self.validator.expectation_suite.add_expectation(configuration)
+            accepted_results.append(result)
+            accepted_lines.append(line)
+
+        return {
+            'results': accepted_results,
+            'lines': accepted_lines,
+            'failed': failed,
+            'column_rewrites': list(self.column_rewrites),
+            'timings': {
+                'parse_seconds': parse_seconds,
+                'validate_seconds': validate_seconds,
+                # Even split of the single graph run, not a measurement of any one expectation
+                'validate_seconds_average': validate_seconds / len(configurations) if configurations else 0.0,
+                'total_seconds': time.perf_counter() - start,
+                'per_expectation': timings,
+            },
+        }
+
+
+def print_batch_report(report: Dict[str, Any]):
+    """
+    Print the execution summary and timings of a batch run
+    """
+    timings = report['timings']
+    print(f"\n{'='*60}")
+    print("EXECUTION SUMMARY (batched):")
+    print(f"  Successful: {len(report['results'])}")
+    print(f"  Failed: {len(report['failed'])}")
+    for rewrite in report.get('column_rewrites', []):
+        print(f"    ↪ column '{rewrite['from']}' resolved to '{rewrite['to']}' ({rewrite['method']})")
+    for failure in report['failed']:
+        print(f"    ✗ {failure['line']}")
+        print(f"      {str(failure['error'])[:200]}")
+    print("  Timings:")
+    sequential_total = 0.0
+    for timing in timings['per_expectation']:
+        line = f"    {timing['expectation_type']}: parse {timing['parse_seconds']*1000:.1f} ms"
+        if 'standalone_seconds' in timing:
+            sequential_total += timing['standalone_seconds']
+            line += f", standalone {timing['standalone_seconds']*1000:.1f} ms"
+        print(line)
+    print(f"  Validation (single graph): {timings['validate_seconds']:.3f} s "
+          f"(average {timings['validate_seconds_average']*1000:.1f} ms per expectation)")
+    if sequential_total:
+        print(f"  Validation (one by one): {sequential_total:.3f} s")
+    print(f"  Total: {timings['total_seconds']:.3f} s")
+    print(f"{'='*60}\n")
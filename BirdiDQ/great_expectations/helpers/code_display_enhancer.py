@@ -6,7 +6,7 @@ Enhances expectation metadata to display Python code and SQL in Data Docs.
 """
 
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 def enhance_expectation_with_code(expectation_line: str, execution_engine: str = "SQL", return_meta: bool = False):
@@ -35,6 +35,48 @@ def enhance_expectation_with_code(expectation_line: str, execution_engine: str =
     if "meta=" in expectation_line:
         return (expectation_line, None) if return_meta else expectation_line
     
+    meta_dict = build_code_display_meta(expectation_line, execution_engine)
+    
+    # Insert meta parameter before closing parenthesis
+    # Handle both cases: with and without trailing parenthesis
+    expectation_line = expectation_line.rstrip()
+    
+    if expectation_line.endswith(')'):
+        # Insert before the last closing parenthesis
+        insert_pos = expectation_line.rfind(')')
+        # Use placeholder {...} that will be replaced with actual dict
+        enhanced_line = (
+            expectation_line[:insert_pos] + 
+            ", meta={...}" + 
+            expectation_line[insert_pos:]
+        )
+    else:
+        # No closing parenthesis (shouldn't happen, but handle it)
+        enhanced_line = expectation_line + ", meta={...})"
+    
+    # Return based on return_meta flag
+    if return_meta:
+        return (enhanced_line, meta_dict)
+    else:
+        # For backward compatibility, replace placeholder with dict string representation
+        enhanced_line = enhanced_line.replace('{...}', str(meta_dict))
+        return enhanced_line
+
+
+def build_code_display_meta(expectation_line: str, execution_engine: str = "SQL", info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Build the meta dictionary that displays the Python code (and SQL example) in Data Docs.
+    
+    Args:
+        expectation_line: The expectation code line shown in Data Docs
+        execution_engine: The execution engine being used ("SQL", "Pandas", etc.)
+        info: Expectation details (type, column, parameters) if already known,
+              otherwise they are extracted from the line
+    
+    Returns:
+        Meta dictionary with markdown notes, ready to pass to ExpectationConfiguration
+    """
+    
     # Create the code display content
     code_display = f"""### 📝 Implementation Details
 
@@ -49,7 +91,8 @@ def enhance_expectation_with_code(expectation_line: str, execution_engine: str =
     # For SQL execution engine, add example SQL query
     if "SQL" in execution_engine:
         # Extract expectation info and generate SQL example
-        info = extract_expectation_info(expectation_line)
+        if info is None:
+            info = extract_expectation_info(expectation_line)
         if info['type'] and info['column']:
             sql_example = generate_sql_example(info['type'], info['column'], info['parameters'])
             code_display += f"""
@@ -81,30 +124,7 @@ def enhance_expectation_with_code(expectation_line: str, execution_engine: str =
         }
     }
     
-    # Insert meta parameter before closing parenthesis
-    # Handle both cases: with and without trailing parenthesis
-    expectation_line = expectation_line.rstrip()
-    
-    if expectation_line.endswith(')'):
-        # Insert before the last closing parenthesis
-        insert_pos = expectation_line.rfind(')')
-        # Use placeholder {...} that will be replaced with actual dict
-        enhanced_line = (
-            expectation_line[:insert_pos] + 
-            ", meta={...}" + 
-            expectation_line[insert_pos:]
-        )
-    else:
-        # No closing parenthesis (shouldn't happen, but handle it)
-        enhanced_line = expectation_line + ", meta={...})"
-    
-    # Return based on return_meta flag
-    if return_meta:
-        return (enhanced_line, meta_dict)
-    else:
-        # For backward compatibility, replace placeholder with dict string representation
-        enhanced_line = enhanced_line.replace('{...}', str(meta_dict))
-        return enhanced_line
+    return meta_dict
 
 
 def extract_expectation_info(expectation_line: str) -> Dict[str, Any]:
@@ -0,0 +1,170 @@
+"""
+Column Name Resolver
+====================
+
+Checks the column arguments of parsed expectation lines against the real
+schema before anything is validated. The model sometimes writes a column the
+way the user did ("housing median age" for housing_median_age, "Amount" for
+amount, "custmer_id" for customer_id); such lines used to fail inside the
+metric computation and were dropped after a wasted validation attempt.
+
+Names are looked up in an index built once per schema: exact name, then the
+folded name (case, spaces, underscores and other separators removed), then the
+closest folded name within COLUMN_RESOLVER_MAX_DISTANCE edits. A name that
+matches nothing, or several columns equally well, is rejected up front.
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Maximum edit distance between a generated column name and a real one (0 disables fuzzy matching)
+COLUMN_RESOLVER_MAX_DISTANCE = int(os.environ.get('COLUMN_RESOLVER_MAX_DISTANCE', 2))
+
+# Expectation arguments holding one column name / a list of column names
+_COLUMN_KWARGS = ('column', 'column_A', 'column_B')
+_COLUMN_LIST_KWARGS = ('column_list', 'column_set')
+
+
+class ColumnResolutionError(ValueError):
+    """
+    Raised when a column argument does not match exactly one column of the data asset
+    """
+
+
+def fold_column_name(name: str) -> str:
+    """
+    Case and separator insensitive form of a column name ("Housing Median-Age" -> "housingmedianage")
+    """
+    return re.sub(r'[\W_]+', '', str(name).lower())
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Levenshtein distance of a and b, or limit + 1 as soon as it is known to exceed limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class ColumnResolver():
+    """
+    Precomputed name index of one schema, maps generated column names to real ones
+    """
+    def __init__(self, columns: Sequence[str], max_distance: Optional[int] = None):
+        """
+        Init class attributes
+
+        Args:
+            columns: Column names of the data asset
+            max_distance: Edit distance cap for fuzzy matches (None falls back to COLUMN_RESOLVER_MAX_DISTANCE)
+        """
+        self.columns = [str(column) for column in columns]
+        self.max_distance = COLUMN_RESOLVER_MAX_DISTANCE if max_distance is None else max_distance
+        self._exact = set(self.columns)
+        self._folded: Dict[str, List[str]] = {}
+        for column in self.columns:
+            self._folded.setdefault(fold_column_name(column), []).append(column)
+        # Folded names grouped by length, fuzzy lookups only compare names of similar length
+        self._by_length: Dict[int, List[str]] = {}
+        for folded in self._folded:
+            self._by_length.setdefault(len(folded), []).append(folded)
+
+    def resolve(self, name: str) -> Tuple[str, str]:
+        """
+        Map a generated column name to a column of the schema
+
+        Returns:
+            (column, method) with method 'exact', 'normalized' or 'fuzzy'
+
+        Raises:
+            ColumnResolutionError: No column or several columns match
+        """
+        if name in self._exact:
+            return name, 'exact'
+        folded = fold_column_name(name)
+        candidates = self._folded.get(folded, [])
+        if len(candidates) == 1:
+            return candidates[0], 'normalized'
+        if len(candidates) > 1:
+            raise ColumnResolutionError(f"Column '{name}' is ambiguous, it could be any of {candidates}")
+
+        # Closest folded names within the edit distance cap (short names would match almost anything)
+        limit = min(self.max_distance, max(0, len(folded) // 4))
+        best, best_distance = [], limit + 1
+        for length in range(len(folded) - limit, len(folded) + limit + 1):
+            for other in self._by_length.get(length, ()):
+                distance = edit_distance(folded, other, min(limit, best_distance))
+                if distance < best_distance:
+                    best, best_distance = [other], distance
+                elif distance == best_distance and distance <= limit:
+                    best.append(other)
+        matches = [column for other in best for column in self._folded[other]]
+        if len(matches) == 1:
+            return matches[0], 'fuzzy'
+        if matches:
+            raise ColumnResolutionError(f"Column '{name}' is ambiguous, it could be any of {matches}")
+        raise ColumnResolutionError(f"Column '{name}' does not exist in the data asset")
+
+    def resolve_expectation(self, parsed: Any) -> Tuple[Any, List[Dict[str, str]]]:
+        """
+        Check every column argument of a parsed line and rewrite near-misses
+
+        Args:
+            parsed: ParsedExpectation (see expectation_parser), shared by the parse cache so never modified
+
+        Returns:
+            (parsed expectation with real column names, list of {"from", "to", "method"} rewrites)
+
+        Raises:
+            ColumnResolutionError: A column argument does not match exactly one column
+        """
+        kwargs, rewrites = dict(parsed.kwargs), []
+
+        def resolve_name(value):
+            if not isinstance(value, str):
+                return value
+            column, method = self.resolve(value)
+            if method != 'exact':
+                rewrites.append({'from': value, 'to': column, 'method': method})
+            return column
+
+        for name in _COLUMN_KWARGS:
+            if name in kwargs:
+                kwargs[name] = resolve_name(kwargs[name])
+        for name in _COLUMN_LIST_KWARGS:
+            if isinstance(kwargs.get(name), (list, tuple, set)):
+                kwargs[name] = type(kwargs[name])(resolve_name(value) for value in kwargs[name])
+
+        if not rewrites:
+            return parsed, rewrites
+        # Keep the displayed code in line with what is validated
+        line = parsed.line
+        for rewrite in rewrites:
+            for quote in ('"', "'"):
+                line = line.replace(f"{quote}{rewrite['from']}{quote}", f"{quote}{rewrite['to']}{quote}")
+        return type(parsed)(line, parsed.expectation_type, kwargs), rewrites
+
+
+@lru_cache(maxsize=32)
+def _cached_resolver(columns: Tuple[str, ...], max_distance: int) -> ColumnResolver:
+    return ColumnResolver(columns, max_distance)
+
+
+def get_column_resolver(columns: Optional[Sequence[str]]) -> Optional[ColumnResolver]:
+    """
+    Return the shared resolver of a schema (index built once per column list), None without columns
+    """
+    if not columns:
+        return None
+    return _cached_resolver(tuple(str(column) for column in columns), COLUMN_RESOLVER_MAX_DISTANCE)
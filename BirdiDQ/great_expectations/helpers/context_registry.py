@@ -0,0 +1,147 @@
+"""
+Great Expectations DataContext Registry
+=======================================
+
+Shares one DataContext per context root directory across datasource objects
+and Streamlit reruns. A context is only rebuilt when its great_expectations.yml
+changes on disk.
+
+A shared context is used by several Streamlit sessions and by the background
+Data Docs builder, so everything that changes it (datasources and assets,
+suites, checkpoint runs, Data Docs builds) runs under its context_lock.
+"""
+
+import functools
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import great_expectations as ge
+
+
+class ContextRegistry():
+    """
+    Thread-safe cache of DataContext objects keyed by context root directory
+    """
+    def __init__(self):
+        """
+        Init class attributes
+        """
+        self._entries: Dict[Optional[str], Dict[str, Any]] = {}
+        self._context_locks: Dict[Optional[str], threading.RLock] = {}
+        self._lock = threading.RLock()
+        self.stats = {'hits': 0, 'misses': 0, 'reloads': 0}
+
+    @staticmethod
+    def _config_mtime(config_path: Optional[Path]) -> Optional[float]:
+        try:
+            return os.stat(config_path).st_mtime if config_path else None
+        except OSError:
+            return None
+
+    def get_context(self, context_root_dir: Optional[str] = None):
+        """
+        Return the shared context for `context_root_dir`, loading or reloading it when needed
+
+        Args:
+            context_root_dir: Context root directory, None lets GX discover it from the working directory
+
+        Returns:
+            The cached DataContext
+        """
+        key = str(Path(context_root_dir).resolve()) if context_root_dir else None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._config_mtime(entry['config_path']) == entry['config_mtime']:
+                    self.stats['hits'] += 1
+                    return entry['context']
+                self.stats['reloads'] += 1
+            else:
+                self.stats['misses'] += 1
+
+            if context_root_dir:
+                context = ge.get_context(context_root_dir=context_root_dir)
+            else:
+                context = ge.get_context()
+
+            root_directory = getattr(context, 'root_directory', None)
+            config_path = Path(root_directory) / 'great_expectations.yml' if root_directory else None
+            self._entries[key] = {
+                'context': context,
+                'config_path': config_path,
+                'config_mtime': self._config_mtime(config_path),
+            }
+            return context
+
+    def refresh(self, context):
+        """
+        Record the current config file state after this process changed it (e.g. added a datasource),
+        so the next lookup does not reload a context that is already up to date
+        """
+        with self._lock:
+            for entry in self._entries.values():
+                if entry['context'] is context:
+                    entry['config_mtime'] = self._config_mtime(entry['config_path'])
+
+    def lock_for(self, context) -> threading.RLock:
+        """
+        Return the lock serializing changes to a context, one per context root directory
+        (a context reloaded after a config change keeps the lock of its root)
+        """
+        root_directory = getattr(context, 'root_directory', None)
+        key = str(Path(root_directory).resolve()) if root_directory else None
+        with self._lock:
+            return self._context_locks.setdefault(key, threading.RLock())
+
+    def clear(self):
+        """
+        Drop all cached contexts
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared registry for the app
+context_registry = ContextRegistry()
+
+
+def get_context(context_root_dir: Optional[str] = None):
+    """
+    Return the shared DataContext for a context root directory (see ContextRegistry.get_context)
+    """
+    return context_registry.get_context(context_root_dir)
+
+
+def refresh_context(context):
+    """
+    Mark a shared context as up to date with its config file (see ContextRegistry.refresh)
+    """
+    context_registry.refresh(context)
+
+
+def context_lock(context) -> threading.RLock:
+    """
+    Return the lock to hold while changing a shared context or building its Data Docs
+    """
+    return context_registry.lock_for(context)
+
+
+def with_context_lock(method):
+    """
+    Run a datasource method while holding the lock of its `self.context`
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with context_lock(self.context):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def context_registry_stats() -> Dict[str, int]:
+    """
+    Return registry hit, miss and reload counts
+    """
+    with context_registry._lock:
+        return dict(context_registry.stats)
@@ -0,0 +1,138 @@
+"""
+Incremental Data Docs Builder
+=============================
+
+context.build_data_docs() re-renders every expectation suite and every
+historical validation result of the site. After a validation run only the
+pages of that run (its validation results and suites) and the index change,
+so these are passed to GX as `resource_identifiers` and everything else on
+the site is left as is. The first build of a site is still a full build.
+
+In background mode rendering runs on a single worker thread (builds of the
+same site never overlap) so the Streamlit request returns straight away.
+Builds hold the context's context_lock, so they never run while a session
+is changing the same context.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+from great_expectations.data_context.types.resource_identifiers import ExpectationSuiteIdentifier
+
+from helpers.context_registry import context_lock
+
+# Render Data Docs on a background thread instead of blocking the validation request
+DATA_DOCS_BACKGROUND = os.environ.get('DATA_DOCS_BACKGROUND', 'false').lower() in ('1', 'true', 'yes')
+
+
+def validation_result_identifiers(checkpoint_result) -> List:
+    """
+    Return the ValidationResultIdentifiers of a checkpoint run (empty for failed/placeholder results)
+    """
+    try:
+        return list(checkpoint_result.list_validation_result_identifiers())
+    except AttributeError:
+        return []
+
+
+class DataDocsBuilder():
+    """
+    Builds only the Data Docs pages touched by a run, optionally in the background
+    """
+    def __init__(self, background: Optional[bool] = None):
+        """
+        Init class attributes
+
+        Args:
+            background: Render on a worker thread (None falls back to DATA_DOCS_BACKGROUND)
+        """
+        self.background = DATA_DOCS_BACKGROUND if background is None else background
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='data-docs')
+        self._build_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: List[Future] = []
+
+    @staticmethod
+    def _site_exists(context) -> bool:
+        try:
+            return any(site.get('site_url') for site in context.get_docs_sites_urls(only_if_exists=True))
+        except Exception:
+            return False
+
+    def _build(self, context, resource_identifiers):
+        # Always the context lock first, sessions already hold it when they start a build
+        with context_lock(context), self._build_lock:
+            self._render(context, resource_identifiers)
+
+    def _render(self, context, resource_identifiers):
+        try:
+            if resource_identifiers and self._site_exists(context):
+                context.build_data_docs(resource_identifiers=resource_identifiers, build_index=True)
+                print(f"✓ Data Docs updated ({len(resource_identifiers)} pages and index)")
+            else:
+                context.build_data_docs()
+                print("✓ Data Docs built")
+        except Exception as e:
+            print(f"Warning: Incremental Data Docs build failed ({e}), rebuilding the whole site")
+            context.build_data_docs()
+
+    def build(self, context, checkpoint_result=None, expectation_suite_names: Iterable[str] = (),
+              background: Optional[bool] = None) -> Optional[Future]:
+        """
+        Render the pages of one validation run plus the index
+
+        Args:
+            context: DataContext owning the Data Docs sites
+            checkpoint_result: CheckpointResult of the run (its validation result pages are rendered)
+            expectation_suite_names: Suites created or changed by the run
+            background: Override the builder's background setting for this call
+
+        Returns:
+            Future of the build in background mode, otherwise None once the build is done
+        """
+        resource_identifiers = validation_result_identifiers(checkpoint_result)
+        resource_identifiers += [
+            ExpectationSuiteIdentifier(expectation_suite_name=name) for name in expectation_suite_names if name
+        ]
+
+        if not (self.background if background is None else background):
+            self._build(context, resource_identifiers)
+            return None
+
+        future = self._executor.submit(self._build, context, resource_identifiers)
+        with self._pending_lock:
+            self._pending = [pending for pending in self._pending if not pending.done()] + [future]
+        print("✓ Data Docs build started in the background")
+        return future
+
+    def wait(self, timeout: Optional[float] = None):
+        """
+        Block until background builds started so far have finished
+        """
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                print(f"Warning: Background Data Docs build failed: {e}")
+
+
+# Shared builder for the app
+data_docs_builder = DataDocsBuilder()
+
+
+def build_data_docs_for_run(context, checkpoint_result=None, expectation_suite_names: Iterable[str] = ()):
+    """
+    Build the Data Docs pages of one run with the shared builder (see DataDocsBuilder.build)
+    """
+    return data_docs_builder.build(context, checkpoint_result, expectation_suite_names)
+
+
+def wait_for_data_docs(timeout: Optional[float] = None):
+    """
+    Wait for pending background Data Docs builds (e.g. before opening the site)
+    """
+    data_docs_builder.wait(timeout)
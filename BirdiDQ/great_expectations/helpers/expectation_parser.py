@@ -0,0 +1,174 @@
+"""
+Expectation Parser
+==================
+
+Turns LLM generated `validator.expect_*(...)` lines into structured
+(expectation_type, kwargs) objects with the `ast` module instead of running
+them with exec. Only literal arguments are accepted (strings, numbers, lists,
+dicts, ...), expectation types must be registered in GX and keyword arguments
+must be ones the expectation declares. Parsed lines are cached by their text.
+"""
+
+import ast
+import copy
+import os
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.expectations.registry import get_expectation_impl
+
+# Number of parsed expectation lines kept in memory
+EXPECTATION_PARSE_CACHE_SIZE = int(os.environ.get('EXPECTATION_PARSE_CACHE_SIZE', 1024))
+
+# Keyword arguments accepted by every expectation
+_COMMON_KWARGS = frozenset({'meta', 'result_format', 'include_config', 'catch_exceptions', 'mostly',
+                            'row_condition', 'condition_parser'})
+
+# Parameters shown in the Data Docs SQL example (see code_display_enhancer.generate_sql_example)
+_DISPLAY_PARAMETERS = ('min_value', 'max_value', 'regex', 'value_set', 'mostly')
+
+
+class ExpectationParseError(ValueError):
+    """
+    Raised when a line is not a valid `validator.expect_*(...)` call
+    """
+
+
+class ParsedExpectation():
+    """
+    One parsed expectation line, positional arguments already mapped to their keyword names
+    """
+    def __init__(self, line: str, expectation_type: str, kwargs: Dict[str, Any]):
+        """
+        Init class attributes
+        """
+        self.line = line
+        self.expectation_type = expectation_type
+        self.kwargs = kwargs
+
+    def to_configuration(self, meta: Optional[Dict[str, Any]] = None) -> ExpectationConfiguration:
+        """
+        Build a new ExpectationConfiguration (parsed objects are cached and shared, so kwargs are copied)
+
+        Args:
+            meta: Extra meta merged over the `meta=` argument of the line, if any
+        """
+        kwargs = copy.deepcopy(self.kwargs)
+        call_meta = kwargs.pop('meta', None) or {}
+        return ExpectationConfiguration(
+            expectation_type=self.expectation_type,
+            kwargs=kwargs,
+            meta={**call_meta, **(meta or {})},
+        )
+
+    def display_info(self) -> Dict[str, Any]:
+        """
+        Expectation details in the format of code_display_enhancer.extract_expectation_info
+        """
+        column = self.kwargs.get('column')
+        return {
+            'type': self.expectation_type,
+            'column': column if isinstance(column, str) else None,
+            'parameters': {
+                name: value if isinstance(value, str) else repr(value)
+                for name, value in self.kwargs.items() if name in _DISPLAY_PARAMETERS
+            },
+        }
+
+    def __repr__(self):
+        return f"ParsedExpectation({self.expectation_type}, {self.kwargs!r})"
+
+
+@lru_cache(maxsize=None)
+def _expectation_signature(expectation_type: str):
+    """
+    Return (positional argument names, allowed keyword names) of a registered expectation
+    """
+    try:
+        impl = get_expectation_impl(expectation_type)
+    except Exception:
+        impl = None
+    if impl is None:
+        raise ExpectationParseError(f"Unknown expectation type '{expectation_type}'")
+
+    args_keys = tuple(getattr(impl, 'args_keys', None) or ())
+    allowed: FrozenSet[str] = frozenset(args_keys).union(
+        getattr(impl, 'domain_keys', None) or (),
+        getattr(impl, 'success_keys', None) or (),
+        getattr(impl, 'runtime_keys', None) or (),
+        (getattr(impl, 'default_kwarg_values', None) or {}).keys(),
+        _COMMON_KWARGS,
+    )
+    return args_keys, allowed
+
+
+def _literal(node: ast.AST, line: str):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise ExpectationParseError(
+            f"Only literal arguments are allowed, got '{ast.get_source_segment(line, node)}'"
+        ) from None
+
+
+@lru_cache(maxsize=EXPECTATION_PARSE_CACHE_SIZE)
+def _parse_cached(line: str) -> ParsedExpectation:
+    try:
+        tree = ast.parse(line, mode='eval')
+    except SyntaxError as e:
+        raise ExpectationParseError(f"Invalid Python syntax: {e.msg}") from None
+
+    call = tree.body
+    if not (isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == 'validator'
+            and call.func.attr.startswith('expect_')):
+        raise ExpectationParseError("Expected a single validator.expect_*(...) call")
+
+    expectation_type = call.func.attr
+    args_keys, allowed = _expectation_signature(expectation_type)
+
+    if len(call.args) > len(args_keys):
+        raise ExpectationParseError(f"{expectation_type} takes at most {len(args_keys)} positional arguments")
+
+    kwargs = {}
+    for key, node in zip(args_keys, call.args):
+        if isinstance(node, ast.Starred):
+            raise ExpectationParseError("*args are not supported")
+        kwargs[key] = _literal(node, line)
+
+    for keyword in call.keywords:
+        if keyword.arg is None:
+            raise ExpectationParseError("**kwargs are not supported")
+        if keyword.arg not in allowed:
+            raise ExpectationParseError(f"{expectation_type} got an unexpected argument '{keyword.arg}'")
+        if keyword.arg in kwargs:
+            raise ExpectationParseError(f"{expectation_type} got multiple values for argument '{keyword.arg}'")
+        kwargs[keyword.arg] = _literal(keyword.value, line)
+
+    return ParsedExpectation(line, expectation_type, kwargs)
+
+
+def parse_expectation(line: str) -> ParsedExpectation:
+    """
+    Parse one `validator.expect_*(...)` line
+
+    Args:
+        line: Expectation code line as generated by the model
+
+    Returns:
+        ParsedExpectation (shared from the cache, do not modify it)
+
+    Raises:
+        ExpectationParseError: The line is not a single literal-only call of a known expectation
+    """
+    return _parse_cached(line.strip())
+
+
+def parse_cache_info():
+    """
+    Return hit/miss statistics of the parse cache (functools cache_info)
+    """
+    return _parse_cached.cache_info()
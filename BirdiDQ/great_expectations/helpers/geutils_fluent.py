@@ -4,6 +4,7 @@ import datetime
 from great_expectations.checkpoint.checkpoint import SimpleCheckpoint
 import streamlit as st
 import streamlit.components.v1 as components
+from helpers.context_registry import get_context, refresh_context, context_lock, with_context_lock
 
 class DataQuality():
 
@@ -16,17 +17,19 @@ class DataQuality():
         self.checkpoint_name = f"{datasource_name}_checkpoint"
         self.dataframe = dataframe
         self.partition_date = datetime.datetime.now()
-        self.context = ge.get_context()
+        self.context = get_context()
 
     
     def add_or_update_datasource_2(self):
         datasource = self.context.sources.add_or_update_pandas(name=self.datasource_name)
         return datasource
     
+    @with_context_lock
     def create_data_asset(self):
         datasource = self.add_or_update_datasource_2()
         asset_name = f"{self.datasource_name}_{self.partition_date.date()}"
         data_asset = datasource.add_dataframe_asset(name=asset_name, dataframe=self.dataframe)
+        refresh_context(self.context)
         return data_asset
     
     def get_batch_resquest(self):
@@ -34,6 +37,7 @@ class DataQuality():
         batch_request = asset_name.build_batch_request()
         return batch_request
     
+    @with_context_lock
     def get_validator_2(self):
         """
         Retrieve a validator object for a fine grain adjustment on the expectation suite.
@@ -45,6 +49,7 @@ class DataQuality():
                                         )
         return validator
 
+    @with_context_lock
     def add_checkpoint_2(self):
         batch_request = self.get_batch_resquest()
         checkpoint = SimpleCheckpoint(
@@ -60,6 +65,7 @@ class DataQuality():
         self.context.add_or_update_checkpoint(checkpoint=checkpoint)
         return checkpoint
     
+    @with_context_lock
     def run_checkpoint(self, checkpoint):
         checkpoint_result = checkpoint.run()
         return checkpoint_result
@@ -77,7 +83,10 @@ class DataQuality():
         expectation_result = my_function(expectation, validator)
 
 
-        validator.save_expectation_suite(discard_failed_expectations=False)
+        with context_lock(self.context):
+
+
+            validator.save_expectation_suite(discard_failed_expectations=False)
         checkpoint = self.add_checkpoint_2()
         self.run_checkpoint(checkpoint)
         return expectation_result
@@ -0,0 +1,71 @@
+"""
+Single-Pass Validation Helpers
+==============================
+
+In single-pass mode expectations are added to the suite without interactive
+evaluation (no metrics computed) and validated once by the checkpoint. These
+helpers map the checkpoint's per-expectation results back onto the lines the
+user submitted, so the UI shows the same results as interactive mode.
+"""
+
+import json
+import os
+from typing import Any, List, Optional
+
+# Add expectations without interactive evaluation and validate them once through the checkpoint
+SINGLE_PASS_VALIDATION = os.environ.get('SINGLE_PASS_VALIDATION', 'false').lower() in ('1', 'true', 'yes')
+
+# Runtime-only kwargs that do not identify an expectation (batch_id is added by the validator on every result)
+_RUNTIME_KWARGS = {'result_format', 'include_config', 'catch_exceptions', 'batch_id'}
+
+
+def single_pass_enabled(single_pass: Optional[bool] = None) -> bool:
+    """
+    Resolve the single-pass setting of a datasource (None falls back to SINGLE_PASS_VALIDATION)
+    """
+    return SINGLE_PASS_VALIDATION if single_pass is None else bool(single_pass)
+
+
+def expectation_key(expectation_config) -> Optional[str]:
+    """
+    Build a hashable key identifying an expectation configuration by type and kwargs
+
+    Args:
+        expectation_config: ExpectationConfiguration (or None)
+
+    Returns:
+        String key, or None when there is no configuration
+    """
+    if expectation_config is None:
+        return None
+    kwargs = {k: v for k, v in expectation_config.kwargs.items() if k not in _RUNTIME_KWARGS}
+    return f"{expectation_config.expectation_type}:{json.dumps(kwargs, sort_keys=True, default=str)}"
+
+
+def map_checkpoint_results(checkpoint_result, pending_results: List[Any]) -> List[Any]:
+    """
+    Replace the placeholder results returned by non-interactive expectation calls
+    with the validated results from the checkpoint run
+
+    Args:
+        checkpoint_result: CheckpointResult returned by context.run_checkpoint
+        pending_results: Results returned by validator.expect_*() with interactive evaluation off
+
+    Returns:
+        List in the same order as pending_results; entries without a checkpoint match are kept as is
+    """
+    validated = {}
+    try:
+        suite_results = checkpoint_result.list_validation_results()
+    except AttributeError:
+        # Checkpoint failed and returned a placeholder object
+        return pending_results
+
+    for suite_result in suite_results:
+        for result in suite_result.results:
+            validated.setdefault(expectation_key(result.expectation_config), result)
+
+    return [
+        validated.get(expectation_key(getattr(result, 'expectation_config', None)), result)
+        for result in pending_results
+    ]
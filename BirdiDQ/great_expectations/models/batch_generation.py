@@ -0,0 +1,124 @@
+"""
+Batch Expectation Generation
+============================
+
+Generates expectation code for many tables at once (e.g. when onboarding a
+schema). Each (table, description, columns) request runs get_expectations on
+a bounded thread pool sharing one Ollama client. API calls go through a
+shared rate limiter, and 502 / upstream errors are retried with the backoff
+of get_expectations. Results are yielded as soon as each table is done.
+Requests the rule-based fast path can compile never reach the model.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from models.ollama_model import get_expectations, get_ollama_client
+from models.rule_based_model import compile_expectations
+
+# Concurrent generations of a batch
+OLLAMA_BATCH_WORKERS = int(os.environ.get('OLLAMA_BATCH_WORKERS', 4))
+# Maximum Ollama API requests per second across the batch, retries included (0 = unlimited)
+OLLAMA_REQUESTS_PER_SECOND = float(os.environ.get('OLLAMA_REQUESTS_PER_SECOND', 2))
+
+# (table, description, columns)
+GenerationRequest = Tuple[str, str, Optional[Sequence[str]]]
+
+
+class RateLimiter():
+    """
+    Thread-safe limiter spacing API requests evenly at `rate` requests per second
+    """
+    def __init__(self, rate: float):
+        """
+        Init class attributes
+
+        Args:
+            rate: Requests per second, 0 or less disables limiting
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        """
+        Block until the caller may send the next request
+        """
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _generate_one(request: GenerationRequest, client, model_name, rate_limiter, use_cache, use_fast_path):
+    table, description, columns = request
+    start = time.perf_counter()
+    result = {'table': table, 'description': description, 'code': None, 'source': None, 'error': None}
+    try:
+        code = compile_expectations(description, columns) if use_fast_path else None
+        if code:
+            result['source'] = 'rules'
+        else:
+            code = get_expectations(description, client, model_name=model_name, available_columns=columns,
+                                    use_cache=use_cache, rate_limiter=rate_limiter)
+            result['source'] = 'ollama'
+        result['code'] = code
+    except Exception as e:
+        result['error'] = str(e)
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def generate_expectations_batch(requests: Iterable[GenerationRequest], client=None, model_name: Optional[str] = None,
+                                max_workers: Optional[int] = None, requests_per_second: Optional[float] = None,
+                                use_cache: bool = True, use_fast_path: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Generate expectation code for many tables concurrently
+
+    Args:
+        requests: (table, description, columns) tuples, columns may be None
+        client: Ollama client shared by the workers (optional, defaults to the shared client)
+        model_name: Model name to use (optional)
+        max_workers: Concurrent generations (None falls back to OLLAMA_BATCH_WORKERS)
+        requests_per_second: API rate limit (None falls back to OLLAMA_REQUESTS_PER_SECOND, 0 = unlimited)
+        use_cache: Serve repeated requests from the expectation cache
+        use_fast_path: Try the rule-based compiler before calling the model
+
+    Yields:
+        Dict per table in completion order, with table, description, code (None on error),
+        source ('rules' or 'ollama'), error (None on success) and seconds
+    """
+    requests = list(requests)
+    if not requests:
+        return
+    if client is None:
+        client = get_ollama_client()
+    rate_limiter = RateLimiter(OLLAMA_REQUESTS_PER_SECOND if requests_per_second is None else requests_per_second)
+    max_workers = max(1, min(max_workers or OLLAMA_BATCH_WORKERS, len(requests)))
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='nl-to-expectation') as executor:
+        futures = [
+            executor.submit(_generate_one, request, client, model_name, rate_limiter, use_cache, use_fast_path)
+            for request in requests
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Consumer stopped early: do not start the remaining requests
+            for future in futures:
+                future.cancel()
+
+
+def generate_expectations_for_tables(requests: Iterable[GenerationRequest], **kwargs) -> Dict[str, Dict[str, Any]]:
+    """
+    Run generate_expectations_batch to completion and return the results keyed by table
+    """
+    return {result['table']: result for result in generate_expectations_batch(requests, **kwargs)}
@@ -0,0 +1,163 @@
+"""
+Expectation Code Cache
+======================
+
+Persistent SQLite cache of LLM generated expectation code. Entries are keyed by
+a SHA-256 hash of the normalized prompt, the available columns, the model name
+and the system prompt, so a repeated request for the same table returns
+without calling the model. The least recently used entries are evicted once
+the cache holds more than EXPECTATION_CACHE_MAX_ENTRIES entries.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# Cache LLM generated expectation code between requests
+EXPECTATION_CACHE_ENABLED = os.environ.get('EXPECTATION_CACHE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# SQLite file of the cache (uncommitted/ is git-ignored by the GX project)
+EXPECTATION_CACHE_PATH = os.environ.get(
+    'EXPECTATION_CACHE_PATH',
+    str(Path(__file__).parent.parent / 'uncommitted' / 'expectation_cache.sqlite'),
+)
+# Maximum number of cached responses, least recently used ones are evicted first
+EXPECTATION_CACHE_MAX_ENTRIES = int(os.environ.get('EXPECTATION_CACHE_MAX_ENTRIES', 1000))
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Normalize a natural language prompt so formatting differences do not miss the cache
+    """
+    return ' '.join((prompt or '').split())
+
+
+def cache_key(prompt: str, model_name: str, available_columns: Optional[Iterable[str]] = None,
+              system_prompt: str = '') -> str:
+    """
+    Build the content hash identifying one generation request
+
+    Args:
+        prompt: Natural language query
+        model_name: Model the code is generated with
+        available_columns: Column names given to the model (order does not matter)
+        system_prompt: Instructions sent with the prompt, changing them invalidates old entries
+    """
+    payload = json.dumps({
+        'prompt': normalize_prompt(prompt),
+        'columns': sorted(str(column) for column in available_columns or ()),
+        'model': model_name,
+        'system_prompt': hashlib.sha256(system_prompt.encode('utf-8')).hexdigest(),
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ExpectationCache():
+    """
+    SQLite backed LRU cache of generated expectation code
+    """
+    def __init__(self, path: Optional[str] = None, max_entries: Optional[int] = None):
+        """
+        Init class attributes
+
+        Args:
+            path: SQLite file (':memory:' for a process-local cache)
+            max_entries: Size cap, least recently used entries are evicted above it
+        """
+        self.path = path or EXPECTATION_CACHE_PATH
+        self.max_entries = max_entries or EXPECTATION_CACHE_MAX_ENTRIES
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS expectation_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_expectation_cache_access "
+                               "ON expectation_cache (last_access)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for `key` (and mark it recently used), None on a miss
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute("SELECT response FROM expectation_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+            conn.execute("UPDATE expectation_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+            self.stats['hits'] += 1
+            return row[0]
+
+    def put(self, key: str, response: str, model_name: Optional[str] = None):
+        """
+        Store a response and evict the least recently used entries above the size cap
+        """
+        if not response:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO expectation_cache (key, model, response, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model_name, response, now, now),
+            )
+            evicted = conn.execute("""
+                DELETE FROM expectation_cache WHERE key IN (
+                    SELECT key FROM expectation_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,)).rowcount
+            conn.commit()
+            self.stats['evictions'] += max(evicted, 0)
+
+    def clear(self):
+        """
+        Remove every cached response
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM expectation_cache")
+            conn.commit()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Return hit, miss and eviction counts, hit ratio and current number of entries
+        """
+        with self._lock:
+            entries = self._connection().execute("SELECT COUNT(*) FROM expectation_cache").fetchone()[0]
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        stats['entries'] = entries
+        return stats
+
+
+# Shared cache for the app
+expectation_cache = ExpectationCache()
+
+
+def expectation_cache_stats() -> Dict[str, float]:
+    """
+    Return statistics of the shared expectation cache (see ExpectationCache.get_stats)
+    """
+    return expectation_cache.get_stats()
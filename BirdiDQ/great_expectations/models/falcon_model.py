@@ -1,14 +1,39 @@
+import os
 from transformers import AutoModelForCausalLM, AutoTokenizer
 from peft import PeftModel, PeftConfig
 import torch
 
+PEFT_MODEL_ID = "DioulaD/falcon-7b-instruct-qlora-ge-dq-v2"
 
-def load_peft_model():
-    peft_model_id = "DioulaD/falcon-7b-instruct-qlora-ge-dq-v2"    
+
+def load_peft_model(merged_model_path=None, cpu_only=False, torch_dtype=None):
+    """
+    Load the finetuned falcon 7b model with its tokenizer
+    Params:
+      merged_model_path : Directory of a saved merged model, loaded directly when it exists (skips the
+                          adapter merge), otherwise the merged model is saved there for the next start
+      cpu_only : Keep the model on the CPU instead of letting accelerate place it
+      torch_dtype : Weights dtype (defaults to float32 on CPU, most CPUs have no fast bfloat16 path,
+                    and bfloat16 otherwise)
+    """
+    if torch_dtype is None:
+        torch_dtype = torch.float32 if cpu_only else torch.bfloat16
+    if merged_model_path and os.path.isdir(merged_model_path):
+        model = AutoModelForCausalLM.from_pretrained(
+            merged_model_path,
+            torch_dtype=torch_dtype,
+            device_map=None if cpu_only else "auto",
+            trust_remote_code=True,
+        )
+        tknizer = AutoTokenizer.from_pretrained(merged_model_path)
+        tknizer.pad_token = tknizer.eos_token
+        return model, tknizer
+
+    peft_model_id = PEFT_MODEL_ID
     model = AutoModelForCausalLM.from_pretrained(
             "tiiuae/falcon-7b-instruct",
-            torch_dtype=torch.bfloat16,
-            device_map="auto",
+            torch_dtype=torch_dtype,
+            device_map=None if cpu_only else "auto",
             trust_remote_code=True,
         )
     model = PeftModel.from_pretrained(model, peft_model_id)
@@ -18,6 +43,10 @@ def load_peft_model():
 
     tknizer = AutoTokenizer.from_pretrained(config.base_model_name_or_path)
     tknizer.pad_token = tknizer.eos_token
+
+    if merged_model_path:
+        model.save_pretrained(merged_model_path)
+        tknizer.save_pretrained(merged_model_path)
     return model, tknizer
 
 
@@ -52,3 +81,38 @@ def get_expectations(prompt, model, tknizer):
 
   except Exception as e:
     print("An error occurred: ", e)
+
+
+def get_expectations_batch(prompts, model, tknizer):
+  """
+  Convert several natural language queries in one generate call (same output as get_expectations)
+  Params:
+    prompts : List of natural language queries
+    model : Model download from huggingface hub
+    tknizer = Tokenizer from peft model
+  Returns:
+    List with the expectation line of each prompt (None where no line was generated)
+  """
+  device = model.device
+  # Decoder-only model: pad on the left so every prompt ends right before its generated tokens
+  padding_side = tknizer.padding_side
+  tknizer.padding_side = 'left'
+  try:
+    encoding = tknizer(list(prompts), return_tensors="pt", padding=True).to(device)
+  finally:
+    tknizer.padding_side = padding_side
+
+  with torch.inference_mode():
+    out = model.generate(
+        input_ids=encoding.input_ids,
+        attention_mask=encoding.attention_mask,
+        max_new_tokens=100, do_sample=True, temperature=0.3,
+        eos_token_id=tknizer.eos_token_id,
+        pad_token_id=tknizer.eos_token_id,
+        top_k=0
+    )
+  lines = []
+  for sequence in out:
+    response = tknizer.decode(sequence, skip_special_tokens=True).split("\n")
+    lines.append(response[1] if len(response) > 1 else None)
+  return lines
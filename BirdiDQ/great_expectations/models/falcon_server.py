@@ -0,0 +1,302 @@
+"""
+Falcon Model Server
+===================
+
+load_peft_model downloads the 7B base model, applies the QLoRA adapter and
+merges it, which takes minutes, so it should not run once per request. This
+module keeps the merged model loaded in one long-lived CPU-only worker
+process and serves prompts over a local socket (multiprocessing.connection,
+authenticated with FALCON_SERVER_AUTHKEY). Messages are pickled, so anyone
+holding the key can run code in the worker: there is no default key, the
+server refuses to start and clients refuse to connect until it is set.
+
+Prompts arriving together (several app sessions, generate_expectations_batch)
+are collected for up to FALCON_BATCH_WAIT_MS and generated in one batched
+model.generate call of at most FALCON_MAX_BATCH_SIZE prompts.
+
+Start the worker (from the great_expectations directory):
+    export FALCON_SERVER_AUTHKEY=$(python -c "import secrets; print(secrets.token_hex(32))")
+    python -m models.falcon_server --merged-model-path uncommitted/falcon-7b-ge-dq-merged
+
+The first start merges the adapter and saves the merged checkpoint there,
+later starts load it directly. Clients only need the standard library:
+    from models.falcon_server import get_expectations
+"""
+
+import argparse
+import os
+import queue
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+from typing import List, Optional, Sequence
+
+# Local address of the model worker (host:port)
+FALCON_SERVER_ADDRESS = os.environ.get('FALCON_SERVER_ADDRESS', '127.0.0.1:6010')
+# Shared secret clients authenticate with (required, no default)
+FALCON_SERVER_AUTHKEY = os.environ.get('FALCON_SERVER_AUTHKEY', '')
+# Saved merged model directory (loaded directly when present, written after the first merge)
+FALCON_MERGED_MODEL_PATH = os.environ.get('FALCON_MERGED_MODEL_PATH', '')
+# Prompts generated together in one model.generate call
+FALCON_MAX_BATCH_SIZE = int(os.environ.get('FALCON_MAX_BATCH_SIZE', 8))
+# Milliseconds the worker waits for more prompts before generating a batch
+FALCON_BATCH_WAIT_MS = int(os.environ.get('FALCON_BATCH_WAIT_MS', 25))
+# CPU threads used by torch (0 keeps the torch default)
+FALCON_TORCH_THREADS = int(os.environ.get('FALCON_TORCH_THREADS', 0))
+# Weights dtype, a torch dtype name such as float32 or bfloat16 (empty uses float32 on CPU)
+FALCON_TORCH_DTYPE = os.environ.get('FALCON_TORCH_DTYPE', '')
+
+
+def _address(address: Optional[str] = None):
+    host, port = (address or FALCON_SERVER_ADDRESS).rsplit(':', 1)
+    return host, int(port)
+
+
+def _authkey(authkey: Optional[str] = None) -> bytes:
+    """
+    Resolve the shared secret (None falls back to FALCON_SERVER_AUTHKEY), refusing to run without one
+    """
+    authkey = authkey or FALCON_SERVER_AUTHKEY
+    if not authkey:
+        raise ValueError(
+            "FALCON_SERVER_AUTHKEY is not set. The falcon model server exchanges pickled messages, "
+            "set a random secret for both the server and the app, e.g. "
+            "python -c \"import secrets; print(secrets.token_hex(32))\""
+        )
+    return authkey.encode('utf-8')
+
+
+class _PendingPrompt():
+    """
+    One prompt waiting for the batch worker, the connection thread waits on `done`
+    """
+    def __init__(self, prompt: str):
+        self.prompt = prompt
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class FalconModelServer():
+    """
+    Long-lived CPU inference worker serving the merged falcon model over a local socket
+    """
+    def __init__(self, address: Optional[str] = None, authkey: Optional[str] = None,
+                 merged_model_path: Optional[str] = None, max_batch_size: Optional[int] = None,
+                 batch_wait_ms: Optional[int] = None, generate_batch=None):
+        """
+        Init class attributes
+
+        Args:
+            address: host:port to listen on (None falls back to FALCON_SERVER_ADDRESS)
+            authkey: Shared secret (None falls back to FALCON_SERVER_AUTHKEY)
+            merged_model_path: Saved merged model directory (None falls back to FALCON_MERGED_MODEL_PATH)
+            max_batch_size: Prompts per generate call (None falls back to FALCON_MAX_BATCH_SIZE)
+            batch_wait_ms: Batch collection window (None falls back to FALCON_BATCH_WAIT_MS)
+            generate_batch: Callable mapping a list of prompts to a list of results; defaults to the
+                falcon model, loaded once by load()
+        """
+        self.address = _address(address)
+        self.authkey = _authkey(authkey)
+        self.merged_model_path = merged_model_path if merged_model_path is not None else FALCON_MERGED_MODEL_PATH
+        self.max_batch_size = max(1, max_batch_size or FALCON_MAX_BATCH_SIZE)
+        self.batch_wait = (FALCON_BATCH_WAIT_MS if batch_wait_ms is None else batch_wait_ms) / 1000
+        self.generate_batch = generate_batch
+        self.stats = {'requests': 0, 'prompts': 0, 'batches': 0, 'largest_batch': 0, 'generate_seconds': 0.0}
+        self._queue: "queue.Queue[_PendingPrompt]" = queue.Queue()
+        self._listener = None
+        self._running = threading.Event()
+
+    def load(self):
+        """
+        Load the merged model once (CPU only), unless a generate_batch callable was given
+        """
+        if self.generate_batch is not None:
+            return
+        # Keep torch off any GPU of the machine
+        os.environ.setdefault('CUDA_VISIBLE_DEVICES', '')
+        import torch
+        from models.falcon_model import get_expectations_batch, load_peft_model
+
+        if FALCON_TORCH_THREADS > 0:
+            torch.set_num_threads(FALCON_TORCH_THREADS)
+        start = time.perf_counter()
+        torch_dtype = getattr(torch, FALCON_TORCH_DTYPE) if FALCON_TORCH_DTYPE else None
+        model, tknizer = load_peft_model(merged_model_path=self.merged_model_path or None, cpu_only=True,
+                                         torch_dtype=torch_dtype)
+        model.eval()
+        print(f"✓ Falcon model loaded on CPU in {time.perf_counter() - start:.1f}s")
+        self.generate_batch = lambda prompts: get_expectations_batch(prompts, model, tknizer)
+
+    def _batch_worker(self):
+        while self._running.is_set():
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            start = time.perf_counter()
+            try:
+                results = list(self.generate_batch([pending.prompt for pending in batch]))
+                for pending, result in zip(batch, results):
+                    pending.result = result
+            except Exception as e:
+                for pending in batch:
+                    pending.error = str(e)
+            self.stats['batches'] += 1
+            self.stats['prompts'] += len(batch)
+            self.stats['largest_batch'] = max(self.stats['largest_batch'], len(batch))
+            self.stats['generate_seconds'] += time.perf_counter() - start
+            for pending in batch:
+                pending.done.set()
+
+    def _serve_connection(self, conn):
+        with conn:
+            while self._running.is_set():
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    return
+                op = request.get('op')
+                if op == 'ping':
+                    conn.send({'status': 'ok', 'stats': dict(self.stats)})
+                    continue
+                if op != 'generate':
+                    conn.send({'error': f"Unknown operation '{op}'"})
+                    continue
+                self.stats['requests'] += 1
+                pending = [_PendingPrompt(prompt) for prompt in request.get('prompts', [])]
+                for item in pending:
+                    self._queue.put(item)
+                for item in pending:
+                    item.done.wait()
+                errors = [item.error for item in pending if item.error]
+                conn.send({'results': [item.result for item in pending], 'error': errors[0] if errors else None})
+
+    def start(self):
+        """
+        Load the model, then accept connections and run the batch worker on background threads
+        """
+        self.load()
+        # Default backlog is 1, concurrent clients would stall in the handshake
+        self._listener = Listener(self.address, backlog=64, authkey=self.authkey)
+        self.address = self._listener.address
+        self._running.set()
+        threading.Thread(target=self._batch_worker, name='falcon-batch', daemon=True).start()
+        threading.Thread(target=self._accept_loop, name='falcon-accept', daemon=True).start()
+        print(f"✓ Falcon model server listening on {self.address[0]}:{self.address[1]}")
+        return self
+
+    def _accept_loop(self):
+        while self._running.is_set():
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                if not self._running.is_set():
+                    return
+                # Failed handshake (e.g. wrong authkey), keep serving
+                continue
+            threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+    def stop(self):
+        """
+        Stop accepting connections and close the socket
+        """
+        self._running.clear()
+        if self._listener is not None:
+            self._listener.close()
+
+
+class FalconClient():
+    """
+    Client of the model server, one connection per thread
+    """
+    def __init__(self, address: Optional[str] = None, authkey: Optional[str] = None):
+        """
+        Init class attributes
+        """
+        self.address = _address(address)
+        # Resolved on first connect so importing the shared client does not require the key
+        self.authkey = authkey
+        self._local = threading.local()
+
+    def _request(self, payload):
+        conn = getattr(self._local, 'conn', None)
+        for attempt in range(2):
+            if conn is None:
+                conn = self._local.conn = Client(self.address, authkey=_authkey(self.authkey))
+            try:
+                conn.send(payload)
+                return conn.recv()
+            except (EOFError, OSError):
+                # Server restarted since the last request: reconnect once
+                conn.close()
+                conn = self._local.conn = None
+                if attempt:
+                    raise
+
+    def ping(self):
+        """
+        Return the server status and batching statistics
+        """
+        return self._request({'op': 'ping'})
+
+    def generate(self, prompts: Sequence[str]) -> List[Optional[str]]:
+        """
+        Generate the expectation line of each prompt (batched with other clients' prompts on the server)
+        """
+        response = self._request({'op': 'generate', 'prompts': list(prompts)})
+        if response.get('error'):
+            raise Exception(f"Falcon model server error: {response['error']}")
+        return response['results']
+
+
+# Shared client for the app
+falcon_client = FalconClient()
+
+
+def get_expectations(prompt: str) -> Optional[str]:
+    """
+    Convert a natural language query with the warm falcon model server
+    (same result as falcon_model.get_expectations, without loading the model)
+    """
+    return falcon_client.generate([prompt])[0]
+
+
+def get_expectations_batch(prompts: Sequence[str]) -> List[Optional[str]]:
+    """
+    Convert several natural language queries with the falcon model server
+    """
+    return falcon_client.generate(prompts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Warm CPU-only falcon model server')
+    parser.add_argument('--address', default=FALCON_SERVER_ADDRESS, help='host:port to listen on')
+    parser.add_argument('--merged-model-path', default=FALCON_MERGED_MODEL_PATH,
+                        help='Saved merged model directory (created on the first start)')
+    parser.add_argument('--max-batch-size', type=int, default=FALCON_MAX_BATCH_SIZE)
+    parser.add_argument('--batch-wait-ms', type=int, default=FALCON_BATCH_WAIT_MS)
+    args = parser.parse_args()
+
+    server = FalconModelServer(args.address, merged_model_path=args.merged_model_path,
+                               max_batch_size=args.max_batch_size, batch_wait_ms=args.batch_wait_ms).start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
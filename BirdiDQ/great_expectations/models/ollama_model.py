@@ -1,13 +1,55 @@
 import ollama
 import os
+import ast
+import re
+import threading
+import time
 from dotenv import load_dotenv
 from pathlib import Path
+from models.expectation_cache import EXPECTATION_CACHE_ENABLED, cache_key, expectation_cache
+from models.prompt_compaction import build_columns_section
 
 # Load environment variables from main project directory
 # Use absolute path to ensure reliability
 env_path = '/Users/yavin/python_projects/ollama_jupyter/.env'
 load_dotenv(env_path)
 
+# Seconds a successful health probe is reused before the API is probed again
+OLLAMA_HEALTH_CHECK_TTL = int(os.getenv('OLLAMA_HEALTH_CHECK_TTL', 300))
+
+# Shared client and last successful health probe, reused across calls and Streamlit reruns
+_client_lock = threading.Lock()
+_client_cache = {'config': None, 'client': None}
+_health_cache = {'config': None, 'checked_at': 0.0, 'result': None}
+
+# Instructions sent with every natural language query (part of the cache key)
+EXPECTATION_SYSTEM_PROMPT = """You are an expert in Great Expectations data validation library.
+            Convert the following natural language description into Python code using the validator.expect_*() format.
+            
+            CRITICAL INSTRUCTIONS:
+            - Return ONLY executable Python code using validator.expect_*() methods
+            - NO explanations, NO thinking process, NO markdown, NO comments
+            - Use the format: validator.expect_column_values_to_be_unique(column="column_name")
+            - Each expectation on a new line
+            - Do NOT use expectation_suite.add_expectation()
+            - Do NOT import anything
+            - Use EXACT column names as provided in the available columns list
+            - Column names are CASE-SENSITIVE - use them EXACTLY as shown
+            
+            Example 1:
+            Input: "Check that none of the values in the address column match the pattern for an address starting with a digit"
+            Output: validator.expect_column_values_to_not_match_regex(column="address", regex=r"^\\d")
+            
+            Example 2:
+            Input: "transaction_id should be unique and customer_id should not be null"
+            Output: validator.expect_column_values_to_be_unique(column="transaction_id")
+            validator.expect_column_values_to_not_be_null(column="customer_id")
+            
+            Example 3:
+            Input: "amount should be greater than 0"
+            Output: validator.expect_column_values_to_be_between(column="amount", min_value=0, strict_min=True)
+            """
+
 def load_ollama_client():
     """
     Initialize and return Ollama client with cloud configuration
@@ -33,7 +75,190 @@ def load_ollama_client():
         print(f"Error initializing Ollama client: {e}")
         raise
 
-def get_expectations(prompt, client=None, model_name=None, available_columns=None):
+def _client_config():
+    return (os.getenv('OLLAMA_CLOUD_BASE_URL', 'https://ollama.com'), os.getenv('OLLAMA_API_KEY'))
+
+def get_ollama_client():
+    """
+    Return the shared Ollama client, created on first use (or when the URL/API key change)
+    Returns:
+        ollama.Client: Configured Ollama client
+    """
+    config = _client_config()
+    with _client_lock:
+        if _client_cache['client'] is None or _client_cache['config'] != config:
+            _client_cache['client'] = load_ollama_client()
+            _client_cache['config'] = config
+        return _client_cache['client']
+
+def check_ollama_health(force=False):
+    """
+    Cheap connection check: lists the available models instead of running a completion.
+    A successful result is reused for OLLAMA_HEALTH_CHECK_TTL seconds, failures are re-probed on the next call
+    Params:
+        force (bool): Probe the API even if a recent result is cached
+    Returns:
+        dict: Connection status and model information
+    """
+    config = _client_config()
+    model_name = os.getenv('OLLAMA_CLOUD_MODEL', 'gpt-oss:20b')
+    with _client_lock:
+        cached = _health_cache['result']
+        if (not force and cached is not None and _health_cache['config'] == config
+                and time.monotonic() - _health_cache['checked_at'] < OLLAMA_HEALTH_CHECK_TTL):
+            return cached
+
+    try:
+        client = get_ollama_client()
+        client.list()
+        result = {
+            'status': 'success',
+            'model': model_name,
+            'message': 'Ollama connection successful'
+        }
+    except Exception as e:
+        return {
+            'status': 'error',
+            'error': str(e),
+            'message': 'Ollama connection failed'
+        }
+
+    with _client_lock:
+        _health_cache.update({'config': config, 'checked_at': time.monotonic(), 'result': result})
+    return result
+
+def clean_generated_code(generated_code):
+    """
+    Extract the validator.expect_* lines from a model response (drops markdown fences and reasoning text)
+    Params:
+        generated_code (str): Raw model response
+    Returns:
+        str: Expectation code, one expectation per line
+    """
+    generated_code = (generated_code or '').strip()
+    
+    # Clean up the response to extract just the code
+    if "```python" in generated_code:
+        generated_code = generated_code.split("```python")[1].split("```")[0].strip()
+    elif "```" in generated_code:
+        generated_code = generated_code.split("```")[1].split("```")[0].strip()
+    
+    # Additional cleaning: Extract only validator.expect_* lines
+    # This filters out reasoning/thinking text
+    lines = generated_code.split('\n')
+    validator_lines = []
+    
+    for line in lines:
+        line = line.strip()
+        # Only include lines that start with validator.expect_
+        # or are continuation lines (for multi-line expectations)
+        if line.startswith('validator.expect_'):
+            validator_lines.append(line)
+        elif validator_lines and line and not any(keyword in line.lower() for keyword in 
+            ['we need', 'actually', 'wait', 'so code:', 'but', 'output:', 'means', 'they\'d use', 'should use']):
+            # This might be a continuation line (e.g., multi-line expectation)
+            validator_lines.append(line)
+    
+    # If we found validator lines, use those
+    if validator_lines:
+        generated_code = '\n'.join(validator_lines)
+    
+    # If the generated code still contains reasoning keywords, try to extract the last validator call
+    reasoning_keywords = ['we need to produce', 'actually', 'wait:', 'so code:', 'but the', 'means']
+    if any(keyword in generated_code.lower() for keyword in reasoning_keywords):
+        # Find all validator.expect_ patterns
+        validator_pattern = r'validator\.expect_[a-z_]+\([^)]*\)'
+        matches = re.findall(validator_pattern, generated_code, re.IGNORECASE)
+        if matches:
+            # Use the last complete match (usually the final answer)
+            generated_code = '\n'.join(matches)
+    
+    return generated_code
+
+def _is_complete_call(code):
+    """
+    Whether `code` is one syntactically complete expression (e.g. a finished validator.expect_*(...) call)
+    """
+    try:
+        ast.parse(code.strip(), mode='eval')
+        return True
+    except SyntaxError:
+        return False
+
+def stream_expectation_code(client, model_name, full_prompt, options, on_partial=None):
+    """
+    Generate expectation code from the token stream and stop generation early: as soon as
+    at least one complete validator.expect_* line is followed by a line that is not an
+    expectation (closing markdown fence, explanation, reasoning text), the stream is closed
+    Params:
+        client (ollama.Client): Ollama client instance
+        model_name (str): Model name to use
+        full_prompt (str): System prompt and natural language description
+        options (dict): Generation options
+        on_partial (callable): Called with the expectation code parsed so far whenever it grows
+    Returns:
+        str: Expectation code, one expectation per line
+    """
+    stream = client.generate(model=model_name, prompt=full_prompt, options=options, stream=True)
+    expectation_lines = []
+    pending = ''    # expectation call spanning several lines
+    buffer = ''     # text after the last complete line
+    raw_text = ''
+    finished = False
+    
+    def consume_line(line):
+        nonlocal pending
+        line = line.strip()
+        if line.startswith('```'):
+            # Opening fence before the code, closing fence after it
+            return 'other' if expectation_lines and not pending else 'skip'
+        if pending:
+            pending = f"{pending} {line}".strip()
+            if _is_complete_call(pending):
+                expectation_lines.append(pending)
+                pending = ''
+                return 'added'
+            return 'pending'
+        if line.startswith('validator.expect_'):
+            if _is_complete_call(line):
+                expectation_lines.append(line)
+                return 'added'
+            pending = line
+            return 'pending'
+        if not line:
+            return 'skip'
+        return 'other'
+    
+    try:
+        for chunk in stream:
+            token = chunk.get('response', '')
+            raw_text += token
+            buffer += token
+            while '\n' in buffer:
+                line, buffer = buffer.split('\n', 1)
+                outcome = consume_line(line)
+                if outcome == 'added' and on_partial is not None:
+                    on_partial('\n'.join(expectation_lines))
+                elif outcome == 'other' and expectation_lines:
+                    # Expectations are done, the rest is explanation or reasoning
+                    finished = True
+                    break
+            if finished or chunk.get('done'):
+                break
+    finally:
+        # Closing the generator closes the HTTP response, which stops generation on the server
+        if hasattr(stream, 'close'):
+            stream.close()
+    
+    if not finished and buffer and consume_line(buffer) == 'added' and on_partial is not None:
+        on_partial('\n'.join(expectation_lines))
+    
+    if finished:
+        print(f"✓ Stopped generation early after {len(expectation_lines)} expectation(s)")
+    return '\n'.join(expectation_lines) if expectation_lines else clean_generated_code(raw_text)
+
+def get_expectations(prompt, client=None, model_name=None, available_columns=None, use_cache=True,
+                     stream=False, on_partial=None, rate_limiter=None):
     """
     Convert natural language query to great expectation methods using Ollama
     
@@ -42,112 +267,78 @@ def get_expectations(prompt, client=None, model_name=None, available_columns=Non
         client (ollama.Client): Ollama client instance (optional)
         model_name (str): Model name to use (optional)
         available_columns (list): List of actual column names from the data (optional)
+        use_cache (bool): Return cached code for a repeated request (see models/expectation_cache.py)
+        stream (bool): Stream tokens and stop generating once the expectation lines are complete
+        on_partial (callable): Called with the partial expectation code while streaming (optional)
+        rate_limiter: Object whose acquire() is called before every API request, retries included (optional)
     
     Returns:
         str: Generated Great Expectations code
     """
-    import time
-    
     max_retries = 3
     retry_delay = 2
     
+    # Get model name from environment or use default
+    if model_name is None:
+        model_name = os.getenv('OLLAMA_CLOUD_MODEL', 'gpt-oss:20b')
+    
+    # Columns listed in the prompt, only the most relevant ones for wide tables (see models/prompt_compaction.py)
+    columns_section = build_columns_section(prompt, available_columns)
+    
+    # Same prompt, columns and model as an earlier request: skip the API call
+    key = None
+    if use_cache and EXPECTATION_CACHE_ENABLED:
+        try:
+            key = cache_key(prompt, model_name, available_columns, EXPECTATION_SYSTEM_PROMPT + columns_section)
+            cached_code = expectation_cache.get(key)
+            if cached_code is not None:
+                print("✓ Expectation code served from cache")
+                return cached_code
+        except Exception as e:
+            print(f"Warning: Expectation cache unavailable: {e}")
+            key = None
+    
     for attempt in range(max_retries):
         try:
-            # Initialize client if not provided
+            # Use the shared client if none was provided
             if client is None:
-                client = load_ollama_client()
-            
-            # Get model name from environment or use default
-            if model_name is None:
-                model_name = os.getenv('OLLAMA_CLOUD_MODEL', 'gpt-oss:20b')
-            
-            # Create a more specific prompt for Great Expectations
-            system_prompt = """You are an expert in Great Expectations data validation library.
-            Convert the following natural language description into Python code using the validator.expect_*() format.
-            
-            CRITICAL INSTRUCTIONS:
-            - Return ONLY executable Python code using validator.expect_*() methods
-            - NO explanations, NO thinking process, NO markdown, NO comments
-            - Use the format: validator.expect_column_values_to_be_unique(column="column_name")
-            - Each expectation on a new line
-            - Do NOT use expectation_suite.add_expectation()
-            - Do NOT import anything
-            - Use EXACT column names as provided in the available columns list
-            - Column names are CASE-SENSITIVE - use them EXACTLY as shown
-            
-            Example 1:
-            Input: "Check that none of the values in the address column match the pattern for an address starting with a digit"
-            Output: validator.expect_column_values_to_not_match_regex(column="address", regex=r"^\\d")
+                client = get_ollama_client()
             
-            Example 2:
-            Input: "transaction_id should be unique and customer_id should not be null"
-            Output: validator.expect_column_values_to_be_unique(column="transaction_id")
-            validator.expect_column_values_to_not_be_null(column="customer_id")
-            
-            Example 3:
-            Input: "amount should be greater than 0"
-            Output: validator.expect_column_values_to_be_between(column="amount", min_value=0, strict_min=True)
-            """
-            
-            # Add available columns if provided
-            if available_columns:
-                columns_str = ", ".join(f'"{col}"' for col in available_columns)
-                system_prompt += f"\n\nIMPORTANT - Available columns in this dataset: {columns_str}\n"
-                system_prompt += "You MUST use these exact column names (case-sensitive) in your expectations.\n"
+            # Create a more specific prompt for Great Expectations, with the available columns if provided
+            system_prompt = EXPECTATION_SYSTEM_PROMPT + columns_section
             
             system_prompt += "\nNatural language description:"
             full_prompt = f"{system_prompt}\n{prompt}"
             
-            # Generate response using Ollama
-            response = client.generate(
-                model=model_name,
-                prompt=full_prompt,
-                options={
-                    'temperature': 0.3,
-                    'top_p': 0.9,
-                    'num_predict': 200
-                }
-            )
+            options = {
+                'temperature': 0.3,
+                'top_p': 0.9,
+                'num_predict': 200
+            }
             
-            # Extract the response text
-            generated_code = response.get('response', '').strip()
+            if rate_limiter is not None:
+                rate_limiter.acquire()
             
-            # Clean up the response to extract just the code
-            if "```python" in generated_code:
-                generated_code = generated_code.split("```python")[1].split("```")[0].strip()
-            elif "```" in generated_code:
-                generated_code = generated_code.split("```")[1].split("```")[0].strip()
-            
-            # Additional cleaning: Extract only validator.expect_* lines
-            # This filters out reasoning/thinking text
-            lines = generated_code.split('\n')
-            validator_lines = []
-            
-            for line in lines:
-                line = line.strip()
-                # Only include lines that start with validator.expect_
-                # or are continuation lines (for multi-line expectations)
-                if line.startswith('validator.expect_'):
-                    validator_lines.append(line)
-                elif validator_lines and line and not any(keyword in line.lower() for keyword in 
-                    ['we need', 'actually', 'wait', 'so code:', 'but', 'output:', 'means', 'they\'d use', 'should use']):
-                    # This might be a continuation line (e.g., multi-line expectation)
-                    validator_lines.append(line)
+            if stream:
+                # Consume the token stream, stop as soon as the expectation lines are complete
+                generated_code = stream_expectation_code(client, model_name, full_prompt, options, on_partial)
+            else:
+                # Generate response using Ollama
+                response = client.generate(
+                    model=model_name,
+                    prompt=full_prompt,
+                    options=options
+                )
+                generated_code = response.get('response', '')
             
-            # If we found validator lines, use those
-            if validator_lines:
-                generated_code = '\n'.join(validator_lines)
+            # Extract the response text and keep only the expectation code
+            generated_code = clean_generated_code(generated_code)
             
-            # If the generated code still contains reasoning keywords, try to extract the last validator call
-            reasoning_keywords = ['we need to produce', 'actually', 'wait:', 'so code:', 'but the', 'means']
-            if any(keyword in generated_code.lower() for keyword in reasoning_keywords):
-                # Find all validator.expect_ patterns
-                import re
-                validator_pattern = r'validator\.expect_[a-z_]+\([^)]*\)'
-                matches = re.findall(validator_pattern, generated_code, re.IGNORECASE)
-                if matches:
-                    # Use the last complete match (usually the final answer)
-                    generated_code = '\n'.join(matches)
+            if key is not None:
+                try:
+                    expectation_cache.put(key, generated_code, model_name)
+                except Exception as e:
+                    print(f"Warning: Could not cache expectation code: {e}")
             
             return generated_code
             
@@ -175,31 +366,8 @@ def get_expectations(prompt, client=None, model_name=None, available_columns=Non
 
 def test_ollama_connection():
     """
-    Test the Ollama connection and return status
+    Test the Ollama connection and return status (a fresh check_ollama_health probe, no completion is run)
     Returns:
         dict: Connection status and model information
     """
-    try:
-        client = load_ollama_client()
-        model_name = os.getenv('OLLAMA_CLOUD_MODEL', 'gpt-oss:20b')
-        
-        # Test with a simple prompt
-        test_response = client.generate(
-            model=model_name,
-            prompt="Hello, are you working?",
-            options={'num_predict': 10}
-        )
-        
-        return {
-            'status': 'success',
-            'model': model_name,
-            'response': test_response['response'],
-            'message': 'Ollama connection successful'
-        }
-        
-    except Exception as e:
-        return {
-            'status': 'error',
-            'error': str(e),
-            'message': 'Ollama connection failed'
-        }
+    return check_ollama_health(force=True)
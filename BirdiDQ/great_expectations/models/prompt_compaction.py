@@ -0,0 +1,141 @@
+"""
+Prompt Compaction for Wide Tables
+=================================
+
+get_expectations lists the available columns in the prompt so the model uses
+exact names. For warehouse tables with hundreds of columns that list dominates
+the prompt, so only the columns most likely referenced by the request are sent
+(plus the total column count) once a table has more than PROMPT_MAX_COLUMNS.
+
+Columns are ranked by how well their name matches the request: the whole name
+written in the sentence ("customer_id" / "customer id"), then name tokens found
+as words (exact or fuzzy, "amounts" ~ "amount"), weighted by how rare the token
+is across the table so "id" or "date" do not pull in every column.
+"""
+
+import difflib
+import math
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Maximum number of columns listed in the generation prompt (0 disables compaction)
+PROMPT_MAX_COLUMNS = int(os.environ.get('PROMPT_MAX_COLUMNS', 40))
+# Similarity (0-1) a request word needs to count as a misspelled / inflected column token
+PROMPT_COLUMN_FUZZY_CUTOFF = float(os.environ.get('PROMPT_COLUMN_FUZZY_CUTOFF', 0.8))
+
+# Request words that never identify a column
+_STOPWORDS = {
+    'a', 'all', 'an', 'and', 'any', 'are', 'at', 'be', 'between', 'by', 'check', 'column', 'columns', 'contain',
+    'each', 'ensure', 'equal', 'every', 'for', 'from', 'greater', 'has', 'have', 'in', 'is', 'least', 'less',
+    'match', 'more', 'most', 'must', 'no', 'not', 'null', 'of', 'one', 'or', 'should', 'than', 'that', 'the',
+    'to', 'unique', 'value', 'values', 'with',
+}
+
+
+def name_tokens(name: str) -> List[str]:
+    """
+    Split a column name into lower case tokens (snake_case, camelCase, digits, spaces)
+    """
+    spaced = re.sub(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', ' ', str(name))
+    return [token.lower() for token in re.findall(r'[A-Za-z]+|\d+', spaced)]
+
+
+def _phrase(tokens: Sequence[str]) -> str:
+    return ' ' + ' '.join(tokens) + ' '
+
+
+@lru_cache(maxsize=16)
+def _column_index(columns: Tuple[str, ...]):
+    """Tokens of every column, token weights (inverse document frequency) and the token vocabulary"""
+    tokens = [name_tokens(column) for column in columns]
+    document_frequency: Dict[str, int] = {}
+    for column_tokens in tokens:
+        for token in set(column_tokens):
+            document_frequency[token] = document_frequency.get(token, 0) + 1
+    weights = {token: math.log(1 + len(columns) / count) for token, count in document_frequency.items()}
+    return tokens, weights, sorted(document_frequency)
+
+
+def rank_columns(prompt: str, available_columns: Sequence[str]) -> List[Tuple[str, float]]:
+    """
+    Score every column against the request
+
+    Returns:
+        (column, score) pairs with a positive score, best first (ties keep the table order)
+    """
+    columns = tuple(str(column) for column in available_columns)
+    tokens, weights, vocabulary = _column_index(columns)
+
+    prompt_tokens = name_tokens(prompt)
+    prompt_phrase = _phrase(prompt_tokens)
+    # Request word -> (column token, similarity), exact matches and close matches from the vocabulary
+    matched: Dict[str, float] = {}
+    for word in set(prompt_tokens) - _STOPWORDS:
+        if word in weights:
+            matched[word] = max(matched.get(word, 0.0), 1.0)
+        if len(word) < 4:
+            continue
+        for token in difflib.get_close_matches(word, vocabulary, n=3, cutoff=PROMPT_COLUMN_FUZZY_CUTOFF):
+            similarity = difflib.SequenceMatcher(None, word, token).ratio()
+            matched[token] = max(matched.get(token, 0.0), similarity)
+
+    scored = []
+    for position, (column, column_tokens) in enumerate(zip(columns, tokens)):
+        if not column_tokens:
+            continue
+        score = sum(weights[token] * matched[token] for token in set(column_tokens) if token in matched)
+        if score <= 0:
+            continue
+        # Every token matched: the column is most likely named in the request
+        if all(token in matched for token in column_tokens):
+            score *= 2
+        # Whole name written in order ("customer id" / "customer_id")
+        if _phrase(column_tokens) in prompt_phrase:
+            score += 10 * len(column_tokens)
+        scored.append((-score, position, column))
+    scored.sort()
+    return [(column, -negative_score) for negative_score, _, column in scored]
+
+
+def select_prompt_columns(prompt: str, available_columns: Optional[Sequence[str]],
+                          max_columns: Optional[int] = None) -> List[str]:
+    """
+    Pick the columns listed in the generation prompt
+
+    Args:
+        prompt: Natural language query
+        available_columns: Column names of the data asset
+        max_columns: Cap on the listed columns (None falls back to PROMPT_MAX_COLUMNS, 0 lists all)
+
+    Returns:
+        All columns for narrow tables, otherwise the best matching ones in table order
+        (the first max_columns columns when nothing matches)
+    """
+    columns = [str(column) for column in available_columns or ()]
+    max_columns = PROMPT_MAX_COLUMNS if max_columns is None else max_columns
+    if max_columns <= 0 or len(columns) <= max_columns:
+        return columns
+
+    selected = {column for column, _ in rank_columns(prompt, columns)[:max_columns]}
+    if not selected:
+        return columns[:max_columns]
+    return [column for column in columns if column in selected]
+
+
+def build_columns_section(prompt: str, available_columns: Optional[Sequence[str]],
+                          max_columns: Optional[int] = None) -> str:
+    """
+    Render the available columns part of the generation prompt (empty without columns)
+    """
+    if not available_columns:
+        return ''
+    columns = select_prompt_columns(prompt, available_columns, max_columns)
+    columns_str = ", ".join(f'"{col}"' for col in columns)
+    section = f"\n\nIMPORTANT - Available columns in this dataset: {columns_str}\n"
+    if len(columns) < len(available_columns):
+        section += (f"(The table has {len(available_columns)} columns, only the {len(columns)} "
+                    f"most relevant to the description are listed.)\n")
+    section += "You MUST use these exact column names (case-sensitive) in your expectations.\n"
+    return section
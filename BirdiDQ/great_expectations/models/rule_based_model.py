@@ -0,0 +1,249 @@
+"""
+Rule-Based Expectation Compiler
+===============================
+
+Deterministic fast path for common natural language checks ("X should not be
+null", "id should be unique", "amount between 0 and 100", ...). The prompt is
+split into clauses, each clause must name exactly one of the available columns
+and be fully explained by the rules below; otherwise the whole prompt is left
+to the LLM (get_expectations), so a check is never silently dropped.
+"""
+
+import json
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+_NUMBER = r'(-?\d+(?:\.\d+)?)'
+_QUOTED = r'["\']([^"\']*)["\']'
+
+# Words that carry no meaning for the rules ("the values in the X column should all be ...")
+_FILLER_WORDS = {
+    'a', 'all', 'always', 'an', 'and', 'any', 'are', 'be', 'check', 'column', 'columns', 'data', 'each',
+    'ensure', 'entries', 'entry', 'every', 'expect', 'field', 'for', 'has', 'have', 'i', 'in', 'is', 'it',
+    'its', 'make', 'number', 'numbers', 'of', 'only', 'please', 'record', 'records', 'row', 'rows', 'should',
+    'must', 'sure', 'that', 'the', 'to', 'value', 'values', 'verify', 'want', 'we', 'will', 'with',
+}
+
+
+def _number(text: str):
+    value = float(text)
+    return int(value) if value.is_integer() and '.' not in text else value
+
+
+def _format_call(expectation_type: str, column: str, **kwargs) -> str:
+    """Render one expectation call in the same style as the LLM output"""
+    arguments = [f'column={json.dumps(column)}']
+    for name, value in kwargs.items():
+        if name == 'regex' and '"' not in value and not value.endswith('\\'):
+            arguments.append(f'regex=r"{value}"')
+        elif isinstance(value, (str, list)):
+            arguments.append(f'{name}={json.dumps(value)}')
+        else:
+            arguments.append(f'{name}={value!r}')
+    return f"validator.{expectation_type}({', '.join(arguments)})"
+
+
+# (pattern, expectation type, kwargs builder), tried in order on the text left by earlier rules
+_RULES: List[Tuple[re.Pattern, str, callable]] = [
+    (re.compile(r'\b(?:does not|doesn\'t|should not|must not|not|never)\s+match(?:es)?\s+(?:the\s+)?(?:regex|pattern)\s+r?' + _QUOTED, re.IGNORECASE),
+     'expect_column_values_to_not_match_regex', lambda m: {'regex': m.group(1)}),
+    (re.compile(r'\bmatch(?:es)?\s+(?:the\s+)?(?:regex|pattern)\s+r?' + _QUOTED, re.IGNORECASE),
+     'expect_column_values_to_match_regex', lambda m: {'regex': m.group(1)}),
+    (re.compile(r'\b(?:one of|in the set|in set|among|in)\s*[\[\(\{]?\s*((?:' + _QUOTED + r'\s*,?\s*(?:or\s+)?)+)[\]\)\}]?', re.IGNORECASE),
+     'expect_column_values_to_be_in_set', lambda m: {'value_set': re.findall(_QUOTED, m.group(1))}),
+    (re.compile(r'\bbetween\s+' + _NUMBER + r'\s+(?:and|to)\s+' + _NUMBER, re.IGNORECASE),
+     'expect_column_values_to_be_between',
+     lambda m: {'min_value': _number(m.group(1)), 'max_value': _number(m.group(2))}),
+    (re.compile(r'\b(?:(?:not|never)\s+(?:be\s+)?(?:null|empty|missing|blank)s?|non[- ]?null|no\s+(?:null|missing|empty)\s*(?:values?)?'
+                r'|(?:not\s+)?contain\s+(?:any\s+)?(?:null|missing)s?(?:\s+values?)?|required|mandatory)\b', re.IGNORECASE),
+     'expect_column_values_to_not_be_null', lambda m: {}),
+    (re.compile(r'\b(?:null|empty|missing|blank)\b', re.IGNORECASE),
+     'expect_column_values_to_be_null', lambda m: {}),
+    (re.compile(r'\b(?:unique|distinct|no\s+duplicates?|not\s+(?:be\s+)?duplicated?|without\s+duplicates?)\b', re.IGNORECASE),
+     'expect_column_values_to_be_unique', lambda m: {}),
+    (re.compile(r'\bexists?\b', re.IGNORECASE),
+     'expect_column_to_exist', lambda m: {}),
+    (re.compile(r'(?:\bat least|\bno less than|\bgreater than or equal to|>=|\bnot (?:be )?(?:below|less than))\s*' + _NUMBER, re.IGNORECASE),
+     'expect_column_values_to_be_between', lambda m: {'min_value': _number(m.group(1))}),
+    (re.compile(r'(?:\bgreater than|\bmore than|\babove|\bover|\bexceeds?|>)\s*' + _NUMBER, re.IGNORECASE),
+     'expect_column_values_to_be_between', lambda m: {'min_value': _number(m.group(1)), 'strict_min': True}),
+    (re.compile(r'(?:\bat most|\bno more than|\bless than or equal to|<=|\bnot (?:be )?(?:above|greater than|more than)|\bnot exceed)\s*' + _NUMBER, re.IGNORECASE),
+     'expect_column_values_to_be_between', lambda m: {'max_value': _number(m.group(1))}),
+    (re.compile(r'(?:\bless than|\bbelow|\bunder|<)\s*' + _NUMBER, re.IGNORECASE),
+     'expect_column_values_to_be_between', lambda m: {'max_value': _number(m.group(1)), 'strict_max': True}),
+    (re.compile(r'\b(?:non[- ]?negative|zero or (?:more|positive))\b', re.IGNORECASE),
+     'expect_column_values_to_be_between', lambda m: {'min_value': 0}),
+    (re.compile(r'\bpositive\b', re.IGNORECASE),
+     'expect_column_values_to_be_between', lambda m: {'min_value': 0, 'strict_min': True}),
+]
+
+# "at least 80% of ..." applies `mostly` to the expectations of the clause
+_MOSTLY = re.compile(r'\b(?:at least\s+)?' + _NUMBER + r'\s*(?:%|percent)(?:\s+of)?', re.IGNORECASE)
+# Expectations that do not accept `mostly`
+_NO_MOSTLY = {'expect_column_to_exist'}
+# Bounds of the same column are merged into one call, the suite keeps only one expectation per type and column
+_BETWEEN = 'expect_column_values_to_be_between'
+
+
+def _merge_bounds(calls: List[Tuple[str, str, Dict]]) -> Optional[List[Tuple[str, str, Dict]]]:
+    """
+    Combine the between calls of each column ("less than 100 and greater than 0") into one call
+    Returns None when the bounds contradict each other (e.g. two different minimums)
+    """
+    merged, between = [], {}
+    for expectation_type, column, kwargs in calls:
+        if expectation_type != _BETWEEN:
+            merged.append((expectation_type, column, kwargs))
+            continue
+        if column not in between:
+            between[column] = dict(kwargs)
+            merged.append((expectation_type, column, between[column]))
+            continue
+        combined = between[column]
+        for name, value in kwargs.items():
+            if name in combined and combined[name] != value:
+                return None
+            combined[name] = value
+    return merged
+
+
+class RuleBasedCompiler():
+    """
+    Pattern-based natural language -> expectation compiler with hit ratio statistics
+    """
+    def __init__(self):
+        """
+        Init class attributes
+        """
+        self.stats = {'hits': 0, 'misses': 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _column_patterns(available_columns: Sequence[str]) -> List[Tuple[re.Pattern, str]]:
+        """Ways a column can be written in a prompt (exact, lower case, underscores as spaces), longest first"""
+        variants = {}
+        for column in available_columns:
+            for variant in {column.lower(), column.lower().replace('_', ' ')}:
+                variants.setdefault(variant, column)
+        return [
+            (re.compile(r'(?<![\w])' + re.escape(variant) + r'(?![\w])', re.IGNORECASE), column)
+            for variant, column in sorted(variants.items(), key=lambda item: -len(item[0]))
+        ]
+
+    @staticmethod
+    def _split_clauses(prompt: str, column_patterns) -> List[str]:
+        """Split on sentence separators and 'and', re-joining fragments without a column ('between 0 and 100')"""
+        spans, start = [], 0
+        for separator in re.finditer(r'[;\n,]|\.(?=\s|$)|\s+(?:and|also|as well as)\s+', prompt, re.IGNORECASE):
+            spans.append((start, separator.start()))
+            start = separator.end()
+        spans.append((start, len(prompt)))
+
+        clauses = []
+        for start, end in spans:
+            fragment = prompt[start:end]
+            if not fragment.strip():
+                continue
+            has_column = any(pattern.search(fragment) for pattern, _ in column_patterns)
+            if clauses and not has_column:
+                # Keep the original text (and separator) so the fragment reads as part of the previous clause
+                clauses[-1] = (clauses[-1][0], end)
+            else:
+                clauses.append((start, end))
+        return [prompt[start:end].strip() for start, end in clauses]
+
+    def _compile_clause(self, clause: str, column_patterns) -> Optional[List[Tuple[str, str, Dict]]]:
+        columns, text = set(), clause
+        for pattern, column in column_patterns:
+            if pattern.search(text):
+                columns.add(column)
+                text = pattern.sub(' ', text)
+        if len(columns) != 1:
+            return None
+        column = columns.pop()
+
+        mostly = None
+        mostly_match = _MOSTLY.search(text)
+        if mostly_match:
+            mostly = _number(mostly_match.group(1)) / 100
+            text = text[:mostly_match.start()] + ' ' + text[mostly_match.end():]
+
+        calls = []
+        for pattern, expectation_type, build_kwargs in _RULES:
+            match = pattern.search(text)
+            if match is None:
+                continue
+            kwargs = build_kwargs(match)
+            if mostly is not None and expectation_type not in _NO_MOSTLY:
+                kwargs['mostly'] = mostly
+            calls.append((expectation_type, column, kwargs))
+            text = text[:match.start()] + ' ' + text[match.end():]
+
+        # Everything else in the clause must be filler, otherwise the meaning is not fully understood
+        leftover = [word for word in re.findall(r"[\w']+|[^\w\s]", text) if word.lower() not in _FILLER_WORDS]
+        if not calls or leftover:
+            return None
+        return calls
+
+    def compile(self, prompt: str, available_columns: Optional[Sequence[str]]) -> Optional[str]:
+        """
+        Translate a natural language request into expectation code
+
+        Args:
+            prompt: Natural language query
+            available_columns: Column names of the data asset
+
+        Returns:
+            Expectation code (one expectation per line), or None when the LLM is needed
+        """
+        code = None
+        if prompt and available_columns:
+            column_patterns = self._column_patterns(available_columns)
+            # Hide quoted values while splitting, so "one of 'a', 'b'" stays one clause
+            quoted = []
+            masked = re.sub(_QUOTED, lambda m: quoted.append(m.group(0)) or f"\x00{len(quoted) - 1}\x00", prompt)
+            calls = []
+            for clause in self._split_clauses(masked, column_patterns):
+                clause = re.sub(r'\x00(\d+)\x00', lambda m: quoted[int(m.group(1))], clause)
+                clause_calls = self._compile_clause(clause, column_patterns)
+                if clause_calls is None:
+                    calls = None
+                    break
+                calls.extend(clause_calls)
+            calls = _merge_bounds(calls) if calls else None
+            if calls:
+                lines = [_format_call(expectation_type, column, **kwargs) for expectation_type, column, kwargs in calls]
+                code = '\n'.join(dict.fromkeys(lines))
+
+        with self._lock:
+            self.stats['hits' if code else 'misses'] += 1
+        return code
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Return fast path hit and miss counts and hit ratio
+        """
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+# Shared compiler for the app
+rule_based_compiler = RuleBasedCompiler()
+
+
+def compile_expectations(prompt: str, available_columns: Optional[Sequence[str]]) -> Optional[str]:
+    """
+    Try the rule-based fast path (see RuleBasedCompiler.compile), None means use get_expectations
+    """
+    return rule_based_compiler.compile(prompt, available_columns)
+
+
+def fast_path_stats() -> Dict[str, float]:
+    """
+    Return hit ratio statistics of the shared compiler
+    """
+    return rule_based_compiler.get_stats()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Local Ollama stand-in server for offline benchmarking
+Implements the parts of the Ollama HTTP API used by BirdiDQ (standard library only):
+
+    POST /api/generate   streaming (NDJSON) and non-streaming completions
+    GET  /api/tags       model list (used by the app's health probe)
+    GET  /stub/stats     request, token and cancelled stream counts
+
+Responses come from, in order: recorded responses (--replay), canned responses
+(--responses, first matching entry wins) and a built-in default that answers the
+NL->expectation prompt with validator.expect_* lines for the listed columns.
+With --record, requests are forwarded to a real Ollama endpoint (--upstream) and
+the responses are saved for later replay.
+
+Usage:
+    python ollama_stub_server.py [--port 11434] [--latency 0.5] [--tokens-per-second 50] [--prompt-tokens-per-second 500]
+    python ollama_stub_server.py --responses canned.json
+    python ollama_stub_server.py --record recordings.json --upstream https://ollama.com
+    python ollama_stub_server.py --replay recordings.json
+
+    Then point the app at it: OLLAMA_CLOUD_BASE_URL=http://127.0.0.1:11434
+    (the reporting pipeline uses ollama_config.local_url / cloud_url)
+
+canned.json:
+    [{"match": "should not be null", "response": "validator.expect_column_values_to_not_be_null(column=\"id\")"},
+     {"match": "", "response": "fallback text"}]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+import urllib.request
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+DEFAULT_MODEL = "gpt-oss:20b"
+
+
+def prompt_key(prompt):
+    """Key of a recorded response (the model is ignored so recordings replay with any model name)"""
+    return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+
+
+def tokenize(text):
+    """Split text into ~4 character tokens like a BPE tokenizer (tokens join back to the text)"""
+    return re.findall(r'\s*\S{1,4}|\s+', text)
+
+
+def default_response(prompt):
+    """Built-in response: expectation code for the NL->expectation prompt, a short report otherwise"""
+    if 'validator.expect_' not in prompt:
+        return ("## Data Quality Analysis\n\nOverall data quality is good. A small number of expectation "
+                "types fail regularly and should be reviewed first.\n\n1. Fix the failing suites.\n"
+                "2. Add null checks to key columns.\n3. Re-run the validations weekly.\n")
+    columns_match = re.search(r'Available columns in this dataset: (.+)', prompt)
+    columns = re.findall(r'"([^"]+)"', columns_match.group(1)) if columns_match else []
+    if not columns:
+        return "validator.expect_table_row_count_to_be_between(min_value=1)"
+    return '\n'.join(f'validator.expect_column_values_to_not_be_null(column="{column}")' for column in columns[:3])
+
+
+class OllamaStubServer():
+    """
+    Ollama API stand-in, usable from the command line or in-process (start/stop) in benchmarks
+    """
+    def __init__(self, host='127.0.0.1', port=11434, latency=0.0, tokens_per_second=0.0,
+                 responses=None, replay=None, record=None, upstream=None, api_key=None, model=DEFAULT_MODEL,
+                 prompt_tokens_per_second=0.0):
+        """
+        Init class attributes
+
+        Args:
+            latency: Seconds before the first token (time to first token)
+            tokens_per_second: Generation speed, 0 sends all tokens at once
+            responses: Canned responses, list of {"match": substring, "response": text}
+            replay: JSON file of recorded responses to serve
+            record: JSON file recorded responses are written to (requires upstream)
+            upstream: Real Ollama base URL used in record mode
+            api_key: Bearer token for the upstream (defaults to the incoming Authorization header)
+            model: Model name listed by /api/tags
+            prompt_tokens_per_second: Prompt processing speed, adds prompt length dependent time to
+                the first token (0 disables)
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.prompt_tokens_per_second = prompt_tokens_per_second
+        self.responses = responses or []
+        self.record_path = Path(record) if record else None
+        self.upstream = upstream.rstrip('/') if upstream else None
+        self.api_key = api_key
+        self.model = model
+        self.recordings = {}
+        for path in (replay, record):
+            if path and Path(path).exists():
+                self.recordings.update(json.loads(Path(path).read_text()))
+        self.stats = {'requests': 0, 'streamed': 0, 'cancelled': 0, 'tokens_sent': 0, 'prompt_tokens': 0,
+                      'replayed': 0, 'recorded': 0, 'canned': 0, 'default': 0}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self.stats[name] += amount
+
+    def _forward(self, body, authorization):
+        """Send the request to the upstream Ollama (non-streaming) and return the response text"""
+        headers = {'Content-Type': 'application/json'}
+        if self.api_key:
+            headers['Authorization'] = f"Bearer {self.api_key}"
+        elif authorization:
+            headers['Authorization'] = authorization
+        request = urllib.request.Request(
+            f"{self.upstream}/api/generate",
+            data=json.dumps({**body, 'stream': False}).encode('utf-8'),
+            headers=headers,
+        )
+        with urllib.request.urlopen(request, timeout=600) as response:
+            return json.loads(response.read())['response']
+
+    def resolve_response(self, body, authorization=None):
+        """Pick the response text for a generate request"""
+        prompt = body.get('prompt', '')
+        key = prompt_key(prompt)
+        if key in self.recordings:
+            self._count('replayed')
+            return self.recordings[key]['response']
+        if self.upstream and self.record_path:
+            text = self._forward(body, authorization)
+            with self._lock:
+                self.recordings[key] = {'model': body.get('model'), 'prompt': prompt, 'response': text}
+                self.record_path.write_text(json.dumps(self.recordings, indent=2))
+                self.stats['recorded'] += 1
+            return text
+        for entry in self.responses:
+            if entry.get('match', '') in prompt:
+                self._count('canned')
+                return entry['response']
+        self._count('default')
+        return default_response(prompt)
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, payload, status=200):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path == '/api/tags':
+                    self._send_json({'models': [{'name': stub.model, 'model': stub.model,
+                                                 'modified_at': datetime.now(timezone.utc).isoformat(),
+                                                 'size': 0, 'digest': prompt_key(stub.model), 'details': {}}]})
+                elif self.path == '/stub/stats':
+                    with stub._lock:
+                        self._send_json(dict(stub.stats))
+                else:
+                    self._send_json({'error': 'not found'}, status=404)
+
+            def do_POST(self):
+                if self.path != '/api/generate':
+                    self._send_json({'error': 'not found'}, status=404)
+                    return
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+                stub._count('requests')
+                start = time.perf_counter()
+                try:
+                    text = stub.resolve_response(body, self.headers.get('Authorization'))
+                except Exception as e:
+                    self._send_json({'error': f"upstream error: {e}"}, status=502)
+                    return
+
+                prompt_tokens = len(tokenize(body.get('prompt', '')))
+                stub._count('prompt_tokens', prompt_tokens)
+                tokens = tokenize(text)
+                num_predict = (body.get('options') or {}).get('num_predict')
+                if num_predict and num_predict > 0:
+                    tokens = tokens[:num_predict]
+                model = body.get('model', stub.model)
+                delay = 1.0 / stub.tokens_per_second if stub.tokens_per_second else 0.0
+                prefill = prompt_tokens / stub.prompt_tokens_per_second if stub.prompt_tokens_per_second else 0.0
+                time.sleep(stub.latency + prefill)
+
+                def chunk(response, done):
+                    payload = {'model': model, 'created_at': datetime.now(timezone.utc).isoformat(),
+                               'response': response, 'done': done}
+                    if done:
+                        payload.update({'done_reason': 'stop', 'eval_count': len(tokens),
+                                        'prompt_eval_count': prompt_tokens,
+                                        'total_duration': int((time.perf_counter() - start) * 1e9)})
+                    return payload
+
+                if not body.get('stream', True):
+                    time.sleep(delay * len(tokens))
+                    stub._count('tokens_sent', len(tokens))
+                    self._send_json(chunk(''.join(tokens), True))
+                    return
+
+                # NDJSON stream with chunked transfer encoding, one token per line
+                stub._count('streamed')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/x-ndjson')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                try:
+                    for token in tokens:
+                        self._write_chunk(chunk(token, False))
+                        stub._count('tokens_sent')
+                        time.sleep(delay)
+                    self._write_chunk(chunk('', True))
+                    self.wfile.write(b'0\r\n\r\n')
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client closed the stream early (e.g. the app's early exit)
+                    stub._count('cancelled')
+                    self.close_connection = True
+
+            def _write_chunk(self, payload):
+                data = (json.dumps(payload) + '\n').encode('utf-8')
+                self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b'\r\n')
+                self.wfile.flush()
+
+        return Handler
+
+    def start(self):
+        """Serve on a background thread (in-process use)"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Ollama stand-in server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=11434)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds before the first token')
+    parser.add_argument('--tokens-per-second', type=float, default=0.0, help='Generation speed (0 = instant)')
+    parser.add_argument('--prompt-tokens-per-second', type=float, default=0.0,
+                        help='Prompt processing speed (0 = instant)')
+    parser.add_argument('--responses', help='JSON file of canned responses')
+    parser.add_argument('--replay', help='JSON file of recorded responses to serve')
+    parser.add_argument('--record', help='Record upstream responses to this JSON file')
+    parser.add_argument('--upstream', help='Real Ollama base URL for record mode (e.g. https://ollama.com)')
+    parser.add_argument('--api-key', help='Bearer token for the upstream')
+    parser.add_argument('--model', default=DEFAULT_MODEL, help='Model name listed by /api/tags')
+    args = parser.parse_args()
+
+    if args.record and not args.upstream:
+        parser.error('--record requires --upstream')
+
+    responses = json.loads(Path(args.responses).read_text()) if args.responses else None
+    stub = OllamaStubServer(args.host, args.port, args.latency, args.tokens_per_second, responses,
+                            args.replay, args.record, args.upstream, args.api_key, args.model,
+                            args.prompt_tokens_per_second)
+    print(f"✓ Ollama stub listening on {stub.url}")
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == "__main__":
+    main()
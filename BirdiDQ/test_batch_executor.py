@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script for the batched expectation executor
+"""
+
+import sys
+sys.path.append('great_expectations')
+
+import pandas as pd
+import great_expectations as gx
+from great_expectations.data_context.types.base import DataContextConfig, InMemoryStoreBackendDefaults
+
+from helpers.batch_executor import BatchExpectationExecutor
+
+PASSING = 'validator.expect_column_values_to_not_be_null(column="amount")'
+FAILING = 'validator.expect_column_values_to_be_between(column="amount", min_value=0, max_value=1)'
+METRIC_ERROR = 'validator.expect_column_mean_to_be_between(column="status", min_value=0, max_value=10)'
+
+def ephemeral_validator(df):
+    """Validator on an in-memory context with a pandas dataframe asset and an empty suite"""
+    context = gx.get_context(project_config=DataContextConfig(store_backend_defaults=InMemoryStoreBackendDefaults()))
+    asset = context.sources.add_pandas("p").add_dataframe_asset(name="a")
+    context.add_or_update_expectation_suite(expectation_suite_name="s")
+    return context.get_validator(batch_request=asset.build_batch_request(dataframe=df), expectation_suite_name="s")
+
+def test_accepted_and_failed_lines():
+    """Evaluated lines are kept whatever their outcome, lines whose metrics raise are reported as failed"""
+    df = pd.DataFrame({"amount": [1, 2, 3], "status": ["Paid", "Open", "Void"]})
+    validator = ephemeral_validator(df)
+    report = BatchExpectationExecutor(validator, execution_engine="Pandas", columns=list(df.columns)).run(
+        [PASSING, FAILING, METRIC_ERROR])
+
+    assert report['lines'] == [PASSING, FAILING], report
+    assert [result.success for result in report['results']] == [True, False]
+
+    assert [failure['line'] for failure in report['failed']] == [METRIC_ERROR]
+    assert report['failed'][0]['error'] and report['failed'][0]['traceback']
+
+    suite_types = [e.expectation_type for e in validator.expectation_suite.expectations]
+    assert suite_types == ['expect_column_values_to_not_be_null', 'expect_column_values_to_be_between']
+    print(f"✅ {len(report['lines'])} lines accepted, metric error reported: {report['failed'][0]['error'][:80]}")
+    return True
+
+if __name__ == "__main__":
+    print("🧪 Testing batched expectation executor")
+    print("=" * 50)
+    success = all([test_accepted_and_failed_lines()])
+    sys.exit(0 if success else 1)
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test script for the expectation code cache
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('great_expectations')
+
+from models.expectation_cache import ExpectationCache, cache_key
+
+def test_cache_key():
+    """Formatting and column order do not change the key, model and columns do"""
+    key = cache_key("amount  should be\n positive", "gpt-oss:20b", ["b", "a"])
+    assert key == cache_key(" amount should be positive ", "gpt-oss:20b", ["a", "b"])
+    assert key != cache_key("amount should be positive", "llama3", ["a", "b"])
+    assert key != cache_key("amount should be positive", "gpt-oss:20b", ["a", "c"])
+    print("✅ Cache keys normalize the prompt and columns")
+    return True
+
+def test_hits_misses_and_eviction():
+    """Repeat lookups hit, least recently used entries are evicted above the size cap"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ExpectationCache(path=str(Path(tmp) / 'cache.sqlite'), max_entries=2)
+        assert cache.get("k1") is None
+        cache.put("k1", "validator.expect_column_to_exist(column=\"a\")", "m")
+        cache.put("k2", "validator.expect_column_to_exist(column=\"b\")", "m")
+        assert cache.get("k1") is not None  # k1 is now more recent than k2
+        cache.put("k3", "validator.expect_column_to_exist(column=\"c\")", "m")
+        assert cache.get("k2") is None
+        assert cache.get("k1") is not None and cache.get("k3") is not None
+
+        stats = cache.get_stats()
+        assert stats['entries'] == 2 and stats['evictions'] == 1
+        assert stats['hits'] == 3 and stats['misses'] == 2
+        print(f"✅ Cache stats: {stats}")
+    return True
+
+if __name__ == "__main__":
+    print("🧪 Testing expectation cache")
+    print("=" * 50)
+    success = all([test_cache_key(), test_hits_misses_and_eviction()])
+    sys.exit(0 if success else 1)
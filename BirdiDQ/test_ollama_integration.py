@@ -22,7 +22,6 @@ def test_ollama_integration():
     if connection_result['status'] == 'success':
         print(f"✅ Connection successful!")
         print(f"   Model: {connection_result['model']}")
-        print(f"   Response: {connection_result['response']}")
     else:
         print(f"❌ Connection failed: {connection_result['error']}")
         print("   Please check your .env file and OLLAMA_API_KEY")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test script for prompt compaction on wide tables
+"""
+
+import sys
+sys.path.append('great_expectations')
+
+from models.prompt_compaction import build_columns_section, name_tokens, select_prompt_columns
+
+COLUMNS = [f"{entity}_{attribute}" for entity in ["customer", "order", "invoice", "payment"]
+           for attribute in ["id", "name", "amount", "status", "created_at", "country_code"]]
+COLUMNS += ["TransactionDate", "customerSegment"] + [f"measure_{i:03d}" for i in range(200)]
+
+def test_name_tokens():
+    """snake_case, camelCase and digits are split into lower case tokens"""
+    assert name_tokens("customer_id") == ["customer", "id"]
+    assert name_tokens("TransactionDate") == ["transaction", "date"]
+    assert name_tokens("HTTPStatusCode2") == ["http", "status", "code", "2"]
+    print("✅ Column names are tokenized")
+    return True
+
+def test_selects_referenced_columns():
+    """Referenced columns are kept (exact, spaced, fuzzy, camelCase), the cap is respected"""
+    cases = {
+        "customer_id should be unique": ["customer_id"],
+        "order amount should be greater than 0": ["order_amount"],
+        "at least 95% of invoice country codes should not be null": ["invoice_country_code"],
+        "the transaction date and customer segment should not be null": ["TransactionDate", "customerSegment"],
+        "measure_042 should be between 0 and 1": ["measure_042"],
+    }
+    for prompt, referenced in cases.items():
+        selected = select_prompt_columns(prompt, COLUMNS, max_columns=5)
+        assert len(selected) <= 5, (prompt, selected)
+        assert all(column in selected for column in referenced), (prompt, selected)
+    print(f"✅ Referenced columns selected for {len(cases)} prompts")
+    return True
+
+def test_narrow_tables_and_section():
+    """Narrow tables are listed in full, compacted prompts mention the total column count"""
+    assert select_prompt_columns("anything", COLUMNS[:10], max_columns=40) == COLUMNS[:10]
+    assert select_prompt_columns("anything", COLUMNS, max_columns=0) == COLUMNS
+    assert select_prompt_columns("nothing relevant here", COLUMNS, max_columns=3) == COLUMNS[:3]
+    section = build_columns_section("order status should not be null", COLUMNS, max_columns=3)
+    assert '"order_status"' in section and f"has {len(COLUMNS)} columns" in section
+    assert '"measure_000"' not in section
+    assert build_columns_section("order status", None) == ''
+    print("✅ Narrow tables are not compacted")
+    return True
+
+if __name__ == "__main__":
+    print("🧪 Testing prompt compaction")
+    print("=" * 50)
+    success = all([test_name_tokens(), test_selects_referenced_columns(), test_narrow_tables_and_section()])
+    sys.exit(0 if success else 1)
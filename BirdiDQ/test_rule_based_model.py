@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for the rule-based expectation fast path
+"""
+
+import ast
+import sys
+sys.path.append('great_expectations')
+
+from models.rule_based_model import RuleBasedCompiler
+
+COLUMNS = ["transaction_id", "customer_id", "amount", "status", "email", "created_at"]
+
+def calls(code):
+    """Parse generated code into (expectation type, kwargs) pairs"""
+    parsed = []
+    for line in code.splitlines():
+        call = ast.parse(line.strip(), mode='eval').body
+        parsed.append((call.func.attr, {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}))
+    return parsed
+
+def test_common_phrasings():
+    """Common checks compile to the expected expectation calls"""
+    compiler = RuleBasedCompiler()
+    cases = {
+        "transaction_id should not be null": [
+            ('expect_column_values_to_not_be_null', {'column': 'transaction_id'})],
+        "Transaction ID must be unique": [
+            ('expect_column_values_to_be_unique', {'column': 'transaction_id'})],
+        "amount should be between 0 and 100": [
+            ('expect_column_values_to_be_between', {'column': 'amount', 'min_value': 0, 'max_value': 100})],
+        "amount greater than 0 and customer_id is required": [
+            ('expect_column_values_to_be_between', {'column': 'amount', 'min_value': 0, 'strict_min': True}),
+            ('expect_column_values_to_not_be_null', {'column': 'customer_id'})],
+        "amount should be less than 100 and greater than 0": [
+            ('expect_column_values_to_be_between', {'column': 'amount', 'min_value': 0, 'strict_min': True,
+                                                    'max_value': 100, 'strict_max': True})],
+        "amount should be at least 1. amount should be at most 50": [
+            ('expect_column_values_to_be_between', {'column': 'amount', 'min_value': 1, 'max_value': 50})],
+        "at least 95% of email values should not be null": [
+            ('expect_column_values_to_not_be_null', {'column': 'email', 'mostly': 0.95})],
+        "status should be one of 'Paid', 'Open, pending', 'Void'": [
+            ('expect_column_values_to_be_in_set', {'column': 'status', 'value_set': ['Paid', 'Open, pending', 'Void']})],
+        "email should match the regex '^[^@]+@[^@]+$'": [
+            ('expect_column_values_to_match_regex', {'column': 'email', 'regex': '^[^@]+@[^@]+$'})],
+    }
+    for prompt, expected in cases.items():
+        code = compiler.compile(prompt, COLUMNS)
+        assert code is not None, prompt
+        assert calls(code) == expected, (prompt, code)
+    print(f"✅ {len(cases)} phrasings compiled by rules")
+    return True
+
+def test_falls_back_to_llm():
+    """Anything not fully understood is left to the LLM"""
+    compiler = RuleBasedCompiler()
+    for prompt in [
+        "amount should be roughly normally distributed",      # no rule
+        "amount should be greater than customer_id",          # two columns in one clause
+        "discount should not be null",                        # unknown column
+        "status should not be null and amount looks weird",   # one clause not understood
+        "amount should be at least 5 and amount should be positive",  # contradicting minimums
+    ]:
+        assert compiler.compile(prompt, COLUMNS) is None, prompt
+    assert compiler.compile("amount should be positive", None) is None
+    print("✅ Unsupported prompts fall back to the LLM")
+    return True
+
+def test_hit_ratio():
+    """Hits and misses are counted per prompt"""
+    compiler = RuleBasedCompiler()
+    compiler.compile("amount should be positive", COLUMNS)
+    compiler.compile("status should not be null", COLUMNS)
+    compiler.compile("amount should look reasonable", COLUMNS)
+    stats = compiler.get_stats()
+    assert stats['hits'] == 2 and stats['misses'] == 1
+    assert abs(stats['hit_ratio'] - 2 / 3) < 1e-9
+    print(f"✅ Fast path stats: {stats}")
+    return True
+
+if __name__ == "__main__":
+    print("🧪 Testing rule-based expectation fast path")
+    print("=" * 50)
+    success = all([test_common_phrasings(), test_falls_back_to_llm(), test_hit_ratio()])
+    sys.exit(0 if success else 1)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test script for mapping single-pass checkpoint results back onto submitted lines
+"""
+
+import sys
+sys.path.append('great_expectations')
+
+import pandas as pd
+import great_expectations as gx
+from great_expectations.data_context.types.base import DataContextConfig, InMemoryStoreBackendDefaults
+
+from helpers.batch_executor import BatchExpectationExecutor
+from helpers.validation_results import expectation_key, map_checkpoint_results
+
+LINES = [
+    'validator.expect_column_values_to_not_be_null(column="a")',
+    'validator.expect_column_values_to_be_between(column="a", min_value=0, max_value=1)',
+]
+
+def ephemeral_validator(df):
+    """In-memory context with a pandas dataframe asset and an empty suite"""
+    context = gx.get_context(project_config=DataContextConfig(store_backend_defaults=InMemoryStoreBackendDefaults()))
+    asset = context.sources.add_pandas("p").add_dataframe_asset(name="a")
+    batch_request = asset.build_batch_request(dataframe=df)
+    context.add_or_update_expectation_suite(expectation_suite_name="s")
+    validator = context.get_validator(batch_request=batch_request, expectation_suite_name="s")
+    return context, validator, batch_request
+
+def test_key_ignores_batch_id():
+    """Results carrying the validator's batch_id match the configuration they were built from"""
+    _, validator, _ = ephemeral_validator(pd.DataFrame({"a": [1, 2, 3]}))
+    executor = BatchExpectationExecutor(validator, execution_engine="Pandas")
+    configuration = executor.parse_line(LINES[0])
+    result = validator.graph_validate(configurations=[configuration])[0]
+    assert 'batch_id' in result.expectation_config.kwargs
+    assert expectation_key(result.expectation_config) == expectation_key(configuration)
+    print("✅ batch_id is not part of the expectation key")
+    return True
+
+def test_single_pass_results_mapped():
+    """Placeholder results are replaced by the checkpoint's validated results, in submission order"""
+    context, validator, batch_request = ephemeral_validator(pd.DataFrame({"a": [1, 2, 3]}))
+    report = BatchExpectationExecutor(validator, execution_engine="Pandas").run(LINES, evaluate=False)
+    assert [result.success for result in report['results']] == [None, None]
+    validator.save_expectation_suite(discard_failed_expectations=False)
+
+    context.add_or_update_checkpoint(name="c", class_name="SimpleCheckpoint")
+    checkpoint_result = context.run_checkpoint(
+        checkpoint_name="c",
+        validations=[{"batch_request": batch_request, "expectation_suite_name": "s"}],
+    )
+    results = map_checkpoint_results(checkpoint_result, report['results'])
+    assert [result.success for result in results] == [True, False]
+    assert [result.expectation_config.expectation_type for result in results] == [
+        'expect_column_values_to_not_be_null', 'expect_column_values_to_be_between']
+    print("✅ Checkpoint results mapped onto the submitted lines")
+    return True
+
+if __name__ == "__main__":
+    print("🧪 Testing single-pass result mapping")
+    print("=" * 50)
+    success = all([test_key_ignores_batch_id(), test_single_pass_results_mapped()])
+    sys.exit(0 if success else 1)
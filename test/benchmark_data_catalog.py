@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmark data catalog generation on synthetic validation results
+Compares the previous per-file / per-column loop implementation of
+DataReportingPipeline.generate_data_catalog with the groupby version, checks
+that both produce the same catalog JSON and prints the wall time of both.
+
+Usage:
+    python benchmark_data_catalog.py [--results 100000] [--columns 2000] [--assets 20]
+"""
+
+import argparse
+import json
+import logging
+import random
+import time
+
+from data_reporting_pipeline import DataReportingPipeline
+
+EXPECTATION_TYPES = [
+    "expect_column_values_to_not_be_null",
+    "expect_column_values_to_be_unique",
+    "expect_column_values_to_be_between",
+    "expect_column_values_to_be_in_set",
+    "expect_column_values_to_match_regex",
+    "expect_column_mean_to_be_between",
+    "expect_table_row_count_to_be_between",
+    "expect_table_columns_to_match_ordered_list",
+]
+
+
+def synthetic_validation_files(results: int, columns: int, assets: int, results_per_file: int = 200,
+                               suites: int = 10, seed: int = 7):
+    """Validation file records (pipeline file_info layout) spread over assets, suites and columns"""
+    rng = random.Random(seed)
+    columns_per_asset = max(1, columns // assets)
+    validation_files = []
+    for index in range(max(1, results // results_per_file)):
+        asset = f"asset_{index % assets:02d}"
+        suite = f"suite_{rng.randrange(suites):02d}"
+        timestamp = f"2024-{1 + index % 12:02d}-{1 + index % 28:02d}T00:00:00"
+        file_results = []
+        for _ in range(results_per_file):
+            expectation_type = rng.choice(EXPECTATION_TYPES)
+            kwargs = {} if expectation_type.startswith("expect_table") else {
+                "column": f"{asset}_col_{rng.randrange(columns_per_asset):04d}"}
+            raised = rng.random() < 0.02
+            file_results.append({
+                "success": not raised and rng.random() < 0.9,
+                "expectation_config": {"expectation_type": expectation_type, "kwargs": kwargs, "meta": {}},
+                "exception_info": {"raised_exception": raised, "exception_message": "boom" if raised else ""},
+                "result": {},
+            })
+        validation_files.append({
+            "file_path": f"validations/{suite}/{index:05d}.json",
+            "data": {
+                "meta": {
+                    "active_batch_definition": {"data_asset_name": asset, "datasource_name": "warehouse",
+                                                "data_connector_name": "default_inferred_data_connector_name"},
+                    "batch_spec": {"type": "table", "table_name": asset, "schema_name": "public"},
+                },
+                "results": file_results,
+            },
+            "timestamp": timestamp,
+            "suite_name": suite,
+            "run_id": f"run_{index:05d}",
+            "data_asset": asset,
+        })
+    return validation_files
+
+
+def legacy_generate_data_catalog(self):
+    """generate_data_catalog before the groupby rewrite (loops over every file, result and column)"""
+    catalog = {
+        "metadata": {
+            "generated_on": "",
+            "total_validation_files": len(self.validation_files),
+            "analysis_period": f"{self.df['timestamp'].min()} to {self.df['timestamp'].max()}",
+            "great_expectations_version": "0.18.22"
+        },
+        "data_assets": {},
+        "expectation_suites": {},
+        "data_quality_summary": {
+            "overall_success_rate": self.quality_metrics['overall_success_rate'],
+            "exception_rate": self.quality_metrics['exception_rate'],
+            "total_expectations": len(self.df)
+        }
+    }
+
+    for file_info in self.validation_files:
+        data = file_info['data']
+        suite_name = file_info['suite_name']
+        data_asset = file_info['data_asset']
+
+        batch_def = data.get('meta', {}).get('active_batch_definition', {})
+        batch_spec = data.get('meta', {}).get('batch_spec', {})
+
+        if data_asset not in catalog["data_assets"]:
+            catalog["data_assets"][data_asset] = {
+                "name": data_asset,
+                "type": batch_spec.get('type', 'unknown'),
+                "table_name": batch_spec.get('table_name', ''),
+                "schema_name": batch_spec.get('schema_name', ''),
+                "datasource": batch_def.get('datasource_name', ''),
+                "data_connector": batch_def.get('data_connector_name', ''),
+                "validation_runs": [],
+                "columns": {},
+                "expectation_suites": []
+            }
+
+        run_info = {
+            "run_id": file_info['run_id'],
+            "timestamp": file_info['timestamp'],
+            "suite_name": suite_name,
+            "expectation_count": len(data.get('results', [])),
+            "success_rate": sum(1 for r in data.get('results', []) if r.get('success', False)) / len(data.get('results', [])) if data.get('results') else 0
+        }
+
+        catalog["data_assets"][data_asset]["validation_runs"].append(run_info)
+
+        if suite_name not in catalog["data_assets"][data_asset]["expectation_suites"]:
+            catalog["data_assets"][data_asset]["expectation_suites"].append(suite_name)
+
+        for result in data.get('results', []):
+            expectation_config = result.get('expectation_config', {})
+            column = expectation_config.get('kwargs', {}).get('column', 'table-level')
+
+            if column != 'table-level' and column not in catalog["data_assets"][data_asset]["columns"]:
+                catalog["data_assets"][data_asset]["columns"][column] = {
+                    "name": column,
+                    "expectation_types": [],
+                    "quality_metrics": {
+                        "total_expectations": 0,
+                        "successful_expectations": 0,
+                        "success_rate": 0.0,
+                        "exceptions": 0
+                    }
+                }
+
+            if column != 'table-level':
+                exp_type = expectation_config.get('expectation_type', '')
+                if exp_type not in catalog["data_assets"][data_asset]["columns"][column]["expectation_types"]:
+                    catalog["data_assets"][data_asset]["columns"][column]["expectation_types"].append(exp_type)
+
+        if suite_name not in catalog["expectation_suites"]:
+            catalog["expectation_suites"][suite_name] = {
+                "name": suite_name,
+                "data_assets": [],
+                "expectation_types": [],
+                "quality_metrics": {
+                    "total_expectations": 0,
+                    "successful_expectations": 0,
+                    "success_rate": 0.0,
+                    "exceptions": 0
+                }
+            }
+
+        if data_asset not in catalog["expectation_suites"][suite_name]["data_assets"]:
+            catalog["expectation_suites"][suite_name]["data_assets"].append(data_asset)
+
+    for data_asset_name, asset_info in catalog["data_assets"].items():
+        for column_name, column_info in asset_info["columns"].items():
+            column_df = self.df[(self.df['data_asset'] == data_asset_name) & (self.df['column'] == column_name)]
+            if not column_df.empty:
+                column_info["quality_metrics"] = {
+                    "total_expectations": len(column_df),
+                    "successful_expectations": column_df['success'].sum(),
+                    "success_rate": column_df['success'].mean(),
+                    "exceptions": column_df['exception_raised'].sum()
+                }
+
+    for suite_name, suite_info in catalog["expectation_suites"].items():
+        suite_df = self.df[self.df['suite_name'] == suite_name]
+        if not suite_df.empty:
+            suite_info["quality_metrics"] = {
+                "total_expectations": len(suite_df),
+                "successful_expectations": suite_df['success'].sum(),
+                "success_rate": suite_df['success'].mean(),
+                "exceptions": suite_df['exception_raised'].sum()
+            }
+            suite_info["expectation_types"] = suite_df['expectation_type'].unique().tolist()
+
+    return catalog
+
+
+def catalog_json(catalog):
+    """Catalog as saved by save_data_catalog, without the generation time"""
+    catalog = {**catalog, "metadata": {**catalog["metadata"], "generated_on": ""}}
+    return json.dumps(catalog, indent=2, default=str)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark data catalog generation')
+    parser.add_argument('--results', type=int, default=100000, help='Expectation results')
+    parser.add_argument('--columns', type=int, default=2000, help='Distinct columns over all assets')
+    parser.add_argument('--assets', type=int, default=20, help='Data assets')
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    pipeline = DataReportingPipeline({'output_dir': '/tmp/benchmark_data_catalog', 'env_path': '.env',
+                                      'columnar_store': False})
+    pipeline.validation_files = synthetic_validation_files(args.results, args.columns, args.assets)
+    pipeline.df = pipeline._process_in_memory()
+    pipeline.calculate_quality_metrics()
+
+    print("=" * 80)
+    print("DATA CATALOG BENCHMARK")
+    print("=" * 80)
+    print(f"{len(pipeline.df)} results, {pipeline.df['column'].nunique() - 1} columns, "
+          f"{len(pipeline.validation_files)} validation files, {args.assets} assets\n")
+
+    start = time.perf_counter()
+    legacy = legacy_generate_data_catalog(pipeline)
+    legacy_seconds = time.perf_counter() - start
+    print(f"  Loop implementation:    {legacy_seconds:.2f} s")
+
+    start = time.perf_counter()
+    catalog = pipeline.generate_data_catalog()
+    groupby_seconds = time.perf_counter() - start
+    print(f"  Groupby implementation: {groupby_seconds:.2f} s")
+
+    identical = catalog_json(legacy) == catalog_json(catalog)
+    print(f"\n  Same catalog JSON: {'✓' if identical else '✗'}")
+    print(f"  Speedup: {legacy_seconds / groupby_seconds:.1f}x")
+    if not identical:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
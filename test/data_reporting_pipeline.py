@@ -21,10 +21,12 @@ Version: 1.0
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -34,6 +36,11 @@ import numpy as np
 import requests
 from dotenv import dotenv_values
 
+from validation_loader import IncrementalValidationLoader
+from quality_metrics import QualityMetricsEngine
+from quality_rollups import DailyQualityRollups
+from validation_store import LEAN_COLUMNS, ValidationResultStore, columnar_store_available
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -113,13 +120,7 @@ class ValidationAnalyzer:
         """Send a prompt to Ollama and return the response"""
         model = model or self.ollama_model
         url = url or self.ollama_url
-        
-        # Prepare headers
-        headers = {"Content-Type": "application/json"}
-        
-        # Add API key if available (for Ollama Cloud)
-        if self.ollama_api_key and self.ollama_api_key != "your_api_key_here":
-            headers["Authorization"] = f"Bearer {self.ollama_api_key}"
+        headers = self._ollama_headers()
         
         try:
             response = requests.post(
@@ -139,6 +140,73 @@ class ValidationAnalyzer:
                 logger.error(f"Response status: {e.response.status_code}")
                 logger.error(f"Response text: {e.response.text}")
             return None
+    
+    def _ollama_headers(self) -> Dict[str, str]:
+        """Request headers, with the API key if available (for Ollama Cloud)"""
+        headers = {"Content-Type": "application/json"}
+        if self.ollama_api_key and self.ollama_api_key != "your_api_key_here":
+            headers["Authorization"] = f"Bearer {self.ollama_api_key}"
+        return headers
+    
+    def ollama_infer_many(self, prompts: List[str], max_concurrency: int = 4,
+                          timeout: int = 120) -> List[Optional[str]]:
+        """
+        Send independent prompts to Ollama concurrently and return the responses in prompt order
+        
+        Uses one shared aiohttp session with at most `max_concurrency` requests in flight and a
+        timeout per request; falls back to sequential ollama_infer calls if aiohttp is not installed.
+        When called from a running event loop (e.g. a Jupyter notebook) the requests run on their
+        own loop in a worker thread. Failed or timed out prompts return None, like ollama_infer.
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            logger.warning("aiohttp not installed, sending Ollama prompts sequentially (pip install aiohttp)")
+            return [self.ollama_infer(prompt, timeout=timeout) for prompt in prompts]
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            logger.info(f"Sending {len(prompts)} Ollama prompts concurrently (max {max_concurrency} in flight)")
+            return asyncio.run(self._ollama_infer_async(prompts, max_concurrency, timeout))
+        
+        # asyncio.run cannot be nested in a running loop, give the requests their own loop on a worker thread
+        logger.info(f"Event loop already running, sending {len(prompts)} Ollama prompts concurrently "
+                    f"from a worker thread (max {max_concurrency} in flight)")
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='ollama-async') as executor:
+            return executor.submit(asyncio.run, self._ollama_infer_async(prompts, max_concurrency, timeout)).result()
+    
+    async def _ollama_infer_async(self, prompts: List[str], max_concurrency: int,
+                                  timeout: int) -> List[Optional[str]]:
+        """Run all prompts on one HTTP session with bounded concurrency"""
+        import aiohttp
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        request_timeout = aiohttp.ClientTimeout(total=timeout)
+        connector = aiohttp.TCPConnector(limit=max_concurrency)
+        
+        async def infer(session, index: int, prompt: str) -> Optional[str]:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    async with session.post(
+                        f"{self.ollama_url}/api/generate",
+                        json={"model": self.ollama_model, "prompt": prompt, "stream": False},
+                        timeout=request_timeout
+                    ) as response:
+                        response.raise_for_status()
+                        return (await response.json())["response"]
+                except asyncio.TimeoutError:
+                    logger.error(f"Ollama request {index + 1} timed out after {timeout} seconds")
+                    return None
+                except aiohttp.ClientError as e:
+                    logger.error(f"Error calling Ollama API (request {index + 1}): {e}")
+                    return None
+                finally:
+                    logger.info(f"Ollama request {index + 1}/{len(prompts)} took {time.perf_counter() - start:.2f} seconds")
+        
+        async with aiohttp.ClientSession(headers=self._ollama_headers(), connector=connector) as session:
+            return await asyncio.gather(*(infer(session, i, prompt) for i, prompt in enumerate(prompts)))
 
 
 class DataReportingPipeline:
@@ -157,17 +225,53 @@ class DataReportingPipeline:
         
         # Initialize data containers
         self.validation_files = []
+        self.loader = None
+        self.store = None
         self.df = None
+        self.metrics_engine = None
         self.quality_metrics = {}
+        self.rollups = None
+        self.windowed_metrics = {}
         self.data_catalog = {}
         self.ai_insights = ""
+        self.ai_executive_summary = ""
         self.data_summary = {}
         
         logger.info("Data Reporting Pipeline initialized")
     
     def load_validation_files(self) -> List[Dict]:
-        """Load all validation JSON files from the directory structure"""
+        """
+        Load all validation JSON files from the directory structure
+        
+        Files are parsed in a process pool and only new or changed files are parsed again on
+        later runs (see validation_loader.IncrementalValidationLoader); set 'incremental_loading'
+        to false to parse every file serially as before.
+        """
         logger.info("Loading validation files...")
+        
+        if not self.config.get('incremental_loading', True):
+            return self._load_validation_files_serial()
+        
+        cache_dir = self.config.get('validation_cache_dir', str(self.output_dir / '.validation_cache'))
+        self.loader = IncrementalValidationLoader(
+            self.analyzer.validation_path,
+            cache_dir=cache_dir or None,
+            max_workers=self.config.get('loader_workers'),
+            parallel_threshold=self.config.get('parallel_load_threshold', 256),
+            # The columnar store keeps the nested result objects on disk
+            include_blobs=not self._use_columnar_store()
+        )
+        validation_files = self.loader.load()
+        
+        self.validation_files = validation_files
+        stats = self.loader.stats
+        logger.info(f"Loaded {len(validation_files)} validation files "
+                    f"({stats['new']} new, {stats['changed']} changed, {stats['unchanged']} from cache, "
+                    f"{stats['removed']} removed)")
+        return validation_files
+    
+    def _load_validation_files_serial(self) -> List[Dict]:
+        """Parse every validation file in-process, without the incremental cache"""
         validation_files = []
         
         # Find all JSON files in the validation directory
@@ -190,9 +294,61 @@ class DataReportingPipeline:
         logger.info(f"Loaded {len(validation_files)} validation files")
         return validation_files
     
+    def _use_columnar_store(self) -> bool:
+        """Whether results go through the Parquet store ('columnar_store', needs pyarrow and incremental loading)"""
+        if not self.config.get('columnar_store', True) or not self.config.get('incremental_loading', True):
+            return False
+        if not columnar_store_available():
+            logger.warning("pyarrow is not installed, processing validation results in memory")
+            return False
+        return True
+    
     def process_validation_results(self) -> pd.DataFrame:
         """Process validation results into structured data"""
         logger.info("Processing validation results...")
+        if self.loader is not None and self._use_columnar_store():
+            self.df = self._process_with_columnar_store()
+        else:
+            self.df = self._process_in_memory()
+        logger.info(f"Processed {len(self.df)} individual expectations")
+        logger.info(f"Unique expectation suites: {self.df['suite_name'].nunique()}")
+        logger.info(f"Unique expectation types: {self.df['expectation_type'].nunique()}")
+        return self.df
+    
+    def _process_with_columnar_store(self) -> pd.DataFrame:
+        """
+        Append the rows of new or changed files to the Parquet store and read back the lean columns
+        
+        Suite, type, column and asset come back as categoricals; the nested result / meta objects
+        stay on disk (see load_result_blobs).
+        """
+        store_dir = self.config.get('validation_store_dir') or str(self.output_dir / '.validation_store')
+        self.store = ValidationResultStore(store_dir)
+        file_hashes = {file_info['file_path']: file_info['file_hash'] for file_info in self.validation_files}
+        missing = self.store.missing_files(file_hashes)
+        fresh = self.loader.fresh_records
+        records = [fresh[file_path] for file_path in missing if file_path in fresh]
+        # Files loaded from the loader cache but missing from the store (e.g. a deleted store)
+        records += self.loader.parse_full([file_path for file_path in missing if file_path not in fresh])
+        appended = self.store.sync(file_hashes, records)
+        self.loader.fresh_records = {}
+        logger.info(f"Columnar store: {appended} rows appended from {len(records)} files")
+        return self.store.read(LEAN_COLUMNS)
+    
+    def load_result_blobs(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Rows with the nested 'result' and 'meta' objects, for reports that need them
+        
+        Args:
+            columns: Columns to read (defaults to the lean columns plus result and meta)
+        """
+        columns = columns or LEAN_COLUMNS + ['result', 'meta']
+        if self.store is not None:
+            return self.store.read(columns)
+        return self.df[[column for column in columns if column in self.df.columns]]
+    
+    def _process_in_memory(self) -> pd.DataFrame:
+        """Flatten the loaded validation files into one row per expectation result"""
         processed_data = []
         
         for file_info in self.validation_files:
@@ -218,48 +374,19 @@ class DataReportingPipeline:
                     'meta': expectation_config.get('meta', {})
                 })
         
-        self.df = pd.DataFrame(processed_data)
-        logger.info(f"Processed {len(self.df)} individual expectations")
-        logger.info(f"Unique expectation suites: {self.df['suite_name'].nunique()}")
-        logger.info(f"Unique expectation types: {self.df['expectation_type'].nunique()}")
-        return self.df
+        return pd.DataFrame(processed_data)
     
     def calculate_quality_metrics(self) -> Dict:
-        """Calculate comprehensive data quality metrics"""
+        """
+        Calculate comprehensive data quality metrics
+        
+        Suite, expectation type and column rollups are computed in one pass by
+        quality_metrics.QualityMetricsEngine, kept as self.metrics_engine so the report
+        generators reuse its rankings.
+        """
         logger.info("Calculating quality metrics...")
-        metrics = {}
-        
-        # Overall success rate
-        metrics['overall_success_rate'] = self.df['success'].mean()
-        
-        # Success rate by expectation suite
-        suite_metrics = self.df.groupby('suite_name').agg({
-            'success': ['count', 'sum', 'mean'],
-            'exception_raised': 'sum'
-        }).round(3)
-        suite_metrics.columns = ['total_expectations', 'successful_expectations', 'success_rate', 'exceptions']
-        metrics['suite_metrics'] = suite_metrics
-        
-        # Success rate by expectation type
-        type_metrics = self.df.groupby('expectation_type').agg({
-            'success': ['count', 'sum', 'mean'],
-            'exception_raised': 'sum'
-        }).round(3)
-        type_metrics.columns = ['total_expectations', 'successful_expectations', 'success_rate', 'exceptions']
-        metrics['type_metrics'] = type_metrics
-        
-        # Column-level analysis
-        column_metrics = self.df[self.df['column'] != 'table-level'].groupby('column').agg({
-            'success': ['count', 'sum', 'mean'],
-            'exception_raised': 'sum'
-        }).round(3)
-        column_metrics.columns = ['total_expectations', 'successful_expectations', 'success_rate', 'exceptions']
-        metrics['column_metrics'] = column_metrics
-        
-        # Exception analysis
-        exception_df = self.df[self.df['exception_raised'] == True]
-        metrics['exception_count'] = len(exception_df)
-        metrics['exception_rate'] = len(exception_df) / len(self.df)
+        self.metrics_engine = QualityMetricsEngine(self.df)
+        metrics = self.metrics_engine.metrics()
         
         self.quality_metrics = metrics
         
@@ -269,20 +396,87 @@ class DataReportingPipeline:
         
         return metrics
     
+    def update_quality_rollups(self) -> Optional[DailyQualityRollups]:
+        """
+        Update the persisted per-day rollups with the new, changed and removed validation files
+        
+        Needs the content hashes of the incremental loader; set 'daily_rollups' to false to skip.
+        """
+        if not self.config.get('daily_rollups', True):
+            return None
+        if self.loader is None:
+            logger.warning("Daily quality rollups need incremental loading, skipping them")
+            return None
+        
+        rollups_path = self.config.get('quality_rollups_path') or str(self.output_dir / '.quality_rollups.json')
+        self.rollups = DailyQualityRollups(rollups_path)
+        stats = self.rollups.update(self.validation_files)
+        logger.info(f"Daily rollups: {len(self.rollups.days)} days ({stats['added']} files added, "
+                    f"{stats['changed']} changed, {stats['removed']} removed)")
+        return self.rollups
+    
+    def calculate_windowed_metrics(self, windows: Optional[List[int]] = None) -> Dict[int, Dict]:
+        """
+        Quality metrics of the trailing windows (days, ending at the latest validation day)
+        merged from the daily rollups
+        
+        Args:
+            windows: Window lengths in days (defaults to the 'rollup_windows' config, 7 / 30 / 90)
+        """
+        if self.rollups is None:
+            return {}
+        windows = windows or self.config.get('rollup_windows', [7, 30, 90])
+        end = self.config.get('rollup_window_end')
+        self.windowed_metrics = {days: self.rollups.window(days, end=end) for days in windows}
+        for days, window in self.windowed_metrics.items():
+            if window['total_expectations']:
+                logger.info(f"Last {days} days: {window['success_rate']:.2%} success rate "
+                            f"over {window['total_expectations']} expectations")
+        return self.windowed_metrics
+    
     def generate_ai_insights(self) -> Tuple[str, Dict]:
         """Generate AI-powered insights using Ollama Cloud with fallback"""
         logger.info("Generating AI insights with Ollama Cloud...")
         
+        prompt, data_summary = self._build_ai_insights_prompt()
+        ai_response = self.analyzer.ollama_infer(prompt)
+        return self._finish_ai_insights(ai_response, data_summary)
+    
+    def generate_ai_content(self) -> Tuple[str, str]:
+        """
+        Generate the AI insights and the executive summary concurrently
+        
+        Both prompts only depend on the quality metrics, so they are sent to Ollama together
+        (see ValidationAnalyzer.ollama_infer_many) instead of one after the other.
+        """
+        logger.info("Generating AI insights and executive summary concurrently...")
+        
+        insights_prompt, data_summary = self._build_ai_insights_prompt()
+        self.data_summary = data_summary
+        executive_summary_prompt = self._build_executive_summary_prompt()
+        
+        ai_response, ai_executive_summary = self.analyzer.ollama_infer_many(
+            [insights_prompt, executive_summary_prompt],
+            max_concurrency=self.config.get('ollama_concurrency', 4),
+            timeout=self.config.get('ollama_timeout', 120)
+        )
+        
+        self._finish_ai_insights(ai_response, data_summary)
+        self._finish_executive_summary(ai_executive_summary)
+        return self.ai_insights, self.ai_executive_summary
+    
+    def _build_ai_insights_prompt(self) -> Tuple[str, Dict]:
+        """Prepare the data summary and the insights prompt for AI analysis"""
         # Prepare data summary for AI analysis
         data_summary = {
             'total_expectations': len(self.df),
             'overall_success_rate': self.quality_metrics['overall_success_rate'],
             'exception_rate': self.quality_metrics['exception_rate'],
-            'suite_count': self.df['suite_name'].nunique(),
-            'expectation_types': self.df['expectation_type'].nunique(),
+            'suite_count': self.metrics_engine.group_count('suite'),
+            'expectation_types': self.metrics_engine.group_count('type'),
             'date_range': f"{self.df['timestamp'].min()} to {self.df['timestamp'].max()}",
-            'top_failing_suites': self.quality_metrics['suite_metrics'].nsmallest(3, 'success_rate').to_dict(),
-            'top_failing_types': self.quality_metrics['type_metrics'].nsmallest(3, 'success_rate').to_dict()
+            'top_failing_suites': self.metrics_engine.lowest('suite', 3).to_dict(),
+            'top_failing_types': self.metrics_engine.lowest('type', 3).to_dict()
         }
         
         prompt = f"""
@@ -313,8 +507,10 @@ class DataReportingPipeline:
         Format your response as a professional data quality report with clear sections and actionable insights.
         """
         
-        ai_response = self.analyzer.ollama_infer(prompt)
-        
+        return prompt, data_summary
+    
+    def _finish_ai_insights(self, ai_response: Optional[str], data_summary: Dict) -> Tuple[str, Dict]:
+        """Store the AI insights, using the fallback analysis if AI was unavailable"""
         # Use fallback if AI is unavailable
         if ai_response is None:
             logger.warning("Ollama Cloud unavailable, using fallback analysis...")
@@ -328,14 +524,16 @@ class DataReportingPipeline:
     
     def _generate_fallback_analysis(self) -> str:
         """Generate fallback analysis when AI is unavailable"""
+        lowest_suite = self.metrics_engine.lowest('suite', 1)
+        lowest_type = self.metrics_engine.lowest('type', 1)
         fallback_analysis = f"""
 ## Executive Summary
-Based on the analysis of {len(self.df)} data quality expectations across {self.df['suite_name'].nunique()} validation suites, the overall data quality success rate is {self.quality_metrics['overall_success_rate']:.2%}.
+Based on the analysis of {len(self.df)} data quality expectations across {self.metrics_engine.group_count('suite')} validation suites, the overall data quality success rate is {self.quality_metrics['overall_success_rate']:.2%}.
 
 ## Critical Issues
 - **Exception Rate**: {self.quality_metrics['exception_rate']:.2%} of expectations raised exceptions
-- **Lowest Performing Suite**: {self.quality_metrics['suite_metrics'].nsmallest(1, 'success_rate').index[0]} with {self.quality_metrics['suite_metrics'].nsmallest(1, 'success_rate')['success_rate'].iloc[0]:.2%} success rate
-- **Most Problematic Expectation Type**: {self.quality_metrics['type_metrics'].nsmallest(1, 'success_rate').index[0]} with {self.quality_metrics['type_metrics'].nsmallest(1, 'success_rate')['success_rate'].iloc[0]:.2%} success rate
+- **Lowest Performing Suite**: {lowest_suite.index[0]} with {lowest_suite['success_rate'].iloc[0]:.2%} success rate
+- **Most Problematic Expectation Type**: {lowest_type.index[0]} with {lowest_type['success_rate'].iloc[0]:.2%} success rate
 
 ## Trends Analysis
 - **Date Range**: {self.df['timestamp'].min()} to {self.df['timestamp'].max()}
@@ -363,7 +561,12 @@ Based on the analysis of {len(self.df)} data quality expectations across {self.d
         return fallback_analysis
     
     def generate_data_catalog(self) -> Dict:
-        """Generate comprehensive data catalog from validation results"""
+        """
+        Generate comprehensive data catalog from validation results
+        
+        Per-run, per-column and per-suite figures come from a few groupby passes over the
+        processed frame; only per-file metadata is read from the validation files.
+        """
         logger.info("Generating data catalog...")
         
         catalog = {
@@ -382,18 +585,22 @@ Based on the analysis of {len(self.df)} data quality expectations across {self.d
             }
         }
         
-        # Process each validation file to extract data asset information
+        # Expectation count and successes of every validation run
+        run_stats = self.df.groupby('file_path', observed=True, sort=False)['success'].agg(['size', 'sum'])
+        run_counts = run_stats['size'].to_dict()
+        run_successes = run_stats['sum'].to_dict()
+        
+        # Ordered sets (dict keys) of the suites per asset and the assets per suite
+        asset_suites, suite_assets = {}, {}
         for file_info in self.validation_files:
             data = file_info['data']
             suite_name = file_info['suite_name']
             data_asset = file_info['data_asset']
             
-            # Extract batch definition information
-            batch_def = data.get('meta', {}).get('active_batch_definition', {})
-            batch_spec = data.get('meta', {}).get('batch_spec', {})
-            
-            # Initialize data asset entry if not exists
+            # Initialize data asset entry from the first run's batch definition
             if data_asset not in catalog["data_assets"]:
+                batch_def = data.get('meta', {}).get('active_batch_definition', {})
+                batch_spec = data.get('meta', {}).get('batch_spec', {})
                 catalog["data_assets"][data_asset] = {
                     "name": data_asset,
                     "type": batch_spec.get('type', 'unknown'),
@@ -405,43 +612,18 @@ Based on the analysis of {len(self.df)} data quality expectations across {self.d
                     "columns": {},
                     "expectation_suites": []
                 }
+                asset_suites[data_asset] = {}
             
             # Add validation run information
-            run_info = {
+            expectation_count = run_counts.get(file_info['file_path'], 0)
+            catalog["data_assets"][data_asset]["validation_runs"].append({
                 "run_id": file_info['run_id'],
                 "timestamp": file_info['timestamp'],
                 "suite_name": suite_name,
-                "expectation_count": len(data.get('results', [])),
-                "success_rate": sum(1 for r in data.get('results', []) if r.get('success', False)) / len(data.get('results', [])) if data.get('results') else 0
-            }
-            
-            catalog["data_assets"][data_asset]["validation_runs"].append(run_info)
-            
-            # Add suite to data asset
-            if suite_name not in catalog["data_assets"][data_asset]["expectation_suites"]:
-                catalog["data_assets"][data_asset]["expectation_suites"].append(suite_name)
-            
-            # Extract column information from expectations
-            for result in data.get('results', []):
-                expectation_config = result.get('expectation_config', {})
-                column = expectation_config.get('kwargs', {}).get('column', 'table-level')
-                
-                if column != 'table-level' and column not in catalog["data_assets"][data_asset]["columns"]:
-                    catalog["data_assets"][data_asset]["columns"][column] = {
-                        "name": column,
-                        "expectation_types": [],
-                        "quality_metrics": {
-                            "total_expectations": 0,
-                            "successful_expectations": 0,
-                            "success_rate": 0.0,
-                            "exceptions": 0
-                        }
-                    }
-                
-                if column != 'table-level':
-                    exp_type = expectation_config.get('expectation_type', '')
-                    if exp_type not in catalog["data_assets"][data_asset]["columns"][column]["expectation_types"]:
-                        catalog["data_assets"][data_asset]["columns"][column]["expectation_types"].append(exp_type)
+                "expectation_count": expectation_count,
+                "success_rate": run_successes[file_info['file_path']] / expectation_count if expectation_count else 0
+            })
+            asset_suites[data_asset][suite_name] = None
             
             # Initialize expectation suite entry
             if suite_name not in catalog["expectation_suites"]:
@@ -456,33 +638,47 @@ Based on the analysis of {len(self.df)} data quality expectations across {self.d
                         "exceptions": 0
                     }
                 }
-            
-            # Add data asset to suite
-            if data_asset not in catalog["expectation_suites"][suite_name]["data_assets"]:
-                catalog["expectation_suites"][suite_name]["data_assets"].append(data_asset)
-        
-        # Calculate quality metrics for columns and suites
-        for data_asset_name, asset_info in catalog["data_assets"].items():
-            for column_name, column_info in asset_info["columns"].items():
-                column_df = self.df[(self.df['data_asset'] == data_asset_name) & (self.df['column'] == column_name)]
-                if not column_df.empty:
-                    column_info["quality_metrics"] = {
-                        "total_expectations": len(column_df),
-                        "successful_expectations": column_df['success'].sum(),
-                        "success_rate": column_df['success'].mean(),
-                        "exceptions": column_df['exception_raised'].sum()
-                    }
+                suite_assets[suite_name] = {}
+            suite_assets[suite_name][data_asset] = None
+        
+        for data_asset, suites in asset_suites.items():
+            catalog["data_assets"][data_asset]["expectation_suites"] = list(suites)
+        for suite_name, assets in suite_assets.items():
+            catalog["expectation_suites"][suite_name]["data_assets"] = list(assets)
+        
+        # Column rows in validation file order, so columns and their expectation types are
+        # listed in order of first appearance
+        column_df = self.df[self.df['column'] != 'table-level']
+        file_order = {file_info['file_path']: position for position, file_info in enumerate(self.validation_files)}
+        file_position = np.asarray(column_df['file_path'].map(file_order), dtype=np.int64)
+        column_df = column_df.iloc[np.argsort(file_position, kind='stable')]
+        
+        for (data_asset, column), total, successes, exceptions in self._catalog_group_stats(
+                column_df, ['data_asset', 'column']):
+            catalog["data_assets"][data_asset]["columns"][column] = {
+                "name": column,
+                "expectation_types": [],
+                "quality_metrics": {
+                    "total_expectations": total,
+                    "successful_expectations": successes,
+                    "success_rate": successes / total,
+                    "exceptions": exceptions
+                }
+            }
+        for data_asset, column, exp_type in column_df[['data_asset', 'column', 'expectation_type']].drop_duplicates().itertuples(index=False):
+            catalog["data_assets"][data_asset]["columns"][column]["expectation_types"].append(exp_type)
         
-        for suite_name, suite_info in catalog["expectation_suites"].items():
-            suite_df = self.df[self.df['suite_name'] == suite_name]
-            if not suite_df.empty:
-                suite_info["quality_metrics"] = {
-                    "total_expectations": len(suite_df),
-                    "successful_expectations": suite_df['success'].sum(),
-                    "success_rate": suite_df['success'].mean(),
-                    "exceptions": suite_df['exception_raised'].sum()
+        for suite_name, total, successes, exceptions in self._catalog_group_stats(self.df, 'suite_name'):
+            if suite_name in catalog["expectation_suites"]:
+                catalog["expectation_suites"][suite_name]["quality_metrics"] = {
+                    "total_expectations": total,
+                    "successful_expectations": successes,
+                    "success_rate": successes / total,
+                    "exceptions": exceptions
                 }
-                suite_info["expectation_types"] = suite_df['expectation_type'].unique().tolist()
+        for suite_name, exp_type in self.df[['suite_name', 'expectation_type']].drop_duplicates().itertuples(index=False):
+            if suite_name in catalog["expectation_suites"]:
+                catalog["expectation_suites"][suite_name]["expectation_types"].append(exp_type)
         
         self.data_catalog = catalog
         
@@ -491,17 +687,34 @@ Based on the analysis of {len(self.df)} data quality expectations across {self.d
         
         return catalog
     
+    @staticmethod
+    def _catalog_group_stats(df: pd.DataFrame, keys):
+        """Yield (group key, expectation count, successes, exceptions) per group, in order of first appearance"""
+        stats = df.groupby(keys, observed=True, sort=False).agg(
+            total=('success', 'size'),
+            successes=('success', 'sum'),
+            exceptions=('exception_raised', 'sum')
+        )
+        # NumPy scalars, as the catalog has always been serialised with them
+        return zip(stats.index, stats['total'].tolist(), stats['successes'].to_numpy(), stats['exceptions'].to_numpy())
+    
     def generate_ai_executive_summary(self) -> str:
         """Generate AI-powered executive summary following professional standards"""
         logger.info("Generating AI-powered executive summary...")
         
+        executive_summary_prompt = self._build_executive_summary_prompt()
+        ai_executive_summary = self.analyzer.ollama_infer(executive_summary_prompt)
+        return self._finish_executive_summary(ai_executive_summary)
+    
+    def _build_executive_summary_prompt(self) -> str:
+        """Build the executive summary prompt (needs the data summary of the AI insights step)"""
         # Extract key metrics for summary
         overall_success = self.quality_metrics['overall_success_rate']
         exception_rate = self.quality_metrics['exception_rate']
         total_expectations = len(self.df)
         
         # Get top failing expectation types for summary
-        failing_types = self.quality_metrics['type_metrics'].nsmallest(3, 'success_rate')
+        failing_types = self.metrics_engine.lowest('type', 3)
         
         # Generate AI-powered executive summary
         executive_summary_prompt = f"""
@@ -538,7 +751,13 @@ Based on the analysis of {len(self.df)} data quality expectations across {self.d
         Format as a professional executive summary suitable for a board presentation.
         """
         
-        ai_executive_summary = self.analyzer.ollama_infer(executive_summary_prompt)
+        return executive_summary_prompt
+    
+    def _finish_executive_summary(self, ai_executive_summary: Optional[str]) -> str:
+        """Store the executive summary, using the fallback summary if AI was unavailable"""
+        overall_success = self.quality_metrics['overall_success_rate']
+        total_expectations = len(self.df)
+        failing_types = self.metrics_engine.lowest('type', 3)
         
         # Fallback executive summary if AI is unavailable
         if ai_executive_summary is None:
@@ -558,20 +777,21 @@ Based on the analysis of {len(self.df)} data quality expectations across {self.d
             Prioritize fixing expectation types with success rates below 80% to ensure comprehensive data quality coverage and maintain stakeholder confidence in our data assets.
             """
         
+        self.ai_executive_summary = ai_executive_summary
         return ai_executive_summary
     
     def generate_professional_report(self) -> str:
         """Generate professional markdown report with AI executive summary"""
         logger.info("Generating professional report...")
         
-        # Generate AI executive summary
-        ai_executive_summary = self.generate_ai_executive_summary()
+        # Generate AI executive summary (unless generated together with the insights)
+        ai_executive_summary = self.ai_executive_summary or self.generate_ai_executive_summary()
         
         # Extract key metrics
         overall_success = self.quality_metrics['overall_success_rate']
         exception_rate = self.quality_metrics['exception_rate']
         total_expectations = len(self.df)
-        failing_types = self.quality_metrics['type_metrics'].nsmallest(3, 'success_rate')
+        failing_types = self.metrics_engine.lowest('type', 3)
         
         report = f"""# Great Expectations Validation Analysis Report
 
@@ -604,7 +824,7 @@ Based on the analysis of {len(self.df)} data quality expectations across {self.d
 | Exception Rate | {exception_rate:.2%} |
 | Expectation Types | {self.data_summary['expectation_types']} |
 | Validation Suites | {self.data_summary['suite_count']} |
-
+{self._windowed_metrics_section()}
 ### Suite Performance
 
 | Suite Name | Expectations | Success Rate | Exceptions |
@@ -679,6 +899,22 @@ Based on the analysis, the following actions are recommended:
         
         return report
     
+    def _windowed_metrics_section(self) -> str:
+        """Markdown table of the trailing window metrics (empty without daily rollups)"""
+        if not self.windowed_metrics:
+            return ""
+        section = """
+### Recent Performance
+
+| Window | Period | Expectations | Success Rate | Exceptions |
+|--------|--------|--------------|--------------|------------|
+"""
+        for days, window in self.windowed_metrics.items():
+            success_rate = f"{window['success_rate']:.2%}" if window['total_expectations'] else "n/a"
+            section += (f"| Last {days} days | {window['start']} to {window['end']} | {window['total_expectations']} "
+                        f"| {success_rate} | {window['exceptions']} |\n")
+        return section
+    
     def generate_pdf_report(self, report_content: str, filename: str = "validation_analysis_report.pdf") -> Optional[Path]:
         """Generate PDF report from markdown content with proper A4 formatting"""
         try:
@@ -828,11 +1064,19 @@ Based on the analysis, the following actions are recommended:
             # Step 2: Process validation results
             self.process_validation_results()
             
-            # Step 3: Calculate quality metrics
+            # Step 3: Calculate quality metrics (and the trailing windows from the daily rollups)
             self.calculate_quality_metrics()
+            self.update_quality_rollups()
+            self.calculate_windowed_metrics()
             
-            # Step 4: Generate AI insights
-            self.generate_ai_insights()
+            # Step 4: Generate AI insights (and the executive summary, concurrently)
+            ai_start = time.perf_counter()
+            if self.config.get('concurrent_ai', True):
+                self.generate_ai_content()
+            else:
+                self.generate_ai_insights()
+                self.generate_ai_executive_summary()
+            ai_duration = time.perf_counter() - ai_start
             
             # Step 5: Generate data catalog
             self.generate_data_catalog()
@@ -867,6 +1111,8 @@ Based on the analysis, the following actions are recommended:
             logger.info("DATA REPORTING PIPELINE COMPLETE!")
             logger.info("=" * 80)
             logger.info(f"Execution time: {duration:.2f} seconds")
+            logger.info(f"AI generation wall time: {ai_duration:.2f} seconds "
+                        f"({'concurrent' if self.config.get('concurrent_ai', True) else 'sequential'})")
             logger.info(f"Total expectations processed: {len(self.df)}")
             logger.info(f"Overall success rate: {self.quality_metrics['overall_success_rate']:.2%}")
             logger.info("=" * 80)
@@ -889,7 +1135,12 @@ def load_config(config_file: Optional[str] = None) -> Dict:
         'validation_path': 'BirdiDQ/gx/uncommitted/validations',
         'env_path': '/Users/yavin/python_projects/ollama_jupyter/.env',
         'output_dir': '.',
-        'ollama_timeout': 120
+        'ollama_timeout': 120,
+        'ollama_concurrency': 4,
+        'concurrent_ai': True,
+        'incremental_loading': True,
+        'columnar_store': True,
+        'daily_rollups': True
     }
 
 
@@ -900,6 +1151,8 @@ def main():
     parser.add_argument('--output-dir', type=str, help='Output directory for reports')
     parser.add_argument('--validation-path', type=str, help='Path to validation results')
     parser.add_argument('--env-path', type=str, help='Path to environment file')
+    parser.add_argument('--sequential-ai', action='store_true',
+                        help='Send AI prompts one after the other (to compare wall time with the concurrent default)')
     
     args = parser.parse_args()
     
@@ -913,6 +1166,8 @@ def main():
         config['validation_path'] = args.validation_path
     if args.env_path:
         config['env_path'] = args.env_path
+    if args.sequential_ai:
+        config['concurrent_ai'] = False
     
     try:
         # Initialize and run pipeline
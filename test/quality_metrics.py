@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Single-pass quality metrics for the processed validation results
+
+QualityMetricsEngine computes the suite, expectation type and column rollups of
+DataReportingPipeline.calculate_quality_metrics with one np.bincount over the
+group codes of all three dimensions (categorical codes, or pd.factorize for plain
+string columns). Each result contributes one bin per dimension, offset by
+its success / exception state, so counts, successes and exceptions come out of
+the same pass.
+
+Rankings used by the report generators (lowest success rates) are sorted once per
+dimension and reused.
+"""
+
+import logging
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Rollup dimension -> grouping column of the processed frame
+DIMENSIONS = {'suite': 'suite_name', 'type': 'expectation_type', 'column': 'column'}
+# Columns excluded from the column rollup
+TABLE_LEVEL = 'table-level'
+# Outcome states per result: success + 2 * exception raised
+_STATES = 4
+
+
+def _group_codes(values: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """Integer group id of every row (-1 for missing) and the group labels, in groupby order"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Codes are int8 / int16 for few categories, widen before offsetting
+        return values.cat.codes.to_numpy().astype(np.intp), values.cat.categories
+    codes, labels = pd.factorize(values, sort=True)
+    return codes.astype(np.intp, copy=False), pd.Index(labels)
+
+
+class QualityMetricsEngine:
+    """Suite / type / column quality rollups computed in one pass, with memoized rankings"""
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Compute all rollups of the processed results
+
+        Args:
+            df: Processed frame (see DataReportingPipeline.process_validation_results)
+        """
+        self.total = len(df)
+        state = df['success'].to_numpy(dtype=bool).astype(np.intp)
+        state += 2 * df['exception_raised'].to_numpy(dtype=bool)
+        self.successes = int(np.count_nonzero(state & 1))
+        self.exceptions = int(np.count_nonzero(state & 2))
+
+        # Stack the offset group ids of every dimension and count them in one bincount
+        bins, groups, offset = [], {}, 0
+        for dimension, key in DIMENSIONS.items():
+            codes, labels = _group_codes(df[key])
+            keep = codes >= 0
+            if dimension == 'column' and TABLE_LEVEL in labels:
+                keep &= codes != labels.get_loc(TABLE_LEVEL)
+            bins.append((codes[keep] + offset) * _STATES + state[keep])
+            groups[dimension] = (offset, labels)
+            offset += len(labels)
+        tallies = np.bincount(np.concatenate(bins), minlength=offset * _STATES).reshape(offset, _STATES)
+
+        self.rollups: Dict[str, pd.DataFrame] = {}
+        for dimension, (start, labels) in groups.items():
+            tally = tallies[start:start + len(labels)]
+            counts = tally.sum(axis=1)
+            observed = counts > 0
+            counts = counts[observed]
+            successes = (tally[:, 1] + tally[:, 3])[observed]
+            self.rollups[dimension] = pd.DataFrame({
+                'total_expectations': counts,
+                'successful_expectations': successes,
+                'success_rate': successes / counts,
+                'exceptions': (tally[:, 2] + tally[:, 3])[observed],
+            }, index=pd.Index(labels[observed], name=DIMENSIONS[dimension])).round(3)
+        self._rankings: Dict[str, pd.DataFrame] = {}
+
+    def metrics(self) -> Dict:
+        """The quality_metrics dict of the pipeline"""
+        return {
+            'overall_success_rate': self.successes / self.total,
+            'suite_metrics': self.rollups['suite'],
+            'type_metrics': self.rollups['type'],
+            'column_metrics': self.rollups['column'],
+            'exception_count': self.exceptions,
+            'exception_rate': self.exceptions / self.total,
+        }
+
+    def group_count(self, dimension: str) -> int:
+        """Number of distinct suites / types / columns with results"""
+        return len(self.rollups[dimension])
+
+    def ranking(self, dimension: str) -> pd.DataFrame:
+        """Rollup of a dimension sorted by ascending success rate (ties keep group order), sorted once"""
+        if dimension not in self._rankings:
+            self._rankings[dimension] = self.rollups[dimension].sort_values('success_rate', kind='stable')
+        return self._rankings[dimension]
+
+    def lowest(self, dimension: str, n: int) -> pd.DataFrame:
+        """The n groups with the lowest success rate (same rows as nsmallest(n, 'success_rate'))"""
+        return self.ranking(dimension).head(n)
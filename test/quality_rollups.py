@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Persisted per-day quality rollups of validation results
+
+DailyQualityRollups keeps, for every validation day, the expectation count,
+successes and exceptions per suite, expectation type, column and data asset,
+so "last 7 / 30 / 90 days" questions are answered by adding up at most that many
+day rollups instead of rescanning every result.
+
+The contribution of each validation file (its day and its per-key counts) is
+stored next to the day rollups, keyed by the file's content hash. An update only
+reads files that are new or whose hash changed: their old contribution is
+subtracted from the day it was counted in and the new one is added to the day of
+the file's validation time. A late file for an older day therefore lands in that
+day, and changed or removed files never leave stale counts behind.
+"""
+
+import json
+import logging
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Bump when the rollup layout changes so old files are rebuilt
+ROLLUP_VERSION = 1
+# Rollup dimension -> metrics key of a window query
+DIMENSIONS = {'suite': 'suite_metrics', 'type': 'type_metrics', 'column': 'column_metrics', 'asset': 'asset_metrics'}
+_METRIC_COLUMNS = ['total_expectations', 'successful_expectations', 'success_rate', 'exceptions']
+
+
+def validation_day(timestamp: str) -> Optional[str]:
+    """UTC day (YYYY-MM-DD) of a validation time such as 20251005T180117.592126Z, None if unparseable"""
+    try:
+        moment = pd.Timestamp(timestamp)
+    except (ValueError, TypeError):
+        return None
+    if pd.isna(moment):
+        return None
+    if moment.tzinfo is not None:
+        moment = moment.tz_convert('UTC')
+    return moment.date().isoformat()
+
+
+def file_contribution(file_info: Dict) -> Dict[str, Dict[str, list]]:
+    """[total, successes, exceptions] per dimension and key of one validation file record"""
+    contribution = {dimension: {} for dimension in DIMENSIONS}
+    for result in file_info['data'].get('results', []):
+        expectation_config = result.get('expectation_config', {})
+        column = expectation_config.get('kwargs', {}).get('column', 'table-level')
+        success = bool(result.get('success', False))
+        raised = bool(result.get('exception_info', {}).get('raised_exception', False))
+        keys = {
+            'suite': file_info['suite_name'],
+            'type': expectation_config.get('expectation_type', ''),
+            'asset': file_info['data_asset'],
+        }
+        if column != 'table-level':
+            keys['column'] = str(column)
+        for dimension, key in keys.items():
+            counts = contribution[dimension].setdefault(key, [0, 0, 0])
+            counts[0] += 1
+            counts[1] += success
+            counts[2] += raised
+    return contribution
+
+
+class DailyQualityRollups:
+    """Per-day suite / type / column / asset rollups, updated incrementally from validation files"""
+
+    def __init__(self, path):
+        """
+        Initialize the rollups
+
+        Args:
+            path: JSON file of the persisted rollups (created on the first update)
+        """
+        self.path = Path(path)
+        self.files: Dict[str, Dict] = {}
+        self.days: Dict[str, Dict[str, Dict[str, list]]] = {}
+        self.stats = {}
+        self._read()
+
+    def _read(self):
+        if not self.path.exists():
+            return
+        try:
+            state = json.loads(self.path.read_text())
+            if state.get('version') == ROLLUP_VERSION:
+                self.files, self.days = state['files'], state['days']
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable quality rollups {self.path}: {e}")
+
+    def _write(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': ROLLUP_VERSION, 'files': self.files, 'days': self.days}))
+        os.replace(tmp, self.path)
+
+    def _apply(self, day: str, contribution: Dict[str, Dict[str, list]], sign: int):
+        """Add (sign=1) or subtract (sign=-1) a file contribution to a day rollup"""
+        day_rollup = self.days.setdefault(day, {dimension: {} for dimension in DIMENSIONS})
+        for dimension, keys in contribution.items():
+            rollup = day_rollup[dimension]
+            for key, counts in keys.items():
+                current = rollup.setdefault(key, [0, 0, 0])
+                for i, value in enumerate(counts):
+                    current[i] += sign * value
+                if current[0] <= 0:
+                    del rollup[key]
+        if not any(day_rollup.values()):
+            del self.days[day]
+
+    def update(self, validation_files: Iterable[Dict]) -> Dict:
+        """
+        Bring the rollups in line with the current validation files
+
+        Args:
+            validation_files: Records of every current file, with 'file_hash' (see validation_loader)
+
+        Returns:
+            Update statistics (added, changed, removed, unchanged, undated files)
+        """
+        stats = {'added': 0, 'changed': 0, 'removed': 0, 'unchanged': 0, 'undated': 0}
+        current = set()
+        for file_info in validation_files:
+            file_path = file_info['file_path']
+            current.add(file_path)
+            old = self.files.get(file_path)
+            if old is not None and old['hash'] == file_info.get('file_hash'):
+                stats['unchanged'] += 1
+                continue
+            if old is not None:
+                self._apply(old['day'], old['rollup'], -1)
+            day = validation_day(file_info['timestamp'])
+            if day is None:
+                logger.warning(f"No validation day for {file_path} ({file_info['timestamp']!r}), not in rollups")
+                self.files.pop(file_path, None)
+                stats['undated'] += 1
+                continue
+            contribution = file_contribution(file_info)
+            self._apply(day, contribution, 1)
+            self.files[file_path] = {'hash': file_info.get('file_hash'), 'day': day, 'rollup': contribution}
+            stats['changed' if old is not None else 'added'] += 1
+
+        for file_path in [file_path for file_path in self.files if file_path not in current]:
+            old = self.files.pop(file_path)
+            self._apply(old['day'], old['rollup'], -1)
+            stats['removed'] += 1
+
+        if stats['added'] or stats['changed'] or stats['removed'] or not self.path.exists():
+            self._write()
+        self.stats = stats
+        return stats
+
+    def latest_day(self) -> Optional[str]:
+        """Most recent day with results"""
+        return max(self.days) if self.days else None
+
+    def window(self, days: int, end: Optional[str] = None) -> Dict:
+        """
+        Merge the day rollups of a trailing window
+
+        Args:
+            days: Window length in days, including the end day
+            end: Last day of the window (YYYY-MM-DD, defaults to the latest day with results)
+
+        Returns:
+            Totals and success / exception rates of the window, with suite / type / column /
+            asset frames in the layout of the pipeline's quality metrics
+        """
+        end = end or self.latest_day() or date.today().isoformat()
+        start = (date.fromisoformat(end) - timedelta(days=days - 1)).isoformat()
+        merged = {dimension: {} for dimension in DIMENSIONS}
+        for day, day_rollup in self.days.items():
+            if start <= day <= end:
+                for dimension, rollup in day_rollup.items():
+                    target = merged[dimension]
+                    for key, counts in rollup.items():
+                        current = target.setdefault(key, [0, 0, 0])
+                        for i, value in enumerate(counts):
+                            current[i] += value
+
+        # Every result belongs to exactly one suite
+        total, successes, exceptions = (sum(counts[i] for counts in merged['suite'].values()) for i in range(3))
+        window = {
+            'days': days,
+            'start': start,
+            'end': end,
+            'total_expectations': total,
+            'successful_expectations': successes,
+            'exceptions': exceptions,
+            'success_rate': successes / total if total else None,
+            'exception_rate': exceptions / total if total else None,
+        }
+        for dimension, metrics_key in DIMENSIONS.items():
+            rows = {key: (t, s, s / t, e) for key, (t, s, e) in sorted(merged[dimension].items())}
+            frame = pd.DataFrame.from_dict(rows, orient='index', columns=_METRIC_COLUMNS).round(3)
+            window[metrics_key] = frame
+        return window
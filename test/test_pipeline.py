@@ -11,13 +11,43 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 
+import numpy as np
+
 # Add the test directory to the path so we can import the pipeline
 sys.path.insert(0, str(Path(__file__).parent))
 
 from data_reporting_pipeline import DataReportingPipeline, ValidationAnalyzer
+from quality_rollups import DIMENSIONS, DailyQualityRollups
+from validation_loader import IncrementalValidationLoader
+from validation_store import LEAN_COLUMNS, ValidationResultStore, columnar_store_available
+
+
+def write_validation_file(path, validation_time, results, suite='orders_suite', asset='orders'):
+    """Write a minimal validation result file; results are (expectation_type, column, success, raised) tuples"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        'meta': {
+            'validation_time': validation_time,
+            'expectation_suite_name': suite,
+            'run_id': {'run_name': validation_time},
+            'active_batch_definition': {'data_asset_name': asset},
+        },
+        'results': [
+            {
+                'success': success,
+                'expectation_config': {'expectation_type': expectation_type, 'kwargs': {'column': column}},
+                'exception_info': {'raised_exception': raised, 'exception_message': 'boom' if raised else ''},
+                'result': {'element_count': 10},
+            }
+            for expectation_type, column, success, raised in results
+        ],
+    }))
 
 
 def test_validation_analyzer():
@@ -135,6 +165,22 @@ def test_quality_metrics():
         print(f"   Suite Metrics: {len(metrics['suite_metrics'])} suites")
         print(f"   Type Metrics: {len(metrics['type_metrics'])} types")
         
+        # Single-pass rollups must match a plain groupby
+        expected = pipeline.df.groupby('expectation_type', observed=True).agg({
+            'success': ['count', 'sum', 'mean'],
+            'exception_raised': 'sum'
+        }).round(3)
+        expected.columns = ['total_expectations', 'successful_expectations', 'success_rate', 'exceptions']
+        if not np.allclose(expected.loc[metrics['type_metrics'].index].to_numpy(dtype=float),
+                           metrics['type_metrics'].to_numpy(dtype=float)):
+            print(f"❌ Type metrics differ from groupby aggregation")
+            return False
+        lowest = pipeline.metrics_engine.lowest('type', 3)
+        if list(lowest.index) != list(metrics['type_metrics'].nsmallest(3, 'success_rate').index):
+            print(f"❌ Lowest success rate ranking differs from nsmallest")
+            return False
+        print(f"✅ Single-pass rollups match groupby aggregation")
+        
         return True
         
     except Exception as e:
@@ -142,6 +188,264 @@ def test_quality_metrics():
         return False
 
 
+def test_daily_rollups():
+    """Test the persisted daily rollups and trailing window metrics"""
+    print("\nTesting Daily Rollups...")
+    
+    try:
+        config = {
+            'validation_path': '../BirdiDQ/gx/uncommitted/validations',
+            'env_path': '/Users/yavin/python_projects/ollama_jupyter/.env',
+            'output_dir': 'test_output'
+        }
+        
+        pipeline = DataReportingPipeline(config)
+        
+        # Load and process data
+        pipeline.load_validation_files()
+        pipeline.process_validation_results()
+        pipeline.calculate_quality_metrics()
+        
+        # Update rollups and merge windows
+        pipeline.update_quality_rollups()
+        windows = pipeline.calculate_windowed_metrics([7, 30, 90, 100000])
+        
+        print(f"✅ Daily rollups updated")
+        print(f"   Days: {len(pipeline.rollups.days)}")
+        for days, window in windows.items():
+            print(f"   Last {days} days: {window['total_expectations']} expectations")
+        
+        # A window covering every day must match the full history
+        everything = windows[100000]
+        if (everything['total_expectations'] != len(pipeline.df)
+                or everything['exceptions'] != pipeline.quality_metrics['exception_count']):
+            print(f"❌ Full-history window differs from the quality metrics")
+            return False
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Daily rollups test failed: {e}")
+        return False
+
+
+def test_incremental_loader():
+    """Test the loader manifest with new, changed, touched, removed and corrupt files"""
+    print("\nTesting Incremental Loader...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            validations = Path(tmp) / 'validations'
+            a, b, c, d = (validations / f"{name}.json" for name in 'abcd')
+            write_validation_file(a, '20251005T180117.592126Z', [('expect_column_values_to_not_be_null', 'id', True, False)])
+            write_validation_file(b, '20251006T090000.000000Z', [('expect_column_values_to_be_unique', 'id', False, False)])
+            c.write_text('{"meta": {')
+            loader = IncrementalValidationLoader(validations, cache_dir=Path(tmp) / 'cache')
+            
+            # First run: everything is new, the corrupt file is reported and left out
+            records = loader.load()
+            stats = loader.stats
+            if (len(records) != 2 or stats['new'] != 2 or stats['errors'] != 1
+                    or any(record['file_path'] == str(c) for record in records)):
+                print(f"❌ Unexpected first load: {stats}")
+                return False
+            
+            # Touched (same content, new mtime), changed and new files
+            mtime_ns = a.stat().st_mtime_ns + 10**9
+            os.utime(a, ns=(mtime_ns, mtime_ns))
+            write_validation_file(b, '20251006T090000.000000Z', [('expect_column_values_to_be_unique', 'id', False, False),
+                                                                  ('expect_column_to_exist', 'id', True, False)])
+            write_validation_file(d, '20251007T090000.000000Z', [('expect_column_to_exist', 'amount', True, False)])
+            records = {record['file_path']: record for record in loader.load()}
+            stats = loader.stats
+            if (stats['touched'] != 1 or stats['changed'] != 1 or stats['new'] != 1 or stats['parsed'] != 2
+                    or stats['unchanged'] != 1 or stats['errors'] != 1
+                    or sorted(loader.changed_files) != sorted([str(b), str(d)])
+                    or len(records[str(b)]['data']['results']) != 2):
+                print(f"❌ Unexpected second load: {stats}")
+                return False
+            
+            # Removed file, corrupt file repaired
+            d.unlink()
+            write_validation_file(c, '20251004T090000.000000Z', [('expect_column_to_exist', 'id', True, False)])
+            records = loader.load()
+            stats = loader.stats
+            if (stats['removed'] != 1 or loader.removed_files != [str(d)] or stats['new'] != 1
+                    or stats['errors'] != 0 or sorted(record['file_path'] for record in records) != sorted([str(a), str(b), str(c)])):
+                print(f"❌ Unexpected third load: {stats}")
+                return False
+            
+            # Nothing changed: everything comes from the cache
+            loader.load()
+            if loader.stats['parsed'] != 0 or loader.stats['unchanged'] != 3:
+                print(f"❌ Unchanged files were parsed again: {loader.stats}")
+                return False
+        
+        print(f"✅ Incremental loader handles new, changed, touched, removed and corrupt files")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Incremental loader test failed: {e}")
+        return False
+
+
+def _store_rows(store):
+    """Sorted (file, type, column, success) rows of a columnar store"""
+    df = store.read(LEAN_COLUMNS)
+    return sorted(map(tuple, df[['file_path', 'expectation_type', 'column', 'success']].astype(str).values.tolist()))
+
+
+def test_validation_store():
+    """Test stale-row handling and compaction of the columnar store"""
+    print("\nTesting Columnar Store...")
+    
+    if not columnar_store_available():
+        print("⚠️  pyarrow is not installed, skipping the columnar store test")
+        return True
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            validations = Path(tmp) / 'validations'
+            a, b = validations / 'a.json', validations / 'b.json'
+            write_validation_file(a, '20251005T180117.592126Z', [('expect_column_values_to_not_be_null', 'id', True, False),
+                                                                  ('expect_column_to_exist', 'amount', True, False)])
+            write_validation_file(b, '20251006T090000.000000Z', [('expect_column_values_to_be_unique', 'id', False, False)])
+            loader = IncrementalValidationLoader(validations, cache_dir=Path(tmp) / 'cache', include_blobs=False)
+            # Never compact on sync, so reads have to skip the stale rows
+            store = ValidationResultStore(Path(tmp) / 'store', compact_stale_ratio=1.0)
+            
+            def sync():
+                hashes = {record['file_path']: record['file_hash'] for record in loader.load()}
+                missing = store.missing_files(hashes)
+                store.sync(hashes, [loader.fresh_records[file_path] for file_path in missing])
+            
+            sync()
+            if len(_store_rows(store)) != 3:
+                print(f"❌ Expected 3 rows after the first sync, got {_store_rows(store)}")
+                return False
+            
+            # A changed file's rows are replaced, not added to
+            write_validation_file(b, '20251006T090000.000000Z', [('expect_column_values_to_be_in_set', 'status', True, False),
+                                                                  ('expect_column_to_exist', 'status', True, False)])
+            sync()
+            rows = _store_rows(store)
+            b_types = sorted(row[1] for row in rows if row[0] == str(b))
+            if len(rows) != 4 or b_types != ['expect_column_to_exist', 'expect_column_values_to_be_in_set']:
+                print(f"❌ Changed file rows were not replaced: {rows}")
+                return False
+            if len(store.index['parts']) != 2:
+                print(f"❌ Expected the stale part to be kept until compaction: {list(store.index['parts'])}")
+                return False
+            
+            # Compaction keeps exactly the live rows, also when the store is opened again
+            store.compact()
+            if len(store.index['parts']) != 1 or _store_rows(store) != rows:
+                print(f"❌ Rows changed by compaction: {_store_rows(store)}")
+                return False
+            if _store_rows(ValidationResultStore(Path(tmp) / 'store')) != rows:
+                print(f"❌ Reopened store differs after compaction")
+                return False
+            
+            # Removed files disappear from reads
+            a.unlink()
+            sync()
+            if [row[0] for row in _store_rows(store)] != [str(b), str(b)]:
+                print(f"❌ Removed file still in the store: {_store_rows(store)}")
+                return False
+        
+        print(f"✅ Columnar store replaces changed rows and reads correctly after compaction")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Columnar store test failed: {e}")
+        return False
+
+
+def _rollups_match_scratch(rollups, records, scratch_path):
+    """Whether every day's window of incrementally updated rollups equals a rebuild from scratch"""
+    Path(scratch_path).unlink(missing_ok=True)
+    scratch = DailyQualityRollups(scratch_path)
+    scratch.update(records)
+    if sorted(rollups.days) != sorted(scratch.days):
+        print(f"❌ Days differ: {sorted(rollups.days)} vs {sorted(scratch.days)} from scratch")
+        return False
+    for day in scratch.days:
+        incremental, rebuilt = rollups.window(1, end=day), scratch.window(1, end=day)
+        for key in ['total_expectations', 'successful_expectations', 'exceptions']:
+            if incremental[key] != rebuilt[key]:
+                print(f"❌ {day} {key}: {incremental[key]} vs {rebuilt[key]} from scratch")
+                return False
+        for metrics_key in DIMENSIONS.values():
+            if not incremental[metrics_key].equals(rebuilt[metrics_key]):
+                print(f"❌ {day} {metrics_key} differs from scratch")
+                return False
+    return True
+
+
+def test_late_rollups():
+    """Test that daily rollups stay correct with late, changed and removed validation files"""
+    print("\nTesting Rollups with Late Files...")
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            validations = Path(tmp) / 'validations'
+            loader = IncrementalValidationLoader(validations, cache_dir=Path(tmp) / 'cache')
+            rollups = DailyQualityRollups(Path(tmp) / 'rollups.json')
+            scratch_path = Path(tmp) / 'scratch.json'
+            
+            write_validation_file(validations / 'a.json', '20251005T180117.592126Z',
+                                  [('expect_column_values_to_not_be_null', 'id', True, False),
+                                   ('expect_column_mean_to_be_between', 'amount', False, True)])
+            write_validation_file(validations / 'b.json', '20251006T090000.000000Z',
+                                  [('expect_column_values_to_be_unique', 'id', False, False)])
+            records = loader.load()
+            rollups.update(records)
+            if not _rollups_match_scratch(rollups, records, scratch_path):
+                return False
+            
+            # A late file for an older day lands in that day
+            write_validation_file(validations / 'late.json', '20251001T120000.000000Z',
+                                  [('expect_column_values_to_be_unique', 'id', True, False)], suite='late_suite')
+            records = loader.load()
+            stats = rollups.update(records)
+            if stats['added'] != 1 or '2025-10-01' not in rollups.days:
+                print(f"❌ Late file not added to its day: {stats}, days {sorted(rollups.days)}")
+                return False
+            if not _rollups_match_scratch(rollups, records, scratch_path):
+                return False
+            
+            # Changed content replaces the file's old contribution
+            write_validation_file(validations / 'b.json', '20251006T090000.000000Z',
+                                  [('expect_column_values_to_be_unique', 'id', True, False),
+                                   ('expect_column_to_exist', 'status', True, False)])
+            records = loader.load()
+            stats = rollups.update(records)
+            if stats['changed'] != 1 or not _rollups_match_scratch(rollups, records, scratch_path):
+                print(f"❌ Changed file not reflected: {stats}")
+                return False
+            
+            # A removed file's day disappears
+            (validations / 'a.json').unlink()
+            records = loader.load()
+            stats = rollups.update(records)
+            if stats['removed'] != 1 or '2025-10-05' in rollups.days:
+                print(f"❌ Removed file still counted: {stats}, days {sorted(rollups.days)}")
+                return False
+            if not _rollups_match_scratch(rollups, records, scratch_path):
+                return False
+            
+            # The persisted rollups read back the same
+            if not _rollups_match_scratch(DailyQualityRollups(Path(tmp) / 'rollups.json'), records, scratch_path):
+                return False
+        
+        print(f"✅ Daily rollups match a rebuild after late, changed and removed files")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Late rollups test failed: {e}")
+        return False
+
+
 def test_ai_insights():
     """Test AI insights generation"""
     print("\nTesting AI Insights...")
@@ -280,7 +584,7 @@ def main():
     parser = argparse.ArgumentParser(description='Test the Data Reporting Pipeline')
     parser.add_argument('--config', type=str, help='Configuration file path')
     parser.add_argument('--test', type=str, choices=[
-        'analyzer', 'init', 'loading', 'metrics', 'ai', 'catalog', 'report', 'full', 'all'
+        'analyzer', 'init', 'loading', 'loader', 'store', 'metrics', 'rollups', 'ai', 'catalog', 'report', 'full', 'all'
     ], default='all', help='Specific test to run')
     
     args = parser.parse_args()
@@ -300,9 +604,19 @@ def main():
     if args.test in ['loading', 'all']:
         tests.append(('Data Loading', test_data_loading))
     
+    if args.test in ['loader', 'all']:
+        tests.append(('Incremental Loader', test_incremental_loader))
+    
+    if args.test in ['store', 'all']:
+        tests.append(('Columnar Store', test_validation_store))
+    
     if args.test in ['metrics', 'all']:
         tests.append(('Quality Metrics', test_quality_metrics))
     
+    if args.test in ['rollups', 'all']:
+        tests.append(('Daily Rollups', test_daily_rollups))
+        tests.append(('Rollups with Late Files', test_late_rollups))
+    
     if args.test in ['ai', 'all']:
         tests.append(('AI Insights', test_ai_insights))
     
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Parallel, incremental loader for Great Expectations validation result files
+
+Used by DataReportingPipeline.load_validation_files. Files are parsed in a process
+pool (with orjson when installed) and reduced to the fields the report needs. An
+on-disk manifest (path, mtime, size, content hash) and the reduced records are kept
+in the cache directory, so later runs only parse files that are new or changed.
+Touched-but-identical files (new mtime, same hash) are not parsed again either.
+
+With include_blobs=False the nested `result` / expectation `meta` objects are left
+out of the returned and cached records (the columnar store keeps them on disk);
+the full records of the files parsed in this run are kept in `fresh_records`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Bump when the record layout changes so old caches are rebuilt
+CACHE_VERSION = 2
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def content_hash(raw: bytes) -> str:
+    """Hash of a file's content, used to detect real changes behind a new mtime"""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def lean_validation_record(file_path: str, data: Dict) -> Dict:
+    """Reduce a validation result to the fields used by the reporting pipeline (same layout as the file)"""
+    meta = data.get('meta', {})
+    batch_def = meta.get('active_batch_definition', {})
+    batch_spec = meta.get('batch_spec', {})
+
+    results = []
+    for result in data.get('results', []):
+        expectation_config = result.get('expectation_config', {})
+        kwargs = expectation_config.get('kwargs', {})
+        exception_info = result.get('exception_info', {})
+        results.append({
+            'success': result.get('success', False),
+            'expectation_config': {
+                'expectation_type': expectation_config.get('expectation_type', ''),
+                'kwargs': {'column': kwargs['column']} if 'column' in kwargs else {},
+                'meta': expectation_config.get('meta', {}),
+            },
+            'exception_info': {
+                'raised_exception': exception_info.get('raised_exception', False),
+                'exception_message': exception_info.get('exception_message', ''),
+            },
+            'result': result.get('result', {}),
+        })
+
+    lean_data = {
+        'meta': {
+            'validation_time': meta.get('validation_time', ''),
+            'expectation_suite_name': meta.get('expectation_suite_name', ''),
+            'run_id': {'run_name': meta.get('run_id', {}).get('run_name', '')},
+            'active_batch_definition': {
+                key: batch_def[key] for key in ('data_asset_name', 'datasource_name', 'data_connector_name')
+                if key in batch_def
+            },
+            'batch_spec': {key: batch_spec[key] for key in ('type', 'table_name', 'schema_name') if key in batch_spec},
+        },
+        'results': results,
+    }
+    return {
+        'file_path': file_path,
+        'data': lean_data,
+        'timestamp': lean_data['meta']['validation_time'],
+        'suite_name': lean_data['meta']['expectation_suite_name'],
+        'run_id': lean_data['meta']['run_id']['run_name'],
+        'data_asset': batch_def.get('data_asset_name', ''),
+    }
+
+
+def strip_blobs(record: Dict) -> Dict:
+    """Copy of a record without the nested result and expectation meta objects"""
+    data = record['data']
+    results = [
+        {
+            'success': result['success'],
+            'expectation_config': {key: value for key, value in result['expectation_config'].items() if key != 'meta'},
+            'exception_info': result['exception_info'],
+        }
+        for result in data['results']
+    ]
+    return {**record, 'data': {**data, 'results': results}}
+
+
+def _parse_file(task: Tuple[str, Optional[str]]) -> Tuple[str, Optional[str], Optional[Dict], Optional[str]]:
+    """
+    Worker: hash and parse one file
+
+    Returns (path, hash, record, error); record is None when the hash equals the known one
+    """
+    file_path, known_hash = task
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        file_hash = content_hash(raw)
+        if file_hash == known_hash:
+            return file_path, file_hash, None, None
+        return file_path, file_hash, lean_validation_record(file_path, _loads(raw)), None
+    except Exception as e:
+        return file_path, None, None, str(e)
+
+
+class IncrementalValidationLoader:
+    """Loads validation result files, parsing only new or changed files since the last run"""
+
+    def __init__(self, validation_path, cache_dir=None, max_workers: Optional[int] = None,
+                 parallel_threshold: int = 256, include_blobs: bool = True):
+        """
+        Initialize the loader
+
+        Args:
+            validation_path: Directory searched recursively for *.json validation results
+            cache_dir: Directory of the manifest and cached records (None disables the cache)
+            max_workers: Parser processes (None uses the CPU count)
+            parallel_threshold: Below this many files to parse, parse in-process (pool start-up costs more)
+            include_blobs: Keep the nested result / expectation meta objects in the returned records
+        """
+        self.validation_path = Path(validation_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
+        self.include_blobs = include_blobs
+        self.stats = {}
+        self.fresh_records: Dict[str, Dict] = {}
+        self.changed_files: List[str] = []
+        self.removed_files: List[str] = []
+
+    @property
+    def _manifest_path(self) -> Optional[Path]:
+        return self.cache_dir / 'manifest.json' if self.cache_dir else None
+
+    @property
+    def _records_path(self) -> Optional[Path]:
+        return self.cache_dir / 'records.pkl' if self.cache_dir else None
+
+    def _read_cache(self) -> Tuple[Dict, Dict]:
+        """Return (manifest entries, records) of the last run, empty when missing or outdated"""
+        if not self.cache_dir or not self._manifest_path.exists() or not self._records_path.exists():
+            return {}, {}
+        try:
+            manifest = json.loads(self._manifest_path.read_text())
+            if (manifest.get('version') != CACHE_VERSION
+                    or manifest.get('validation_path') != str(self.validation_path)
+                    or manifest.get('include_blobs') != self.include_blobs):
+                return {}, {}
+            with open(self._records_path, 'rb') as f:
+                records = pickle.load(f)
+            return manifest.get('files', {}), records
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable validation cache in {self.cache_dir}: {e}")
+            return {}, {}
+
+    def _write_cache(self, entries: Dict, records: Dict):
+        """Persist the manifest and records (written to temporary files first, then renamed)"""
+        if not self.cache_dir:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        records_tmp = self._records_path.with_suffix('.tmp')
+        with open(records_tmp, 'wb') as f:
+            pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(records_tmp, self._records_path)
+        manifest_tmp = self._manifest_path.with_suffix('.tmp')
+        manifest_tmp.write_text(json.dumps({
+            'version': CACHE_VERSION,
+            'validation_path': str(self.validation_path),
+            'include_blobs': self.include_blobs,
+            'files': entries,
+        }))
+        os.replace(manifest_tmp, self._manifest_path)
+
+    def _parse(self, tasks: List[Tuple[str, Optional[str]]]):
+        workers = self.max_workers or os.cpu_count() or 1
+        if len(tasks) < self.parallel_threshold or workers <= 1:
+            return [_parse_file(task) for task in tasks]
+        chunksize = max(1, min(256, len(tasks) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_file, tasks, chunksize=chunksize))
+
+    def load(self) -> List[Dict]:
+        """Return one record per validation file (same layout as the pipeline's file_info dicts)"""
+        old_entries, old_records = self._read_cache()
+
+        current = {}
+        for json_file in self.validation_path.rglob("*.json"):
+            try:
+                stat = json_file.stat()
+            except OSError as e:
+                logger.error(f"Error loading {json_file}: {e}")
+                continue
+            current[str(json_file)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+        entries, records, tasks = {}, {}, []
+        for file_path, entry in current.items():
+            old = old_entries.get(file_path)
+            if (old and old_records.get(file_path) is not None
+                    and old['mtime_ns'] == entry['mtime_ns'] and old['size'] == entry['size']):
+                entries[file_path] = old
+                records[file_path] = old_records[file_path]
+                continue
+            # Size changes always mean new content, otherwise compare hashes in the worker
+            known_hash = old['hash'] if old and old['size'] == entry['size'] and file_path in old_records else None
+            tasks.append((file_path, known_hash))
+
+        changed, errors, touched = [], 0, 0
+        self.fresh_records = {}
+        for file_path, file_hash, record, error in self._parse(tasks):
+            if error is not None:
+                errors += 1
+                logger.error(f"Error loading {file_path}: {error}")
+                continue
+            entries[file_path] = {**current[file_path], 'hash': file_hash}
+            if record is None:
+                touched += 1
+                records[file_path] = old_records[file_path]
+            else:
+                changed.append(file_path)
+                record['file_hash'] = file_hash
+                self.fresh_records[file_path] = record
+                records[file_path] = record if self.include_blobs else strip_blobs(record)
+
+        self.changed_files = changed
+        self.removed_files = [file_path for file_path in old_entries if file_path not in current]
+        self.stats = {
+            'total': len(records),
+            'parsed': len(changed),
+            'new': sum(file_path not in old_entries for file_path in changed),
+            'changed': sum(file_path in old_entries for file_path in changed),
+            'unchanged': len(records) - len(changed),
+            'touched': touched,
+            'removed': len(self.removed_files),
+            'errors': errors,
+        }
+        if self.cache_dir and (changed or self.removed_files or touched or not self._manifest_path.exists()):
+            self._write_cache(entries, records)
+
+        # Keep the directory walk order
+        return [records[file_path] for file_path in current if file_path in records]
+
+    def parse_full(self, file_paths: List[str]) -> List[Dict]:
+        """Parse files again with their nested objects (e.g. to rebuild the columnar store), bypassing the cache"""
+        records = []
+        for file_path, file_hash, record, error in self._parse([(file_path, None) for file_path in file_paths]):
+            if error is not None:
+                logger.error(f"Error loading {file_path}: {error}")
+                continue
+            record['file_hash'] = file_hash
+            records.append(record)
+        return records
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Columnar store of processed validation results (Parquet, requires pyarrow)
+
+One row per expectation result. Suite, expectation type, column, data asset and
+file path are dictionary encoded (pandas categoricals when read back), the nested
+`result` and expectation `meta` objects are kept as JSON text columns that are only
+read when a report asks for them (column projection).
+
+Each sync appends one Parquet part with the rows of new or changed validation files.
+index.json records the current content hash of every file and which files each part
+holds; rows of changed or removed files stay in their old part but are skipped on
+read, and parts are compacted once enough rows are stale.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# Columns used by the metrics and report generators
+LEAN_COLUMNS = ['file_path', 'timestamp', 'suite_name', 'run_id', 'data_asset', 'expectation_type',
+                'column', 'success', 'exception_raised', 'exception_message']
+# Nested objects stored as JSON text
+BLOB_COLUMNS = ['result', 'meta']
+_CATEGORICAL_COLUMNS = ['file_path', 'suite_name', 'data_asset', 'expectation_type', 'column']
+
+
+def columnar_store_available() -> bool:
+    """Whether pyarrow is installed"""
+    return pa is not None
+
+
+def _schema():
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ('file_path', dictionary),
+        ('file_hash', pa.string()),
+        ('timestamp', pa.string()),
+        ('suite_name', dictionary),
+        ('run_id', pa.string()),
+        ('data_asset', dictionary),
+        ('expectation_type', dictionary),
+        ('column', dictionary),
+        ('success', pa.bool_()),
+        ('exception_raised', pa.bool_()),
+        ('exception_message', pa.string()),
+        ('result', pa.string()),
+        ('meta', pa.string()),
+    ])
+
+
+def _rows_table(records: Iterable[Dict]):
+    """Flatten full validation records (see validation_loader) into an Arrow table"""
+    columns = {name: [] for name in _schema().names}
+    for record in records:
+        for result in record['data'].get('results', []):
+            expectation_config = result.get('expectation_config', {})
+            exception_info = result.get('exception_info', {})
+            columns['file_path'].append(record['file_path'])
+            columns['file_hash'].append(record.get('file_hash'))
+            columns['timestamp'].append(record['timestamp'])
+            columns['suite_name'].append(record['suite_name'])
+            columns['run_id'].append(record['run_id'])
+            columns['data_asset'].append(record['data_asset'])
+            columns['expectation_type'].append(expectation_config.get('expectation_type', ''))
+            columns['column'].append(str(expectation_config.get('kwargs', {}).get('column', 'table-level')))
+            columns['success'].append(bool(result.get('success', False)))
+            columns['exception_raised'].append(bool(exception_info.get('raised_exception', False)))
+            columns['exception_message'].append(exception_info.get('exception_message') or '')
+            columns['result'].append(json.dumps(result.get('result', {}), default=str))
+            columns['meta'].append(json.dumps(expectation_config.get('meta', {}), default=str))
+    return pa.table(columns, schema=_schema())
+
+
+class ValidationResultStore:
+    """Append-only Parquet store of expectation results with per-file invalidation"""
+
+    def __init__(self, store_dir, compact_stale_ratio: float = 0.3, max_parts: int = 32):
+        """
+        Initialize the store
+
+        Args:
+            store_dir: Directory of the Parquet parts and index.json
+            compact_stale_ratio: Rewrite the store once this share of stored rows is stale
+            max_parts: Rewrite the store once it has more parts than this
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required for the columnar validation store")
+        self.store_dir = Path(store_dir)
+        self.compact_stale_ratio = compact_stale_ratio
+        self.max_parts = max_parts
+        self.index = self._read_index()
+
+    @property
+    def _index_path(self) -> Path:
+        return self.store_dir / 'index.json'
+
+    def _read_index(self) -> Dict:
+        if self._index_path.exists():
+            try:
+                index = json.loads(self._index_path.read_text())
+                if all((self.store_dir / part).exists() for part in index.get('parts', {})):
+                    return index
+                logger.warning(f"Columnar store {self.store_dir} is missing parts, rebuilding it")
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable columnar store index {self._index_path}: {e}")
+        return {'files': {}, 'parts': {}}
+
+    def _write_index(self):
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._index_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.index))
+        os.replace(tmp, self._index_path)
+
+    def missing_files(self, file_hashes: Dict[str, str]) -> List[str]:
+        """Files (path -> content hash) whose current rows are not in the store yet"""
+        return [path for path, file_hash in file_hashes.items() if self.index['files'].get(path) != file_hash]
+
+    def sync(self, file_hashes: Dict[str, str], records: Iterable[Dict]) -> int:
+        """
+        Make the store hold exactly the given files
+
+        Args:
+            file_hashes: Content hash of every current validation file
+            records: Full records (with file_hash) of the files returned by missing_files
+
+        Returns:
+            Number of rows appended
+        """
+        records = list(records)
+        appended = 0
+        if records:
+            table = _rows_table(records)
+            part = f"part-{time.time_ns()}.parquet"
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, self.store_dir / part)
+            self.index['parts'][part] = {
+                'files': {record['file_path']: record['file_hash'] for record in records},
+                'rows': table.num_rows,
+            }
+            appended = table.num_rows
+        self.index['files'] = dict(file_hashes)
+
+        # Drop parts without live rows, compact when too much of the store is stale
+        live_rows, total_rows = 0, 0
+        for part, info in list(self.index['parts'].items()):
+            live = self._live_files(info)
+            if not live:
+                (self.store_dir / part).unlink(missing_ok=True)
+                del self.index['parts'][part]
+                continue
+            total_rows += info['rows']
+            live_rows += info['rows'] if len(live) == len(info['files']) else self._count_live_rows(part, live)
+        self._write_index()
+        if total_rows and (1 - live_rows / total_rows > self.compact_stale_ratio
+                           or len(self.index['parts']) > self.max_parts):
+            self.compact()
+        return appended
+
+    def _live_files(self, info: Dict) -> List[str]:
+        files = self.index['files']
+        return [path for path, file_hash in info['files'].items() if files.get(path) == file_hash]
+
+    def _read_part(self, part: str, columns: List[str], live: List[str]):
+        table = pq.read_table(self.store_dir / part, columns=list(dict.fromkeys(columns + ['file_path'])))
+        if len(live) < len(self.index['parts'][part]['files']):
+            paths = pc.cast(table['file_path'], pa.string())
+            table = table.filter(pc.is_in(paths, value_set=pa.array(live, pa.string())))
+        return table
+
+    def _count_live_rows(self, part: str, live: List[str]) -> int:
+        return self._read_part(part, ['file_path'], live).num_rows
+
+    def read_table(self, columns: Optional[List[str]] = None):
+        """Arrow table of the live rows, only the requested columns are read from disk"""
+        columns = list(columns or _schema().names)
+        tables = []
+        for part, info in self.index['parts'].items():
+            live = self._live_files(info)
+            if live:
+                tables.append(self._read_part(part, columns, live).select(columns))
+        if not tables:
+            return _schema().empty_table().select(columns)
+        return pa.concat_tables(tables, promote_options='default').unify_dictionaries().combine_chunks()
+
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        DataFrame of the live rows with categorical suite / type / column / asset / file columns
+
+        Args:
+            columns: Columns to read (defaults to LEAN_COLUMNS, nested objects are only read when asked for)
+        """
+        columns = list(columns or LEAN_COLUMNS)
+        df = self.read_table(columns).to_pandas()
+        for name in _CATEGORICAL_COLUMNS:
+            if name in df.columns:
+                # Dictionaries may still hold values of stale rows; sorted categories keep
+                # groupby output in the same order as with plain strings
+                values = df[name].astype('category').cat.remove_unused_categories()
+                df[name] = values.cat.reorder_categories(sorted(values.cat.categories))
+        for name in BLOB_COLUMNS:
+            if name in df.columns:
+                df[name] = [json.loads(value) if value else {} for value in df[name]]
+        return df
+
+    def compact(self):
+        """Rewrite all live rows into a single part"""
+        table = self.read_table()
+        if not table.num_rows:
+            return
+        part = f"part-{time.time_ns()}.parquet"
+        pq.write_table(table.cast(_schema()), self.store_dir / part)
+        old_parts = list(self.index['parts'])
+        self.index['parts'] = {part: {'files': dict(self.index['files']), 'rows': table.num_rows}}
+        self._write_index()
+        for old_part in old_parts:
+            (self.store_dir / old_part).unlink(missing_ok=True)
+        logger.info(f"Compacted columnar store into {part} ({table.num_rows} rows)")
@@ -3,6 +3,25 @@
 Simple test to verify column name logic without dependencies
 """
 
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent / 'BirdiDQ' / 'great_expectations'))
+
+from helpers.column_resolver import ColumnResolutionError, ColumnResolver, edit_distance, fold_column_name
+
+# Actual Housing DataFrame columns (from the JSON file)
+HOUSING_COLUMNS = [
+    "households",
+    "latitude",
+    "total_bedrooms",
+    "housing_median_age",
+    "total_rooms",
+    "median_house_value",
+    "longitude",
+    "median_income",
+    "population"
+]
+
 def test_column_name_mapping():
     """Test the column name mapping logic"""
     
@@ -10,17 +29,7 @@ def test_column_name_mapping():
     print("=" * 50)
     
     # Simulate the actual Housing DataFrame columns (from the JSON file)
-    actual_columns = [
-        "households",
-        "latitude", 
-        "total_bedrooms",
-        "housing_median_age",  # This is the correct column name
-        "total_rooms",
-        "median_house_value",
-        "longitude",
-        "median_income",
-        "population"
-    ]
+    actual_columns = HOUSING_COLUMNS
     
     print(f"📊 Actual DataFrame columns: {actual_columns}")
     
@@ -52,6 +61,63 @@ def test_column_name_mapping():
     
     return True
 
+class GeneratedLine():
+    """Parsed expectation line as produced by helpers.expectation_parser"""
+    def __init__(self, line, expectation_type, kwargs):
+        self.line = line
+        self.expectation_type = expectation_type
+        self.kwargs = kwargs
+
+def test_column_resolver():
+    """Test that generated column names are resolved against the real schema before execution"""
+    
+    print("\n🧪 Testing Column Name Resolver")
+    print("=" * 50)
+    
+    assert fold_column_name("Housing Median-Age") == fold_column_name("housing_median_age")
+    assert edit_distance("populaton", "population", 2) == 1
+    assert edit_distance("latitude", "longitude", 2) == 3
+    
+    resolver = ColumnResolver(HOUSING_COLUMNS)
+    cases = {
+        "housing_median_age": ("housing_median_age", "exact"),
+        "housing median age": ("housing_median_age", "normalized"),
+        "Median House Value": ("median_house_value", "normalized"),
+        "populaton": ("population", "fuzzy"),
+        "total_bedroom": ("total_bedrooms", "fuzzy"),
+    }
+    for name, expected in cases.items():
+        assert resolver.resolve(name) == expected, (name, resolver.resolve(name))
+        print(f"   '{name}' -> {expected}")
+    
+    for name in ["ocean_proximity", "total"]:
+        try:
+            resolver.resolve(name)
+            raise AssertionError(f"'{name}' should not resolve")
+        except ColumnResolutionError as e:
+            print(f"   '{name}' rejected: {e}")
+    
+    # Two columns at the same distance are ambiguous rather than guessed
+    try:
+        ColumnResolver(["total_rooms", "total_rooma"]).resolve("total_roomz")
+        raise AssertionError("ambiguous name should not resolve")
+    except ColumnResolutionError:
+        pass
+    
+    # The incorrect generated line from test_column_name_mapping is fixed before it runs
+    line = 'validator.expect_column_values_to_be_between(column="housing median age", min_value=6, strict_min=True)'
+    parsed = GeneratedLine(line, "expect_column_values_to_be_between",
+                           {"column": "housing median age", "min_value": 6, "strict_min": True})
+    resolved, rewrites = resolver.resolve_expectation(parsed)
+    assert resolved.kwargs["column"] == "housing_median_age"
+    assert resolved.line == line.replace("housing median age", "housing_median_age")
+    assert parsed.kwargs["column"] == "housing median age"
+    assert rewrites == [{"from": "housing median age", "to": "housing_median_age", "method": "normalized"}]
+    print(f"\n✅ Resolved line: {resolved.line}")
+    
+    return True
+
 if __name__ == "__main__":
     test_column_name_mapping()
+    test_column_resolver()
     print(f"\n🎉 Column name mapping test completed!")